@@ -1,18 +1,50 @@
 """Command Line Interface for AgentKit."""
 
+import asyncio
+import functools
+import logging
 import typer
 import sys
 import json
 from pathlib import Path
-from typing import Optional, Dict, Any
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
+from typing import Optional, Dict, Any, List, TYPE_CHECKING
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .core.logger import get_logger
-from .core.schema import load_and_validate_config, ConfigValidationError
-from .core.model_interface import get_model_provider, ModelError
-from .core.tool_executor import ToolExecutor
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.panel import Panel
+    from .core.model_interface import ModelProvider
+
+# Heavy dependencies (rich panels, schema validation, model SDKs, tools) are
+# imported inside the command handlers so `version` and `--help` stay fast.
+
+# Command parameters
+_ARG_CONFIG_PATH = typer.Argument(..., help="Path to the agent YAML configuration file")
+_OPT_INPUT = typer.Option(..., "--input", "-i", help="Input query for the agent")
+_OPT_FORMAT = typer.Option("text", "--format", "-f", help="Output format: text or json")
+_OPT_MAX_TOKENS = typer.Option(1024, "--max-tokens", help="Maximum tokens to generate")
+_OPT_PROVIDER = typer.Option(None, "--provider", "-p", help="Override model provider (anthropic, bedrock, or goose)")
+_OPT_MODEL = typer.Option(None, "--model", "-m", help="Override model name")
+_OPT_REGION = typer.Option(None, "--region", help="AWS region for bedrock provider")
+_OPT_TOOLS = typer.Option(None, "--tools", help="Override agent tools (comma-separated list)")
+_OPT_VERBOSE = typer.Option(False, "--verbose", "-v", help="Enable verbose logging")
+_OPT_DEBUG = typer.Option(False, "--debug", "-d", help="Enable debug logging")
+_OPT_LIST_VERBOSE = typer.Option(False, "--verbose", "-v", help="Show detailed tool information")
+
+# Static panel headers
+_GENERATING_HEADER = "[cyan]Generating response...[/cyan]"
+_UNEXPECTED_ERROR_HEADER = "[bold red]Unexpected Error[/bold red]"
+_MODEL_ERROR_HEADER = "[bold red]Model Error[/bold red]"
+_INVALID_TOOLS_HEADER = "[bold red]Invalid Tools[/bold red]"
+_AVAILABLE_TOOLS_HEADER = "[bold green]Available Tools[/bold green]"
+_LIST_TOOLS_HINT = "[yellow]Use 'agentkit list-tools' to see available tools.[/yellow]"
 
 app = typer.Typer(
     name="agentkit",
@@ -20,8 +52,26 @@ app = typer.Typer(
     no_args_is_help=True,
 )
 
-console = Console()
-logger = get_logger(__name__)
+
+@functools.cache
+def _console() -> "Console":
+    """Get the shared Rich console, creating it on first use.
+    
+    Returns:
+        Console instance used for all CLI output
+    """
+    from rich.console import Console
+    return Console()
+
+
+@functools.cache
+def _logger() -> logging.Logger:
+    """Get the CLI logger, configuring it on first use.
+    
+    Returns:
+        Logger instance for the CLI module
+    """
+    return get_logger(__name__)
 
 
 def _format_tool_parameters(schema: Dict[str, Any]) -> str:
@@ -61,36 +111,126 @@ def _format_tool_parameters(schema: Dict[str, Any]) -> str:
     return "\n".join(params)
 
 
+def _write_json(data: Dict[str, Any]) -> None:
+    """Write data to stdout as indented JSON.
+    
+    Uses orjson when installed, falling back to the standard library.
+    
+    Args:
+        data: JSON-serializable data to write
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if ORJSON_AVAILABLE and buffer is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        sys.stdout.flush()
+        buffer.write(payload + b"\n")
+        buffer.flush()
+    else:
+        sys.stdout.write(json.dumps(data, indent=2))
+        sys.stdout.write("\n")
+
+
+def _response_panel(agent_name: str, response: str) -> "Panel":
+    """Build the panel that displays an agent response.
+    
+    Args:
+        agent_name: Name of the agent shown in the panel header
+        response: Response text (displayed verbatim, never parsed as markup)
+        
+    Returns:
+        Rich panel for the response
+    """
+    from rich.panel import Panel
+    from rich.text import Text
+    
+    # Build the body as Text so the model response is never parsed as markup
+    response_text = Text()
+    response_text.append(f"Response from {agent_name}", style="bold green")
+    response_text.append("\n\n")
+    response_text.append(response)
+    
+    return Panel.fit(
+        response_text,
+        title="💭 Agent Response",
+        border_style="green"
+    )
+
+
+def _stream_response(
+    model_provider: "ModelProvider",
+    agent_name: str,
+    system_prompt: str,
+    task_prompt: str,
+    max_tokens: int
+) -> str:
+    """Stream a model response into a live-updating response panel.
+    
+    Args:
+        model_provider: Provider used to generate the response
+        agent_name: Name of the agent shown in the panel header
+        system_prompt: System instruction for the model
+        task_prompt: User task/query for the model
+        max_tokens: Maximum tokens to generate
+        
+    Returns:
+        The complete response text
+    """
+    from rich.live import Live
+    
+    chunks: List[str] = []
+    with Live(_response_panel(agent_name, ""), console=_console(), refresh_per_second=8) as live:
+        for chunk in model_provider.generate_stream(
+            system_prompt=system_prompt,
+            task_prompt=task_prompt,
+            max_tokens=max_tokens
+        ):
+            chunks.append(chunk)
+            live.update(_response_panel(agent_name, "".join(chunks)))
+        
+        response = "".join(chunks).strip()
+        live.update(_response_panel(agent_name, response))
+    
+    return response
+
+
 @app.command("run")
 def run_agent(
-    config_path: str = typer.Argument(..., help="Path to the agent YAML configuration file"),
-    input_query: str = typer.Option(..., "--input", "-i", help="Input query for the agent"),
-    output_format: str = typer.Option("text", "--format", "-f", help="Output format: text or json"),
-    max_tokens: int = typer.Option(1024, "--max-tokens", help="Maximum tokens to generate"),
-    provider: Optional[str] = typer.Option(None, "--provider", "-p", help="Override model provider (anthropic, bedrock, or goose)"),
-    model: Optional[str] = typer.Option(None, "--model", "-m", help="Override model name"),
-    region: Optional[str] = typer.Option(None, "--region", help="AWS region for bedrock provider"),
-    tools: Optional[str] = typer.Option(None, "--tools", help="Override agent tools (comma-separated list)"),
-    verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose logging"),
-    debug: bool = typer.Option(False, "--debug", "-d", help="Enable debug logging"),
+    config_path: str = _ARG_CONFIG_PATH,
+    input_query: str = _OPT_INPUT,
+    output_format: str = _OPT_FORMAT,
+    max_tokens: int = _OPT_MAX_TOKENS,
+    provider: Optional[str] = _OPT_PROVIDER,
+    model: Optional[str] = _OPT_MODEL,
+    region: Optional[str] = _OPT_REGION,
+    tools: Optional[str] = _OPT_TOOLS,
+    verbose: bool = _OPT_VERBOSE,
+    debug: bool = _OPT_DEBUG,
 ) -> None:
     """Run an agent with the specified configuration and input query."""
+    from rich.panel import Panel
+    from .core.schema import load_and_validate_config, ConfigValidationError
+    from .core.model_interface import get_model_provider, ModelError
+    from .core.tool_executor import ToolExecutor
+    from .tools import list_tools
+    
+    log_progress = verbose or debug
+    log = _logger()
     
-    if verbose or debug:
-        logger.info(f"Running agent with config: {config_path}")
-        logger.info(f"Input query: {input_query}")
-        logger.info(f"Output format: {output_format}")
-        logger.info(f"Max tokens: {max_tokens}")
+    if log_progress:
+        log.info("Running agent with config: %s", config_path)
+        log.info("Input query: %s", input_query)
+        log.info("Output format: %s", output_format)
+        log.info("Max tokens: %s", max_tokens)
     
     # Load and validate the agent configuration
     try:
         config_data = load_and_validate_config(config_path)
         
-        if verbose or debug:
-            logger.info("Configuration validation successful")
-            logger.info(f"Agent name: {config_data['agent']['name']}")
-            logger.info(f"Model: {config_data['agent']['model']}")
-            logger.info(f"Tools: {config_data['agent'].get('tools', [])}")
+        if log_progress:
+            log.info("Configuration validation successful")
+            log.info("Agent name: %s", config_data['agent']['name'])
+            log.info("Model: %s", config_data['agent']['model'])
+            log.info("Tools: %s", config_data['agent'].get('tools', []))
         
     except ConfigValidationError as e:
         # Display rich error panel and exit
@@ -98,9 +238,12 @@ def run_agent(
         sys.exit(1)
     except Exception as e:
         # Handle unexpected errors
-        console.print(Panel.fit(
-            f"[bold red]Unexpected Error[/bold red]\n\n"
-            f"[red]Failed to load configuration: {str(e)}[/red]",
+        _console().print(Panel.fit(
+            "\n".join([
+                _UNEXPECTED_ERROR_HEADER,
+                "",
+                f"[red]Failed to load configuration: {str(e)}[/red]",
+            ]),
             title="❌ Error",
             border_style="red"
         ))
@@ -115,16 +258,20 @@ def run_agent(
         
         # Override tools if specified via CLI
         if tools:
-            from .tools import has_tool
             tool_names = [name.strip() for name in tools.split(',')]
             
             # Validate that all specified tools exist
-            invalid_tools = [name for name in tool_names if not has_tool(name)]
+            known_tools = set(list_tools())
+            invalid_tools = [name for name in tool_names if name not in known_tools]
             if invalid_tools:
-                console.print(Panel.fit(
-                    f"[bold red]Invalid Tools[/bold red]\n\n"
-                    f"[red]Unknown tools: {', '.join(invalid_tools)}[/red]\n\n"
-                    f"[yellow]Use 'agentkit list-tools' to see available tools.[/yellow]",
+                _console().print(Panel.fit(
+                    "\n".join([
+                        _INVALID_TOOLS_HEADER,
+                        "",
+                        f"[red]Unknown tools: {', '.join(invalid_tools)}[/red]",
+                        "",
+                        _LIST_TOOLS_HINT,
+                    ]),
                     title="❌ Tool Error",
                     border_style="red"
                 ))
@@ -133,8 +280,8 @@ def run_agent(
             # Override tools configuration
             tools_config = [{"name": name, "parameters": {}} for name in tool_names]
             
-            if verbose or debug:
-                logger.info(f"Overriding tools from CLI: {tool_names}")
+            if log_progress:
+                log.info("Overriding tools from CLI: %s", tool_names)
         
         # Create tool executor
         tool_executor = ToolExecutor(tools_config)
@@ -150,23 +297,23 @@ def run_agent(
         region_name = region or agent_config.get('region', 'us-east-1')
         
         # Create model provider
-        if verbose or debug:
+        if log_progress:
             original_model = agent_config['model']
             original_provider = agent_config.get('provider', 'anthropic')
             
             if model != original_model:
-                logger.info(f"Overriding model from '{original_model}' to '{model_name}'")
+                log.info("Overriding model from '%s' to '%s'", original_model, model_name)
             if provider != original_provider:
-                logger.info(f"Overriding provider from '{original_provider}' to '{provider_name}'")
+                log.info("Overriding provider from '%s' to '%s'", original_provider, provider_name)
                 
-            logger.info(f"Creating model provider for {model_name} using {provider_name}")
+            log.info("Creating model provider for %s using %s", model_name, provider_name)
             if provider_name == 'bedrock':
-                logger.info(f"Using AWS region: {region_name}")
+                log.info("Using AWS region: %s", region_name)
             elif provider_name == 'goose':
-                logger.info(f"Using Goose multi-model orchestration")
+                log.info("Using Goose multi-model orchestration")
             if tools_config:
                 tool_names = [t['name'] for t in tools_config]
-                logger.info(f"Available tools: {tool_names}")
+                log.info("Available tools: %s", tool_names)
         
         model_provider = get_model_provider(model_name, provider_name, region_name)
         
@@ -178,32 +325,55 @@ def run_agent(
         elif provider_name == 'goose':
             provider_info += f" (multi-model)"
             
-        console.print(Panel.fit(
-            f"[cyan]Generating response...[/cyan]\n\n"
-            f"[yellow]Agent:[/yellow] {agent_config['name']}\n"
-            f"[yellow]Model:[/yellow] {model_name}\n"
-            f"[yellow]Provider:[/yellow] {provider_info}\n"
-            f"[yellow]Tools:[/yellow] {', '.join(tool_names)}\n"
-            f"[yellow]Max Tokens:[/yellow] {max_tokens}",
+        _console().print(Panel.fit(
+            "\n".join([
+                _GENERATING_HEADER,
+                "",
+                f"[yellow]Agent:[/yellow] {agent_config['name']}",
+                f"[yellow]Model:[/yellow] {model_name}",
+                f"[yellow]Provider:[/yellow] {provider_info}",
+                f"[yellow]Tools:[/yellow] {', '.join(tool_names)}",
+                f"[yellow]Max Tokens:[/yellow] {max_tokens}",
+            ]),
             title="🤖 AgentKit - Processing",
             border_style="cyan"
         ))
         
+        # Stream straight to the terminal when nothing needs the full response first
+        stream_response = output_format.lower() != "json" and not tools_config
+        
         # Generate response
-        response = model_provider.generate(
-            system_prompt=system_prompt,
-            task_prompt=task_prompt,
-            max_tokens=max_tokens
-        )
+        if stream_response:
+            _console().print()
+            response = _stream_response(
+                model_provider,
+                agent_config['name'],
+                system_prompt=system_prompt,
+                task_prompt=task_prompt,
+                max_tokens=max_tokens
+            )
+        else:
+            response = model_provider.generate(
+                system_prompt=system_prompt,
+                task_prompt=task_prompt,
+                max_tokens=max_tokens
+            )
         
         # Process tool calls if tools are available
         tool_results = []
         if tools_config:
-            response, tool_results = tool_executor.process_agent_response(response)
+            response, tool_results = asyncio.run(
+                tool_executor.process_agent_response_async(response)
+            )
             
-            if tool_results and (verbose or debug):
+            if tool_results and log_progress:
                 for i, tool_result in enumerate(tool_results):
-                    logger.info(f"Tool call {i+1}: {tool_result['tool_call']['name']} -> Success: {tool_result['result']['success']}")
+                    log.info(
+                        "Tool call %d: %s -> Success: %s",
+                        i + 1,
+                        tool_result['tool_call']['name'],
+                        tool_result['result']['success']
+                    )
         
         # Format and display the response
         if output_format.lower() == "json":
@@ -222,10 +392,11 @@ def run_agent(
                     "tools_used": len(tool_results)
                 }
             }
-            console.print(json.dumps(output_data, indent=2))
-        else:
+            # Write JSON straight to stdout - no need for Rich markup processing
+            _write_json(output_data)
+        elif not stream_response:
             # Text format with rich formatting
-            console.print()
+            _console().print()
             
             # Show tool usage summary if tools were used
             if tool_results:
@@ -235,93 +406,109 @@ def run_agent(
                     success = "✅" if result['result']['success'] else "❌"
                     tool_summary.append(f"{success} {tool_name}")
                 
-                console.print(Panel.fit(
+                _console().print(Panel.fit(
                     f"[blue]Tools Used:[/blue] {' | '.join(tool_summary)}",
                     title="🔧 Tool Execution",
                     border_style="blue"
                 ))
-                console.print()
+                _console().print()
             
-            console.print(Panel.fit(
-                f"[bold green]Response from {agent_config['name']}[/bold green]\n\n"
-                f"{response}",
-                title="💭 Agent Response",
-                border_style="green"
-            ))
+            _console().print(_response_panel(agent_config['name'], response))
         
-        if verbose or debug:
-            logger.info("Agent response generated successfully")
+        if log_progress:
+            log.info("Agent response generated successfully")
         
     except ModelError as e:
         # Display model-specific error
-        console.print(Panel.fit(
-            f"[bold red]Model Error[/bold red]\n\n"
-            f"[red]{e.message}[/red]",
+        _console().print(Panel.fit(
+            "\n".join([
+                _MODEL_ERROR_HEADER,
+                "",
+                f"[red]{e.message}[/red]",
+            ]),
             title="❌ Model Error",
             border_style="red"
         ))
         sys.exit(1)
     except Exception as e:
         # Handle unexpected errors during generation
-        console.print(Panel.fit(
-            f"[bold red]Unexpected Error[/bold red]\n\n"
-            f"[red]Failed to generate response: {str(e)}[/red]",
+        _console().print(Panel.fit(
+            "\n".join([
+                _UNEXPECTED_ERROR_HEADER,
+                "",
+                f"[red]Failed to generate response: {str(e)}[/red]",
+            ]),
             title="❌ Error",
             border_style="red"
         ))
         if debug:
             import traceback
-            console.print(f"\n[dim]Debug traceback:[/dim]\n{traceback.format_exc()}")
+            _console().print(f"\n[dim]Debug traceback:[/dim]\n{traceback.format_exc()}")
         sys.exit(1)
 
 
 @app.command("list-tools")
 def list_available_tools(
-    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed tool information")
+    verbose: bool = _OPT_LIST_VERBOSE
 ) -> None:
     """List all available tools with their descriptions."""
+    from rich.panel import Panel
     from .tools import get_global_registry
     
     registry = get_global_registry()
     tools_info = registry.get_all_tool_info()
     
     if not tools_info:
-        console.print("[yellow]No tools are currently available.[/yellow]")
+        _console().print("[yellow]No tools are currently available.[/yellow]")
         return
     
     if verbose:
         # Detailed view
         for tool_name, info in sorted(tools_info.items()):
-            console.print(Panel.fit(
-                f"[bold cyan]{info['name']}[/bold cyan]\n\n"
-                f"[yellow]Description:[/yellow] {info['description']}\n\n"
-                f"[yellow]Parameters:[/yellow]\n{_format_tool_parameters(info.get('parameters_schema', {}))}\n",
+            _console().print(Panel.fit(
+                "\n".join([
+                    f"[bold cyan]{info['name']}[/bold cyan]",
+                    "",
+                    f"[yellow]Description:[/yellow] {info['description']}",
+                    "",
+                    "[yellow]Parameters:[/yellow]",
+                    _format_tool_parameters(info.get('parameters_schema', {})),
+                    "",
+                ]),
                 title=f"🔧 {tool_name}",
                 border_style="cyan"
             ))
-            console.print()
+            _console().print()
     else:
         # Simple list view
-        console.print(Panel.fit(
-            "[bold green]Available Tools[/bold green]\n\n" +
-            "\n".join([f"• [cyan]{name}[/cyan]: {info['description']}" 
-                      for name, info in sorted(tools_info.items())]),
+        _console().print(Panel.fit(
+            "\n".join([
+                _AVAILABLE_TOOLS_HEADER,
+                "",
+                *(f"• [cyan]{name}[/cyan]: {info['description']}"
+                  for name, info in sorted(tools_info.items())),
+            ]),
             title="🔧 AgentKit Tools",
             border_style="green"
         ))
         
-        console.print(f"\n[dim]Use --verbose for detailed parameter information[/dim]")
+        _console().print(f"\n[dim]Use --verbose for detailed parameter information[/dim]")
 
 
 @app.command("version")
 def show_version() -> None:
     """Show AgentKit version information."""
     from . import __version__
-    console.print(f"AgentKit v{__version__}")
+    _console().print(f"AgentKit v{__version__}")
 
 
 def main() -> None:
     """Main entry point for the CLI."""
+    # `agentkit version` needs no argument parsing, so skip building the Click command
+    if sys.argv[1:] == ["version"]:
+        show_version()
+        return
+    
     app()
 
 
@@ -1,26 +1,58 @@
 """Core functionality for AgentKit."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .config import Config
 from .logger import get_logger
-from .schema import (
-    load_and_validate_config,
-    validate_config_dict,
-    ConfigValidationError,
-    get_available_models,
-    create_example_config,
-)
-from .model_interface import (
-    ModelProvider,
-    ClaudeProvider,
-    ModelError,
-    get_model_provider,
-    get_supported_models,
-)
+
+if TYPE_CHECKING:
+    from .schema import (
+        load_and_validate_config,
+        clear_config_cache,
+        validate_config_dict,
+        ConfigValidationError,
+        get_available_models,
+        create_example_config,
+    )
+    from .model_interface import (
+        ModelProvider,
+        ClaudeProvider,
+        ModelError,
+        get_model_provider,
+        clear_secret_cache,
+        clear_anthropic_client_cache,
+        get_supported_models,
+    )
+    from .response_cache import ResponseCache, get_response_cache, clear_response_caches
+
+# Schema validation (jsonschema) and the model layer (asyncio, SDK
+# detection) are imported on first access (PEP 562), so importing
+# agentkit for its config or tools does not pay for them
+_LAZY_ATTRIBUTES = {
+    "load_and_validate_config": ".schema",
+    "clear_config_cache": ".schema",
+    "validate_config_dict": ".schema",
+    "ConfigValidationError": ".schema",
+    "get_available_models": ".schema",
+    "create_example_config": ".schema",
+    "ModelProvider": ".model_interface",
+    "ClaudeProvider": ".model_interface",
+    "ModelError": ".model_interface",
+    "get_model_provider": ".model_interface",
+    "clear_secret_cache": ".model_interface",
+    "clear_anthropic_client_cache": ".model_interface",
+    "get_supported_models": ".model_interface",
+    "ResponseCache": ".response_cache",
+    "get_response_cache": ".response_cache",
+    "clear_response_caches": ".response_cache",
+}
 
 __all__ = [
     "Config",
     "get_logger",
     "load_and_validate_config",
+    "clear_config_cache",
     "validate_config_dict", 
     "ConfigValidationError",
     "get_available_models",
@@ -29,5 +61,17 @@ __all__ = [
     "ClaudeProvider",
     "ModelError",
     "get_model_provider",
+    "clear_secret_cache",
+    "clear_anthropic_client_cache",
     "get_supported_models",
-]
\ No newline at end of file
+    "ResponseCache",
+    "get_response_cache",
+    "clear_response_caches",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -2,9 +2,20 @@
 
 import os
 from pathlib import Path
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping, Set
 from dotenv import load_dotenv
 
+# Environment variables holding the API key for each provider
+API_KEY_ENV_VARS: Mapping[str, str] = MappingProxyType({
+    "anthropic": "ANTHROPIC_API_KEY",
+    "openai": "OPENAI_API_KEY",
+    "mistral": "MISTRAL_API_KEY"
+})
+
+# .env files already loaded in this process (None stands for the default lookup)
+_loaded_env_files: Set[Optional[str]] = set()
+
 
 class Config:
     """Configuration manager for AgentKit."""
@@ -12,14 +23,21 @@ class Config:
     def __init__(self, env_file: Optional[Path] = None):
         """Initialize configuration.
         
+        Each .env file is only parsed once per process, so creating
+        several Config instances does not re-read it.
+        
         Args:
             env_file: Optional path to .env file
         """
         if env_file and env_file.exists():
-            load_dotenv(env_file)
-        else:
+            env_key = str(env_file.resolve())
+            if env_key not in _loaded_env_files:
+                load_dotenv(env_file)
+                _loaded_env_files.add(env_key)
+        elif None not in _loaded_env_files:
             # Try to load .env from current directory or parent directories
             load_dotenv()
+            _loaded_env_files.add(None)
     
     def get_api_key(self, provider: str) -> Optional[str]:
         """Get API key for a model provider.
@@ -30,13 +48,7 @@ class Config:
         Returns:
             API key if found, None otherwise
         """
-        key_map = {
-            "anthropic": "ANTHROPIC_API_KEY",
-            "openai": "OPENAI_API_KEY", 
-            "mistral": "MISTRAL_API_KEY"
-        }
-        
-        env_var = key_map.get(provider.lower())
+        env_var = API_KEY_ENV_VARS.get(provider.lower())
         if env_var:
             return os.getenv(env_var)
         
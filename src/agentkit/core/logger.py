@@ -1,19 +1,16 @@
 """Logging configuration for AgentKit."""
 
+import functools
 import logging
 import sys
 from typing import Optional
 
 
-def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
-    """Get a configured logger instance.
+@functools.lru_cache(maxsize=128)
+def _configured_logger(name: str) -> logging.Logger:
+    """Get a logger with the AgentKit handler attached.
     
-    Args:
-        name: Logger name (usually __name__)
-        level: Optional log level override
-        
-    Returns:
-        Configured logger instance
+    Cached per name, so the handler setup checks run once per logger.
     """
     logger = logging.getLogger(name)
     
@@ -27,6 +24,21 @@ def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
         logger.addHandler(handler)
         logger.setLevel(logging.INFO)
     
+    return logger
+
+
+def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
+    """Get a configured logger instance.
+    
+    Args:
+        name: Logger name (usually __name__)
+        level: Optional log level override, applied on every call
+        
+    Returns:
+        Configured logger instance
+    """
+    logger = _configured_logger(name)
+    
     if level:
         numeric_level = getattr(logging, level.upper(), None)
         if numeric_level:
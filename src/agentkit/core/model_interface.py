@@ -1,33 +1,268 @@
 """Model abstraction layer for AgentKit with cloud-ready Claude integration."""
 
+import asyncio
+import concurrent.futures
+import hashlib
 import os
+import random
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any, Iterator, List, Tuple
+import importlib
+import importlib.util
 import json
 
-try:
-    import boto3
-    from botocore.exceptions import ClientError
-    BOTO3_AVAILABLE = True
-except ImportError:
-    BOTO3_AVAILABLE = False
-
-try:
-    import anthropic
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
+# The SDKs are only imported when a provider needs them: boto3 in
+# particular adds hundreds of milliseconds to every cold start
+BOTO3_AVAILABLE = importlib.util.find_spec("boto3") is not None
+ANTHROPIC_AVAILABLE = importlib.util.find_spec("anthropic") is not None
 
 from .logger import get_logger
 from .config import Config
 
+if TYPE_CHECKING:
+    import anthropic
+
 logger = get_logger(__name__)
 
+# Upper bound for a single retry delay, in seconds
+MAX_RETRY_DELAY = 30.0
+
+# How long a Secrets Manager value is reused before re-fetching, so that
+# rotated keys are picked up without a cold start
+SECRET_CACHE_TTL = 600.0
+
+# Secrets Manager clients (boto3, or a raw HTTP pool inside Lambda) and
+# fetched secrets, shared across provider instances and warm invocations
+_secrets_client = None
+_secrets_http = None
+_secret_cache: Dict[str, Tuple[str, float]] = {}
+_secrets_lock = threading.Lock()
+
+# Anthropic clients keyed by a digest of their API key, so providers
+# sharing a key also share one HTTP connection pool
+_anthropic_clients: Dict[str, Any] = {}
+_anthropic_clients_lock = threading.Lock()
+
+
+def _jittered_delay(attempt: int, base_delay: float, max_delay: float = MAX_RETRY_DELAY) -> float:
+    """Compute a "full jitter" exponential backoff delay.
+    
+    Args:
+        attempt: Zero-based retry attempt number
+        base_delay: Delay for the first attempt, in seconds
+        max_delay: Cap for the exponential delay, in seconds
+        
+    Returns:
+        Random delay between 0 and min(max_delay, base_delay * 2**attempt)
+    """
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Read the Retry-After header from an API error, if present.
+    
+    Args:
+        error: Exception raised by the API client
+        
+    Returns:
+        Seconds to wait as requested by the server, or None
+    """
+    return _parse_retry_after(getattr(getattr(error, "response", None), "headers", None))
+
+
+def _parse_retry_after(headers: Any) -> Optional[float]:
+    """Parse a Retry-After header value given in seconds.
+    
+    Args:
+        headers: Mapping of (lowercase) response headers, or None
+        
+    Returns:
+        Seconds to wait as requested by the server, or None
+    """
+    if headers is None:
+        return None
+    
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_delays_from_config(config: Config) -> Tuple[float, float]:
+    """Read the retry backoff base and cap from configuration.
+    
+    Args:
+        config: Configuration instance
+        
+    Returns:
+        Tuple of (base delay, maximum delay) in seconds
+        
+    Raises:
+        ModelError: If either value is not a positive number
+    """
+    delays = []
+    for key, default in (("AGENTKIT_RETRY_BASE_DELAY", 0.1), ("AGENTKIT_RETRY_MAX_DELAY", 8.0)):
+        value = config.get(key, default)
+        try:
+            delay = float(value)
+        except (TypeError, ValueError):
+            delay = 0.0
+        if delay <= 0:
+            raise ModelError(f"{key} must be a positive number, got {value!r}")
+        delays.append(delay)
+    
+    return delays[0], delays[1]
+
+
+def _get_secrets_client() -> Any:
+    """Return the shared Secrets Manager client, creating it on first use.
+    
+    Returns:
+        boto3 Secrets Manager client
+    """
+    global _secrets_client
+    with _secrets_lock:
+        if _secrets_client is None:
+            import boto3
+            _secrets_client = boto3.Session().client('secretsmanager')
+        return _secrets_client
+
+
+def _use_signed_secrets_request() -> bool:
+    """Whether to call Secrets Manager directly instead of through boto3.
+    
+    Inside Lambda the execution role's credentials are in the environment,
+    so a single signed request avoids building a boto3 client on cold start.
+    """
+    return bool(
+        os.getenv("AWS_LAMBDA_FUNCTION_NAME")
+        and os.getenv("AWS_ACCESS_KEY_ID")
+        and os.getenv("AWS_SECRET_ACCESS_KEY")
+    )
+
+
+def _get_secret_string_signed(secret_arn: str) -> str:
+    """Fetch a SecretString with a SigV4-signed GetSecretValue request.
+    
+    Args:
+        secret_arn: ARN (or name) of the secret
+        
+    Returns:
+        The secret's SecretString
+        
+    Raises:
+        ModelError: If Secrets Manager does not return the secret
+    """
+    global _secrets_http
+    import urllib3
+    from botocore.auth import SigV4Auth
+    from botocore.awsrequest import AWSRequest
+    from botocore.credentials import Credentials
+    
+    arn_parts = secret_arn.split(":")
+    region = arn_parts[3] if len(arn_parts) > 3 and arn_parts[3] else os.getenv("AWS_REGION", "us-east-1")
+    url = f"https://secretsmanager.{region}.amazonaws.com/"
+    body = json.dumps({"SecretId": secret_arn})
+    
+    request = AWSRequest(method="POST", url=url, data=body, headers={
+        "Content-Type": "application/x-amz-json-1.1",
+        "X-Amz-Target": "secretsmanager.GetSecretValue",
+    })
+    credentials = Credentials(
+        os.environ["AWS_ACCESS_KEY_ID"],
+        os.environ["AWS_SECRET_ACCESS_KEY"],
+        os.getenv("AWS_SESSION_TOKEN")
+    )
+    SigV4Auth(credentials, "secretsmanager", region).add_auth(request)
+    
+    with _secrets_lock:
+        if _secrets_http is None:
+            _secrets_http = urllib3.PoolManager()
+        http = _secrets_http
+    
+    response = http.request("POST", url, body=body.encode("utf-8"), headers=dict(request.headers.items()))
+    if response.status != 200:
+        raise ModelError(
+            f"Secrets Manager returned HTTP {response.status}: "
+            f"{response.data.decode('utf-8', 'replace')[:200]}"
+        )
+    
+    return json.loads(response.data)["SecretString"]
+
+
+def clear_secret_cache() -> None:
+    """Discard cached secrets and the shared Secrets Manager clients."""
+    global _secrets_client, _secrets_http
+    with _secrets_lock:
+        _secrets_client = None
+        _secrets_http = None
+        _secret_cache.clear()
+
+
+def clear_anthropic_client_cache() -> None:
+    """Discard shared Anthropic clients, e.g. after an API key rotation."""
+    with _anthropic_clients_lock:
+        _anthropic_clients.clear()
+
+
+def __getattr__(name: str) -> Any:
+    """Import the SDK modules on attribute access (PEP 562).
+    
+    Keeps ``model_interface.anthropic`` and ``model_interface.boto3``
+    available without importing them when this module loads.
+    """
+    if name in ("anthropic", "boto3"):
+        return importlib.import_module(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _TokenBucket:
+    """Token bucket for keeping requests under a per-minute budget.
+    
+    Callers reserve tokens up front and wait out any deficit, so
+    concurrent callers queue fairly instead of retrying after a 429.
+    """
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        """Initialize a full bucket.
+        
+        Args:
+            capacity: Maximum number of tokens held
+            refill_rate: Tokens added per second
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self, cost: float) -> float:
+        """Take tokens from the bucket.
+        
+        Args:
+            cost: Number of tokens needed (capped at capacity)
+            
+        Returns:
+            Seconds to wait before the reserved tokens are available
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+            self._updated = now
+            self._tokens -= min(cost, self.capacity)
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.refill_rate
+
 
 class ModelError(Exception):
     """Exception raised for model-related errors."""
     
+    # Attributes live in slots, so raising does not allocate an instance dict
+    __slots__ = ('message', 'original_error')
+    
     def __init__(self, message: str, original_error: Optional[Exception] = None):
         super().__init__(message)
         self.message = message
@@ -37,6 +272,10 @@ class ModelError(Exception):
 class ModelProvider(ABC):
     """Abstract base class for AI model providers."""
     
+    # Retry backoff bounds, in seconds
+    retry_base_delay: float = 1.0
+    retry_max_delay: float = MAX_RETRY_DELAY
+    
     def __init__(self, model_name: str):
         """Initialize the model provider.
         
@@ -46,6 +285,21 @@ class ModelProvider(ABC):
         self.model_name = model_name
         self.logger = get_logger(f"{self.__class__.__name__}")
     
+    def _backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Compute the delay before retrying a failed request.
+        
+        Args:
+            attempt: Zero-based retry attempt number
+            retry_after: Delay requested by the server, used as a floor
+            
+        Returns:
+            Jittered exponential delay in seconds
+        """
+        delay = _jittered_delay(attempt, self.retry_base_delay, self.retry_max_delay)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+    
     @abstractmethod
     def generate(
         self, 
@@ -67,6 +321,90 @@ class ModelProvider(ABC):
             ModelError: If generation fails
         """
         pass
+    
+    def generate_stream(
+        self,
+        system_prompt: str,
+        task_prompt: str,
+        max_tokens: int = 1024
+    ) -> Iterator[str]:
+        """Generate a response as an iterator of text chunks.
+        
+        Providers without native streaming support yield the complete
+        response as a single chunk.
+        
+        Args:
+            system_prompt: System instruction for the model
+            task_prompt: User task/query for the model
+            max_tokens: Maximum tokens to generate
+            
+        Returns:
+            Iterator over generated text chunks
+            
+        Raises:
+            ModelError: If generation fails
+        """
+        yield self.generate(system_prompt, task_prompt, max_tokens)
+    
+    def generate_batch(
+        self,
+        prompts: List[Tuple[str, str]],
+        max_tokens: int = 1024,
+        max_workers: int = 16
+    ) -> List[str]:
+        """Generate responses for several prompts concurrently.
+        
+        Each (system_prompt, task_prompt) pair is sent through generate()
+        on a thread pool, so total latency approaches that of the slowest
+        request instead of the sum of all of them.
+        
+        Args:
+            prompts: (system_prompt, task_prompt) pairs to generate responses for
+            max_tokens: Maximum tokens to generate per response
+            max_workers: Maximum number of concurrent requests
+            
+        Returns:
+            Generated text responses, in the same order as prompts
+            
+        Raises:
+            ModelError: If any generation fails
+        """
+        if max_workers <= 0:
+            raise ModelError("max_workers must be at least 1")
+        
+        if not prompts:
+            return []
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(prompts), max_workers)) as executor:
+            futures = [
+                executor.submit(self.generate, system_prompt, task_prompt, max_tokens)
+                for system_prompt, task_prompt in prompts
+            ]
+            return [future.result() for future in futures]
+    
+    async def agenerate(
+        self,
+        system_prompt: str,
+        task_prompt: str,
+        max_tokens: int = 1024
+    ) -> str:
+        """Generate a response without blocking the event loop.
+        
+        Providers without a native async client run generate() in a
+        worker thread.
+        
+        Args:
+            system_prompt: System instruction for the model
+            task_prompt: User task/query for the model
+            max_tokens: Maximum tokens to generate
+            
+        Returns:
+            Generated text response
+            
+        Raises:
+            ModelError: If generation fails
+        """
+        return await asyncio.to_thread(self.generate, system_prompt, task_prompt, max_tokens)
 
 
 class ClaudeProvider(ModelProvider):
@@ -93,6 +431,12 @@ class ClaudeProvider(ModelProvider):
                 "Anthropic SDK not available. Install with: pip install anthropic"
             )
         
+        try:
+            import anthropic
+        except ImportError as e:
+            raise ModelError(f"Failed to import Anthropic SDK: {str(e)}", e)
+        self._anthropic = anthropic
+        
         if model_name not in self.MODEL_MAPPING:
             available = ", ".join(self.MODEL_MAPPING.keys())
             raise ModelError(
@@ -103,10 +447,18 @@ class ClaudeProvider(ModelProvider):
         self.config = config or Config()
         self.api_model_name = self.MODEL_MAPPING[model_name]
         self.client = self._create_client()
+        # Created on first use by agenerate/agenerate_batch
+        self.async_client: Optional[Any] = None
+        
+        # Optional client-side rate limits, per minute
+        self._rpm_bucket = self._create_rate_limiter("ANTHROPIC_RPM_LIMIT")
+        self._tpm_bucket = self._create_rate_limiter("ANTHROPIC_TPM_LIMIT")
     
-    def _create_client(self) -> anthropic.Anthropic:
+    def _create_client(self) -> "anthropic.Anthropic":
         """Create Anthropic client with API key from env or AWS Secrets Manager.
         
+        Clients are shared between providers that use the same API key.
+        
         Returns:
             Configured Anthropic client
             
@@ -126,14 +478,27 @@ class ClaudeProvider(ModelProvider):
                 "variable or configure ANTHROPIC_SECRET_ARN for AWS Secrets Manager."
             )
         
+        # Kept so agenerate_batch can create a matching async client
+        self._api_key = api_key
+        
+        # Avoid holding raw API keys as dictionary keys
+        cache_key = hashlib.blake2b(api_key.encode(), digest_size=8).hexdigest()
+        
         try:
-            return anthropic.Anthropic(api_key=api_key)
+            with _anthropic_clients_lock:
+                client = _anthropic_clients.get(cache_key)
+                if client is None:
+                    client = self._anthropic.Anthropic(api_key=api_key)
+                    _anthropic_clients[cache_key] = client
+                return client
         except Exception as e:
             raise ModelError(f"Failed to create Anthropic client: {str(e)}", e)
     
     def _get_secret_from_aws(self) -> Optional[str]:
         """Retrieve API key from AWS Secrets Manager.
         
+        Successful lookups are cached for SECRET_CACHE_TTL seconds.
+        
         Returns:
             API key if found, None otherwise
         """
@@ -145,18 +510,27 @@ class ClaudeProvider(ModelProvider):
         if not secret_arn:
             return None
         
+        with _secrets_lock:
+            cached = _secret_cache.get(secret_arn)
+        if cached and time.monotonic() - cached[1] < SECRET_CACHE_TTL:
+            return cached[0]
+        
+        api_key = None
+        from botocore.exceptions import ClientError
+        
         try:
-            session = boto3.Session()
-            secrets_client = session.client('secretsmanager')
-            
-            response = secrets_client.get_secret_value(SecretId=secret_arn)
-            secret_data = json.loads(response['SecretString'])
+            if _use_signed_secrets_request():
+                secret_string = _get_secret_string_signed(secret_arn)
+            else:
+                response = _get_secrets_client().get_secret_value(SecretId=secret_arn)
+                secret_string = response['SecretString']
+            secret_data = json.loads(secret_string)
             
             # Support both direct string and JSON object formats
             if isinstance(secret_data, str):
-                return secret_data
+                api_key = secret_data
             elif isinstance(secret_data, dict):
-                return secret_data.get('anthropic_api_key') or secret_data.get('api_key')
+                api_key = secret_data.get('anthropic_api_key') or secret_data.get('api_key')
             
         except ClientError as e:
             self.logger.error(f"Failed to retrieve secret from AWS: {str(e)}")
@@ -165,6 +539,11 @@ class ClaudeProvider(ModelProvider):
         except Exception as e:
             self.logger.error(f"Unexpected error retrieving AWS secret: {str(e)}")
         
+        if api_key:
+            with _secrets_lock:
+                _secret_cache[secret_arn] = (api_key, time.monotonic())
+            return api_key
+        
         return None
     
     def generate(
@@ -186,11 +565,7 @@ class ClaudeProvider(ModelProvider):
         Raises:
             ModelError: If generation fails
         """
-        if not system_prompt or not task_prompt:
-            raise ModelError("Both system_prompt and task_prompt are required")
-        
-        if max_tokens <= 0 or max_tokens > 4096:
-            raise ModelError("max_tokens must be between 1 and 4096")
+        self._validate_request(system_prompt, task_prompt, max_tokens)
         
         self.logger.info(f"Generating response with {self.model_name}")
         self.logger.debug(f"System prompt length: {len(system_prompt)}")
@@ -198,62 +573,306 @@ class ClaudeProvider(ModelProvider):
         
         # Retry logic for transient failures
         max_retries = 3
-        base_delay = 1.0
         
         for attempt in range(max_retries):
+            delay = self._throttle_delay(system_prompt, task_prompt, max_tokens)
+            if delay > 0:
+                time.sleep(delay)
+            
             try:
                 start_time = time.time()
                 
                 response = self.client.messages.create(
-                    model=self.api_model_name,
-                    max_tokens=max_tokens,
-                    system=system_prompt,
-                    messages=[
-                        {
-                            "role": "user",
-                            "content": task_prompt
-                        }
-                    ]
+                    **self._message_params(system_prompt, task_prompt, max_tokens)
                 )
                 
                 duration = time.time() - start_time
                 self.logger.info(f"Generated response in {duration:.2f}s")
                 
-                # Extract text content from response
-                if response.content and len(response.content) > 0:
-                    content = response.content[0]
-                    if hasattr(content, 'text'):
-                        return content.text.strip()
+                return self._response_text(response)
                 
-                raise ModelError("No text content in response")
-                
-            except anthropic.RateLimitError as e:
-                if attempt < max_retries - 1:
-                    delay = base_delay * (2 ** attempt)  # Exponential backoff
-                    self.logger.warning(f"Rate limited, retrying in {delay}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(delay)
-                    continue
-                else:
-                    raise ModelError(f"Rate limit exceeded after {max_retries} attempts", e)
+            except Exception as e:
+                time.sleep(self._retry_delay(e, attempt, max_retries))
+        
+        raise ModelError(f"Failed to generate response after {max_retries} attempts")
+    
+    def generate_stream(
+        self,
+        system_prompt: str,
+        task_prompt: str,
+        max_tokens: int = 1024
+    ) -> Iterator[str]:
+        """Stream a response from Claude as text chunks.
+        
+        Arguments are validated immediately; the request is sent when
+        iteration starts. Streaming requests are not retried.
+        
+        Args:
+            system_prompt: System instruction for Claude
+            task_prompt: User task/query for Claude
+            max_tokens: Maximum tokens to generate
+            
+        Returns:
+            Iterator over generated text chunks
+            
+        Raises:
+            ModelError: If the arguments are invalid or streaming fails
+        """
+        self._validate_request(system_prompt, task_prompt, max_tokens)
+        
+        self.logger.info(f"Streaming response with {self.model_name}")
+        
+        return self._stream_chunks(system_prompt, task_prompt, max_tokens)
+    
+    def _create_rate_limiter(self, env_var: str) -> Optional[_TokenBucket]:
+        """Create a per-minute token bucket from a configuration value.
+        
+        Args:
+            env_var: Configuration key holding the per-minute limit
+            
+        Returns:
+            Token bucket, or None if no limit is configured
+            
+        Raises:
+            ModelError: If the configured limit is not a positive number
+        """
+        value = self.config.get(env_var)
+        if not value:
+            return None
+        
+        try:
+            limit = float(value)
+        except ValueError:
+            limit = 0.0
+        if limit <= 0:
+            raise ModelError(f"{env_var} must be a positive number, got {value!r}")
+        
+        return _TokenBucket(limit, limit / 60.0)
+    
+    def _throttle_delay(self, system_prompt: str, task_prompt: str, max_tokens: int) -> float:
+        """Reserve rate limit budget for one request.
+        
+        Input tokens are estimated at four characters per token, plus
+        max_tokens for the output.
+        
+        Returns:
+            Seconds to wait before sending the request
+        """
+        delay = 0.0
+        if self._rpm_bucket is not None:
+            delay = self._rpm_bucket.reserve(1)
+        if self._tpm_bucket is not None:
+            estimated_tokens = (len(system_prompt) + len(task_prompt)) // 4 + max_tokens
+            delay = max(delay, self._tpm_bucket.reserve(estimated_tokens))
+        if delay > 0:
+            self.logger.debug(f"Throttling request for {delay:.2f}s to stay within rate limits")
+        return delay
+    
+    def _validate_request(self, system_prompt: str, task_prompt: str, max_tokens: int) -> None:
+        """Validate generation arguments.
+        
+        Raises:
+            ModelError: If a prompt is empty or max_tokens is out of range
+        """
+        if not system_prompt or not task_prompt:
+            raise ModelError("Both system_prompt and task_prompt are required")
+        
+        if max_tokens <= 0 or max_tokens > 4096:
+            raise ModelError("max_tokens must be between 1 and 4096")
+    
+    def _message_params(self, system_prompt: str, task_prompt: str, max_tokens: int) -> Dict[str, Any]:
+        """Build the messages.create arguments for a single-turn request."""
+        return {
+            "model": self.api_model_name,
+            "max_tokens": max_tokens,
+            "system": system_prompt,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": task_prompt
+                }
+            ]
+        }
+    
+    def _response_text(self, response: Any) -> str:
+        """Extract the text of a Claude response.
+        
+        Raises:
+            ModelError: If the response has no text content
+        """
+        if response.content and len(response.content) > 0:
+            content = response.content[0]
+            if hasattr(content, 'text'):
+                return content.text.strip()
+        
+        raise ModelError("No text content in response")
+    
+    def _retry_delay(self, error: Exception, attempt: int, max_retries: int) -> float:
+        """Classify a failed request attempt, for the sync and async retry loops.
+        
+        Rate limit errors and timeouts are retried with jittered exponential
+        backoff, never sooner than the server asks; other errors are final.
+        
+        Args:
+            error: Exception raised by the attempt
+            attempt: Zero-based attempt number
+            max_retries: Total attempts allowed
+            
+        Returns:
+            Seconds to wait before the next attempt
+            
+        Raises:
+            ModelError: If the error is not retryable or no attempts are left
+        """
+        if isinstance(error, ModelError):
+            raise error
+        
+        if isinstance(error, self._anthropic.RateLimitError):
+            if attempt < max_retries - 1:
+                delay = self._backoff(attempt, _retry_after_seconds(error))
+                self.logger.warning(f"Rate limited, retrying in {delay:.2f}s (attempt {attempt + 1}/{max_retries})")
+                return delay
+            raise ModelError(f"Rate limit exceeded after {max_retries} attempts", error)
+        
+        if isinstance(error, self._anthropic.APITimeoutError):
+            if attempt < max_retries - 1:
+                delay = self._backoff(attempt)
+                self.logger.warning(f"API timeout, retrying in {delay:.2f}s (attempt {attempt + 1}/{max_retries})")
+                return delay
+            raise ModelError(f"API timeout after {max_retries} attempts", error)
+        
+        if isinstance(error, self._anthropic.APIError):
+            # Don't retry for non-transient API errors
+            raise ModelError(f"Anthropic API error: {str(error)}", error)
+        
+        # Don't retry for unexpected errors
+        raise ModelError(f"Unexpected error during generation: {str(error)}", error)
+    
+    async def agenerate(
+        self,
+        system_prompt: str,
+        task_prompt: str,
+        max_tokens: int = 1024
+    ) -> str:
+        """Generate a response using the async Anthropic client.
+        
+        Args:
+            system_prompt: System instruction for Claude
+            task_prompt: User task/query for Claude
+            max_tokens: Maximum tokens to generate
+            
+        Returns:
+            Generated text response
             
-            except anthropic.APITimeoutError as e:
-                if attempt < max_retries - 1:
-                    delay = base_delay * (2 ** attempt)
-                    self.logger.warning(f"API timeout, retrying in {delay}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(delay)
-                    continue
-                else:
-                    raise ModelError(f"API timeout after {max_retries} attempts", e)
+        Raises:
+            ModelError: If generation fails
+        """
+        self._validate_request(system_prompt, task_prompt, max_tokens)
+        self._ensure_async_client()
+        
+        self.logger.info(f"Generating async response with {self.model_name}")
+        return await self._agenerate(system_prompt, task_prompt, max_tokens)
+    
+    async def agenerate_batch(
+        self,
+        system_prompt: str,
+        task_prompts: List[str],
+        max_tokens: int = 1024,
+        concurrency: int = 10
+    ) -> List[str]:
+        """Generate responses for several task prompts concurrently.
+        
+        Each prompt is sent as its own request through the async Anthropic
+        client, with at most `concurrency` requests in flight.
+        
+        Args:
+            system_prompt: System instruction shared by all prompts
+            task_prompts: User tasks/queries to generate responses for
+            max_tokens: Maximum tokens to generate per response
+            concurrency: Maximum number of concurrent requests
             
-            except anthropic.APIError as e:
-                # Don't retry for non-transient API errors
-                raise ModelError(f"Anthropic API error: {str(e)}", e)
+        Returns:
+            Generated text responses, in the same order as task_prompts
             
+        Raises:
+            ModelError: If any generation fails
+        """
+        for task_prompt in task_prompts:
+            self._validate_request(system_prompt, task_prompt, max_tokens)
+        
+        if concurrency <= 0:
+            raise ModelError("concurrency must be at least 1")
+        
+        self._ensure_async_client()
+        
+        self.logger.info(f"Generating {len(task_prompts)} responses with {self.model_name}")
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def generate_one(task_prompt: str) -> str:
+            async with semaphore:
+                return await self._agenerate(system_prompt, task_prompt, max_tokens)
+        
+        return list(await asyncio.gather(*(generate_one(prompt) for prompt in task_prompts)))
+    
+    def _ensure_async_client(self) -> None:
+        """Create the async Anthropic client on first use."""
+        if self.async_client is None:
+            self.async_client = self._anthropic.AsyncAnthropic(api_key=self._api_key)
+    
+    async def _agenerate(self, system_prompt: str, task_prompt: str, max_tokens: int) -> str:
+        """Generate a single response with the async client and retry logic."""
+        max_retries = 3
+        
+        for attempt in range(max_retries):
+            delay = self._throttle_delay(system_prompt, task_prompt, max_tokens)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            
+            try:
+                response = await self.async_client.messages.create(
+                    **self._message_params(system_prompt, task_prompt, max_tokens)
+                )
+                return self._response_text(response)
+                
             except Exception as e:
-                # Don't retry for unexpected errors
-                raise ModelError(f"Unexpected error during generation: {str(e)}", e)
+                await asyncio.sleep(self._retry_delay(e, attempt, max_retries))
         
         raise ModelError(f"Failed to generate response after {max_retries} attempts")
+    
+    def _stream_chunks(self, system_prompt: str, task_prompt: str, max_tokens: int) -> Iterator[str]:
+        """Yield text chunks from a Claude streaming request."""
+        delay = self._throttle_delay(system_prompt, task_prompt, max_tokens)
+        if delay > 0:
+            time.sleep(delay)
+        
+        try:
+            start_time = time.time()
+            
+            with self.client.messages.stream(
+                model=self.api_model_name,
+                max_tokens=max_tokens,
+                system=system_prompt,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": task_prompt
+                    }
+                ]
+            ) as stream:
+                for text in stream.text_stream:
+                    yield text
+            
+            duration = time.time() - start_time
+            self.logger.info(f"Streamed response in {duration:.2f}s")
+            
+        except self._anthropic.RateLimitError as e:
+            raise ModelError("Rate limit exceeded while streaming", e)
+        except self._anthropic.APITimeoutError as e:
+            raise ModelError("API timeout while streaming", e)
+        except self._anthropic.APIError as e:
+            raise ModelError(f"Anthropic API error: {str(e)}", e)
+        except Exception as e:
+            raise ModelError(f"Unexpected error during streaming: {str(e)}", e)
 
 
 def get_model_provider(
@@ -285,6 +904,8 @@ def get_model_provider(
     
     provider = provider.lower()
     
+    # Providers are cheap and built fresh on every call; the expensive SDK
+    # clients behind them are shared through module-level caches instead
     if provider == "anthropic":
         # Validate Claude models for Anthropic provider
         claude_models = ["claude-3-opus", "claude-3-sonnet", "claude-3-haiku"]
@@ -0,0 +1,174 @@
+"""Response caching for AgentKit model providers."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+from .config import Config
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# Supported cache policies:
+#   enabled    - serve hits and store new responses
+#   read_only  - serve hits, never store
+#   write_only - always call the model, store its responses
+#   replay     - serve hits only; a miss is an error (no model calls)
+#   disabled   - bypass the cache entirely
+CACHE_POLICIES = ("enabled", "read_only", "write_only", "replay", "disabled")
+
+DEFAULT_CACHE_SIZE = 1024
+
+
+class ResponseCache:
+    """Cache of model responses keyed by a hash of the exact request."""
+    
+    def __init__(self, policy: str = "enabled", maxsize: int = DEFAULT_CACHE_SIZE, path: Optional[str] = None):
+        """Initialize the response cache.
+        
+        Args:
+            policy: One of CACHE_POLICIES
+            maxsize: Maximum number of in-memory entries
+            path: Directory for a persistent diskcache store (optional)
+        
+        Raises:
+            ValueError: If the policy is unknown
+        """
+        if policy not in CACHE_POLICIES:
+            raise ValueError(
+                f"Unknown response cache policy: {policy}. "
+                f"Available policies: {', '.join(CACHE_POLICIES)}"
+            )
+        
+        self.policy = policy
+        self.maxsize = maxsize
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = None
+        
+        if path and policy != "disabled":
+            if DISKCACHE_AVAILABLE:
+                self._disk = diskcache.Cache(path)
+            else:
+                logger.warning(
+                    "diskcache not available, using in-memory response cache. "
+                    "Install with: pip install diskcache"
+                )
+    
+    @staticmethod
+    def make_key(*parts: object) -> str:
+        """Build a cache key from the parts identifying a request.
+        
+        Args:
+            parts: Provider, model and request fields
+        
+        Returns:
+            SHA-256 hex digest of the parts
+        """
+        return hashlib.sha256("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    
+    @property
+    def readable(self) -> bool:
+        """Whether cached responses may be returned."""
+        return self.policy in ("enabled", "read_only", "replay")
+    
+    @property
+    def writable(self) -> bool:
+        """Whether new responses are stored."""
+        return self.policy in ("enabled", "write_only")
+    
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached response.
+        
+        Args:
+            key: Cache key from make_key
+        
+        Returns:
+            Cached response, or None on a miss or if reads are disabled
+        """
+        if not self.readable:
+            return None
+        
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                return value
+        
+        if self._disk is not None:
+            value = self._disk.get(key)
+            if value is not None:
+                self._remember(key, value)
+            return value
+        
+        return None
+    
+    def put(self, key: str, value: str) -> None:
+        """Store a response, if the policy allows writes.
+        
+        Args:
+            key: Cache key from make_key
+            value: Response text
+        """
+        if not self.writable:
+            return
+        
+        self._remember(key, value)
+        if self._disk is not None:
+            self._disk.set(key, value)
+    
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
+    
+    def _remember(self, key: str, value: str) -> None:
+        """Add an entry to the in-memory LRU."""
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            if len(self._memory) > self.maxsize:
+                self._memory.popitem(last=False)
+
+
+_caches: Dict[Tuple[str, Optional[str]], ResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_response_cache(config: Optional[Config] = None) -> ResponseCache:
+    """Get the shared response cache for the configured policy.
+    
+    The policy is read from AGENTKIT_RESPONSE_CACHE (default "disabled")
+    and the optional persistent store from AGENTKIT_RESPONSE_CACHE_PATH.
+    
+    Args:
+        config: Optional configuration instance
+    
+    Returns:
+        ResponseCache shared by all providers with the same settings
+    """
+    config = config or Config()
+    policy = (config.get("AGENTKIT_RESPONSE_CACHE") or "disabled").lower()
+    path = config.get("AGENTKIT_RESPONSE_CACHE_PATH")
+    
+    with _caches_lock:
+        cache = _caches.get((policy, path))
+        if cache is None:
+            cache = ResponseCache(policy=policy, path=path)
+            _caches[(policy, path)] = cache
+        return cache
+
+
+def clear_response_caches() -> None:
+    """Discard all shared response caches (persistent stores are kept)."""
+    with _caches_lock:
+        _caches.clear()
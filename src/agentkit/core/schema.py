@@ -1,22 +1,45 @@
 """YAML schema validation and parsing for AgentKit configuration files."""
 
+import copy
+import json
+import os
 import yaml
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Union
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple, Union
 import jsonschema
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
+from jsonschema.exceptions import best_match
 from rich.panel import Panel
 from rich.console import Console
 
+from .config import Config
 from .logger import get_logger
 
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 logger = get_logger(__name__)
 console = Console()
 
+# Parsed configuration cache: resolved path -> (mtime_ns, size, frozen config)
+_CONFIG_CACHE_MAXSIZE = 100
+_config_cache: "OrderedDict[str, Tuple[int, int, Mapping[str, Any]]]" = OrderedDict()
+
+# Suffix of the optional parsed-JSON sidecar written next to each YAML config
+SIDECAR_CACHE_SUFFIX = ".cache.json"
+
 
 class ConfigValidationError(Exception):
     """Custom exception for configuration validation errors."""
     
+    # Attributes live in slots, so raising does not allocate an instance dict
+    __slots__ = ('message', 'details')
+    
     def __init__(self, message: str, details: str = None):
         """Initialize the exception.
         
@@ -73,7 +96,7 @@ AGENT_CONFIG_SCHEMA = {
                     "description": "AWS region for bedrock provider"
                 },
                 "tools": {
-                    "oneOf": [
+                    "anyOf": [
                         {
                             "type": "array",
                             "items": {
@@ -136,15 +159,49 @@ AGENT_CONFIG_SCHEMA = {
     "additionalProperties": False
 }
 
+def _extend_with_default(validator_class: Any) -> Any:
+    """Extend a validator class to fill in schema defaults while validating.
+    
+    Args:
+        validator_class: jsonschema validator class to extend
+        
+    Returns:
+        Validator class that sets missing properties to their "default"
+    """
+    validate_properties = validator_class.VALIDATORS["properties"]
+    
+    def set_defaults(validator, properties, instance, schema):
+        yield from validate_properties(validator, properties, instance, schema)
+        
+        # Filled in after validating, as the defaults themselves are not
+        # validated
+        if validator.is_type(instance, "object"):
+            for prop, subschema in properties.items():
+                if "default" in subschema:
+                    instance.setdefault(prop, copy.deepcopy(subschema["default"]))
+    
+    return jsonschema.validators.extend(validator_class, {"properties": set_defaults})
+
+
+# Built once at import; jsonschema.validate() re-checks the schema and
+# constructs a new validator on every call
+jsonschema.Draft201909Validator.check_schema(AGENT_CONFIG_SCHEMA)
+_SCHEMA_VALIDATOR = _extend_with_default(jsonschema.Draft201909Validator)(AGENT_CONFIG_SCHEMA)
+
 
-def load_and_validate_config(path: Union[str, Path]) -> Dict[str, Any]:
+def load_and_validate_config(path: Union[str, Path]) -> Mapping[str, Any]:
     """Load and validate an agent configuration YAML file.
     
+    Results are cached per absolute path and reused while the file's
+    modification time and size are unchanged. The returned configuration
+    is shared between callers and therefore read-only: mappings are
+    MappingProxyType views and lists are converted to tuples.
+    
     Args:
         path: Path to the YAML configuration file
         
     Returns:
-        Validated configuration dictionary
+        Validated, read-only configuration mapping
         
     Raises:
         ConfigValidationError: If the configuration is invalid
@@ -152,16 +209,130 @@ def load_and_validate_config(path: Union[str, Path]) -> Dict[str, Any]:
     config_path = Path(path)
     
     # Check if file exists
-    if not config_path.exists():
+    try:
+        stat = os.stat(config_path)
+    except OSError:
         raise ConfigValidationError(
             f"Configuration file not found: {config_path}",
             "Please ensure the file path is correct and the file exists."
         )
     
+    # abspath is purely lexical; resolve() would lstat every path component
+    cache_key = os.path.abspath(config_path)
+    cached = _config_cache.get(cache_key)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        _config_cache.move_to_end(cache_key)
+        return cached[2]
+    
+    use_sidecar = Config().get("AGENTKIT_YAML_CACHE") == "1"
+    config_data = _read_sidecar_cache(config_path, stat.st_mtime) if use_sidecar else None
+    
+    if config_data is None:
+        config_data = _load_and_validate_file(config_path)
+        if use_sidecar:
+            _write_sidecar_cache(config_path, config_data)
+    
+    frozen_config = _freeze(config_data)
+    
+    _config_cache[cache_key] = (stat.st_mtime_ns, stat.st_size, frozen_config)
+    _config_cache.move_to_end(cache_key)
+    if len(_config_cache) > _CONFIG_CACHE_MAXSIZE:
+        _config_cache.popitem(last=False)
+    
+    return frozen_config
+
+
+def clear_config_cache() -> None:
+    """Clear the cache of parsed configuration files."""
+    _config_cache.clear()
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert a parsed configuration value to a read-only form.
+    
+    Args:
+        value: Value parsed from YAML or JSON
+        
+    Returns:
+        The value with dicts wrapped in MappingProxyType and lists as tuples
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _read_sidecar_cache(config_path: Path, source_mtime: float) -> Optional[Dict[str, Any]]:
+    """Load a previously validated configuration from its JSON sidecar.
+    
+    Args:
+        config_path: Path to the YAML configuration file
+        source_mtime: Modification time of the YAML file
+        
+    Returns:
+        Cached configuration dictionary, or None if the sidecar is missing or stale
+    """
+    sidecar_path = Path(str(config_path) + SIDECAR_CACHE_SUFFIX)
+    
+    try:
+        if os.path.getmtime(sidecar_path) <= source_mtime:
+            return None
+        with open(sidecar_path, 'r', encoding='utf-8') as f:
+            config_data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if not isinstance(config_data, dict):
+        return None
+    
+    logger.debug(f"Loaded configuration from sidecar cache: {sidecar_path}")
+    return config_data
+
+
+def _write_sidecar_cache(config_path: Path, config_data: Dict[str, Any]) -> None:
+    """Write a validated configuration to its JSON sidecar.
+    
+    Failures are logged and otherwise ignored - the sidecar is only an optimization.
+    
+    Args:
+        config_path: Path to the YAML configuration file
+        config_data: Validated configuration dictionary
+    """
+    sidecar_path = Path(str(config_path) + SIDECAR_CACHE_SUFFIX)
+    tmp_path = Path(str(sidecar_path) + ".tmp")
+    
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(config_data, f)
+        os.replace(tmp_path, sidecar_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not write sidecar cache {sidecar_path}: {e}")
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _load_and_validate_file(config_path: Path) -> Dict[str, Any]:
+    """Read, parse and validate a configuration file without caching.
+    
+    Args:
+        config_path: Path to the YAML configuration file
+        
+    Returns:
+        Validated configuration dictionary
+        
+    Raises:
+        ConfigValidationError: If the configuration is invalid
+    """
     # Load YAML file
     try:
+        # Read in one call so the loader parses a string rather than
+        # pulling from the file object in small chunks
         with open(config_path, 'r', encoding='utf-8') as f:
-            config_data = yaml.safe_load(f)
+            content = f.read()
+        config_data = yaml.load(content, Loader=YamlLoader)
     except yaml.YAMLError as e:
         raise ConfigValidationError(
             f"Invalid YAML syntax in {config_path}",
@@ -182,19 +353,9 @@ def load_and_validate_config(path: Union[str, Path]) -> Dict[str, Any]:
     
     # Validate against schema
     try:
-        validate(instance=config_data, schema=AGENT_CONFIG_SCHEMA)
+        _validate_schema(config_data)
         logger.info(f"Successfully validated configuration: {config_path}")
         
-        # Set default values for optional fields
-        if "tools" not in config_data["agent"]:
-            config_data["agent"]["tools"] = []
-        
-        if "provider" not in config_data["agent"]:
-            config_data["agent"]["provider"] = "anthropic"
-            
-        if "region" not in config_data["agent"]:
-            config_data["agent"]["region"] = "us-east-1"
-        
         # Normalize tools configuration
         config_data["agent"]["tools"] = normalize_tools_config(config_data["agent"]["tools"])
         
@@ -234,17 +395,7 @@ def validate_config_dict(config_data: Dict[str, Any]) -> Dict[str, Any]:
         ConfigValidationError: If the configuration is invalid
     """
     try:
-        validate(instance=config_data, schema=AGENT_CONFIG_SCHEMA)
-        
-        # Set default values for optional fields
-        if "tools" not in config_data["agent"]:
-            config_data["agent"]["tools"] = []
-        
-        if "provider" not in config_data["agent"]:
-            config_data["agent"]["provider"] = "anthropic"
-            
-        if "region" not in config_data["agent"]:
-            config_data["agent"]["region"] = "us-east-1"
+        _validate_schema(config_data)
         
         # Normalize tools configuration
         config_data["agent"]["tools"] = normalize_tools_config(config_data["agent"]["tools"])
@@ -284,6 +435,22 @@ def get_available_models() -> Dict[str, list[str]]:
         }
 
 
+def _validate_schema(config_data: Dict[str, Any]) -> None:
+    """Validate configuration data against the precompiled agent schema.
+    
+    Args:
+        config_data: Configuration dictionary to validate
+        
+    Missing optional fields are filled in from the schema defaults.
+    
+    Raises:
+        ValidationError: With the most relevant error, as jsonschema.validate would
+    """
+    error = best_match(_SCHEMA_VALIDATOR.iter_errors(config_data))
+    if error is not None:
+        raise error
+
+
 def _validate_model_provider_compatibility(agent_config: Dict[str, Any]) -> None:
     """Validate that the model is compatible with the specified provider.
     
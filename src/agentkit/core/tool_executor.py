@@ -1,13 +1,22 @@
 """Tool execution and integration for AgentKit agents."""
 
+import asyncio
 import json
 import re
-from typing import Dict, Any, List, Optional, Tuple
-from ..tools import get_tool, has_tool, ToolError
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from ..tools import BaseTool, get_tool, has_tool, ToolError
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Start of a tool call JSON object in an agent response. Matching is
+# case-sensitive because only a lowercase "tool_call" key is accepted.
+_TOOL_CALL_START_RE = re.compile(r'\{"tool_call"\s*:')
+
+# Shared by all extractions. The stdlib decoder is used over orjson because
+# raw_decode also reports where the object ends in the surrounding text.
+_JSON_DECODER = json.JSONDecoder()
+
 
 class ToolExecutor:
     """Handles tool execution and integration with agent responses."""
@@ -21,10 +30,21 @@ class ToolExecutor:
         self.available_tools = {tool["name"]: tool for tool in available_tools}
         self.logger = get_logger(self.__class__.__name__)
         
+        # Rendered by the first get_tools_context call; tools are fixed per executor
+        self._tools_context: Optional[str] = None
+        
+        # Resolved tool instances, so execution is a dict lookup
+        self._tool_cache: Dict[str, BaseTool] = {}
+        
         # Validate that all tools exist
         for tool_name in self.available_tools.keys():
             if not has_tool(tool_name):
                 self.logger.warning(f"Tool '{tool_name}' not found in registry")
+                continue
+            try:
+                self._tool_cache[tool_name] = get_tool(tool_name)
+            except ToolError as e:
+                self.logger.warning(f"Tool '{tool_name}' could not be loaded: {e.message}")
     
     def get_tools_context(self) -> str:
         """Generate context about available tools for the agent prompt.
@@ -32,42 +52,9 @@ class ToolExecutor:
         Returns:
             Formatted string describing available tools
         """
-        if not self.available_tools:
-            return "No tools are available."
-        
-        context = "Available tools:\n"
-        
-        for tool_name, tool_config in self.available_tools.items():
-            if not has_tool(tool_name):
-                continue
-                
-            try:
-                tool = get_tool(tool_name)
-                context += f"- {tool_name}: {tool.description}\n"
-                
-                # Add parameter information
-                schema = tool.parameters_schema
-                if schema.get("properties"):
-                    params_info = []
-                    for param, param_schema in schema["properties"].items():
-                        param_desc = param_schema.get("description", "")
-                        param_type = param_schema.get("type", "any")
-                        param_info = f"{param} ({param_type})"
-                        if param_desc:
-                            param_info += f": {param_desc}"
-                        params_info.append(param_info)
-                    
-                    context += f"  Parameters: {', '.join(params_info)}\n"
-                
-            except Exception as e:
-                self.logger.error(f"Error getting info for tool '{tool_name}': {e}")
-                context += f"- {tool_name}: Error loading tool\n"
-        
-        context += "\nTo use a tool, respond with JSON in this format:\n"
-        context += '{"tool_call": {"name": "tool_name", "parameters": {"param1": "value1"}}}\n'
-        context += "After using a tool, I will provide the result and you can continue your response.\n"
-        
-        return context
+        if self._tools_context is None:
+            self._tools_context = _render_tools_context(tuple(self.available_tools.keys()))
+        return self._tools_context
     
     def extract_tool_call(self, text: str) -> Optional[Dict[str, Any]]:
         """Extract tool call from agent response text.
@@ -78,54 +65,73 @@ class ToolExecutor:
         Returns:
             Tool call dictionary if found, None otherwise
         """
-        # Look for JSON tool call in the response using a more robust approach
+        return self._find_tool_call(text)[0]
+    
+    def _find_tool_call(self, text: str) -> Tuple[Optional[Dict[str, Any]], int, int]:
+        """Find the first tool call in a response along with its JSON span.
+        
+        Args:
+            text: Agent response text
+            
+        Returns:
+            Tuple of (tool call, start, end) where text[start:end] is the
+            tool call JSON, or (None, -1, -1) if there is no valid tool call
+        """
+        # Most responses contain no tool call; reject them without the regex
+        if '"tool_call"' not in text:
+            return None, -1, -1
+        
         # Find the start of a potential tool_call JSON
-        start_pattern = r'\{"tool_call"\s*:'
-        match = re.search(start_pattern, text, re.IGNORECASE)
+        match = _TOOL_CALL_START_RE.search(text)
         
         if not match:
-            return None
+            return None, -1, -1
         
         start_pos = match.start()
+        tool_call, json_end = self._parse_tool_call(text, start_pos)
         
-        # Find the matching closing brace by counting braces
-        brace_count = 0
-        json_end = -1
-        
-        for i, char in enumerate(text[start_pos:], start_pos):
-            if char == '{':
-                brace_count += 1
-            elif char == '}':
-                brace_count -= 1
-                if brace_count == 0:
-                    json_end = i + 1
-                    break
+        if tool_call is None:
+            return None, -1, -1
         
-        if json_end == -1:
-            return None
+        return tool_call, start_pos, json_end
+    
+    def _parse_tool_call(
+        self, text: str, start_pos: int, quiet: bool = False
+    ) -> Tuple[Optional[Dict[str, Any]], int]:
+        """Parse the tool call JSON object starting at start_pos.
         
-        try:
-            # Extract and parse the JSON
-            tool_call_json = text[start_pos:json_end]
-            parsed = json.loads(tool_call_json)
-            
-            if "tool_call" in parsed:
-                tool_call = parsed["tool_call"]
-                
-                # Validate required fields
-                if "name" not in tool_call:
-                    self.logger.warning("Tool call missing 'name' field")
-                    return None
-                
-                if "parameters" not in tool_call:
-                    tool_call["parameters"] = {}
-                
-                return tool_call
+        Args:
+            text: Agent response text
+            start_pos: Offset of the opening brace of the tool call JSON
+            quiet: Don't warn about JSON that fails to parse, for partial
+                text that may still be completed by a stream
             
+        Returns:
+            Tuple of (tool call, end). The tool call is None if it is invalid;
+            end is then the end of its JSON, or -1 if it did not parse
+        """
+        try:
+            # Parse the JSON object in C; raw_decode also reports where it ends
+            parsed, json_end = _JSON_DECODER.raw_decode(text, start_pos)
         except json.JSONDecodeError as e:
-            self.logger.warning(f"Failed to parse tool call JSON: {e}")
+            if not quiet:
+                self.logger.warning(f"Failed to parse tool call JSON: {e}")
+            return None, -1
         
-        return None
+        if "tool_call" not in parsed:
+            return None, json_end
+        
+        tool_call = parsed["tool_call"]
+        
+        # Validate required fields
+        if "name" not in tool_call:
+            self.logger.warning("Tool call missing 'name' field")
+            return None, json_end
+        
+        if "parameters" not in tool_call:
+            tool_call["parameters"] = {}
+        
+        return tool_call, json_end
     
     def execute_tool(self, tool_call: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a tool call.
@@ -149,7 +155,9 @@ class ToolExecutor:
                 "available_tools": list(self.available_tools.keys())
             }
         
-        if not has_tool(tool_name):
+        tool = self._tool_cache.get(tool_name)
+        
+        if tool is None and not has_tool(tool_name):
             return {
                 "success": False,
                 "error": f"Tool '{tool_name}' not found in registry"
@@ -157,15 +165,11 @@ class ToolExecutor:
         
         try:
             # Get tool instance and execute
-            tool = get_tool(tool_name)
+            if tool is None:
+                tool = get_tool(tool_name)
             result = tool.run(**parameters)
             
-            return {
-                "success": result.success,
-                "result": result.result,
-                "error": result.error,
-                "metadata": result.metadata
-            }
+            return result.to_dict()
             
         except ToolError as e:
             self.logger.error(f"Tool error executing '{tool_name}': {e.message}")
@@ -191,47 +195,138 @@ class ToolExecutor:
         Returns:
             Tuple of (final_response, tool_results)
         """
-        tool_results = []
+        remaining_response, tool_calls = self._collect_tool_calls(response, max_tool_calls)
+        results = [self.execute_tool(tool_call) for tool_call in tool_calls]
+        return self._apply_tool_results(remaining_response, tool_calls, results)
+    
+    async def process_agent_response_async(
+        self,
+        response: str,
+        max_tool_calls: int = 3
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """Process agent response, executing its tool calls concurrently.
+        
+        Tools run in worker threads, so total latency is bounded by the
+        slowest call rather than the sum of all calls.
+        
+        Args:
+            response: Agent response text
+            max_tool_calls: Maximum number of tool calls to process
+            
+        Returns:
+            Tuple of (final_response, tool_results)
+        """
+        remaining_response, tool_calls = self._collect_tool_calls(response, max_tool_calls)
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self.execute_tool, tool_call) for tool_call in tool_calls)
+        )
+        return self._apply_tool_results(remaining_response, tool_calls, list(results))
+    
+    def process_stream(self, chunks: Iterable[str]) -> Tuple[str, List[Dict[str, Any]]]:
+        """Process a streamed agent response, acting on the first tool call early.
+        
+        Chunks are consumed only until a complete tool call is found. The
+        call is then executed without waiting for the rest of the response,
+        and the stream is closed (if it supports it) to abort the request.
+        
+        Args:
+            chunks: Iterable of response text chunks, e.g. from generate_stream
+            
+        Returns:
+            Tuple of (final_response, tool_results)
+        """
+        text = ""
+        # Where to resume looking for the start of a tool call, and where the
+        # one found so far starts (-1 until one is seen)
+        scan_pos = 0
+        start_pos = -1
+        
+        for chunk in chunks:
+            text += chunk
+            
+            if start_pos < 0:
+                match = _TOOL_CALL_START_RE.search(text, scan_pos)
+                if match is None:
+                    # Only the last brace can still grow into a match
+                    brace = text.rfind('{', scan_pos)
+                    scan_pos = brace if brace >= 0 else len(text)
+                    continue
+                start_pos = match.start()
+            
+            # A tool call can only become complete when its closing brace arrives
+            if '}' not in chunk:
+                continue
+            
+            # Until the stream ends, unparseable JSON may just be incomplete
+            tool_call, json_end = self._parse_tool_call(text, start_pos, quiet=True)
+            if tool_call is None:
+                if json_end >= 0:
+                    # A complete but invalid tool call; look past it
+                    scan_pos, start_pos = json_end, -1
+                continue
+            
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+            
+            result = self.execute_tool(tool_call)
+            return self._apply_tool_results(text[:start_pos] + text[json_end:], [tool_call], [result])
+        
+        return self.process_agent_response(text)
+    
+    def _collect_tool_calls(self, response: str, max_tool_calls: int) -> Tuple[str, List[Dict[str, Any]]]:
+        """Extract tool calls from a response and strip their JSON from the text.
+        
+        Args:
+            response: Agent response text
+            max_tool_calls: Maximum number of tool calls to extract
+            
+        Returns:
+            Tuple of (response without tool call JSON, tool calls in order)
+        """
+        tool_calls = []
         current_response = response
         
-        for i in range(max_tool_calls):
+        for _ in range(max_tool_calls):
             # Extract tool call from current response
-            tool_call = self.extract_tool_call(current_response)
+            tool_call, start_pos, json_end = self._find_tool_call(current_response)
             
             if not tool_call:
                 # No more tool calls found
                 break
             
-            # Execute the tool
-            tool_result = self.execute_tool(tool_call)
+            tool_calls.append(tool_call)
+            
+            # Remove the tool call JSON from response
+            current_response = current_response[:start_pos] + current_response[json_end:]
+        
+        return current_response, tool_calls
+    
+    def _apply_tool_results(
+        self,
+        response: str,
+        tool_calls: List[Dict[str, Any]],
+        results: List[Dict[str, Any]]
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """Append tool results to the response text.
+        
+        Args:
+            response: Agent response text with tool call JSON removed
+            tool_calls: Executed tool calls, in order
+            results: Execution results matching tool_calls
+            
+        Returns:
+            Tuple of (final_response, tool_results)
+        """
+        tool_results = []
+        current_response = response
+        
+        for index, (tool_call, tool_result) in enumerate(zip(tool_calls, results)):
             tool_results.append({
                 "tool_call": tool_call,
                 "result": tool_result
             })
             
-            # Remove the tool call JSON from response and add result
-            # Use the same approach as extract_tool_call to find and remove the JSON
-            start_pattern = r'\{"tool_call"\s*:'
-            match = re.search(start_pattern, current_response, re.IGNORECASE)
-            
-            if match:
-                start_pos = match.start()
-                brace_count = 0
-                json_end = -1
-                
-                for i, char in enumerate(current_response[start_pos:], start_pos):
-                    if char == '{':
-                        brace_count += 1
-                    elif char == '}':
-                        brace_count -= 1
-                        if brace_count == 0:
-                            json_end = i + 1
-                            break
-                
-                if json_end != -1:
-                    # Remove the JSON from the response
-                    current_response = current_response[:start_pos] + current_response[json_end:]
-            
             # Add tool result to response
             if tool_result["success"]:
                 result_text = f"\n[Tool Result: {tool_result['result']}]\n"
@@ -240,7 +335,7 @@ class ToolExecutor:
             
             current_response = current_response.strip() + result_text
             
-            self.logger.info(f"Tool call {i+1} executed: {tool_call['name']}")
+            self.logger.info(f"Tool call {index + 1} executed: {tool_call['name']}")
         
         return current_response.strip(), tool_results
     
@@ -250,4 +345,51 @@ class ToolExecutor:
         Returns:
             List of tool names
         """
-        return list(self.available_tools.keys())
\ No newline at end of file
+        return list(self.available_tools.keys())
+
+
+def _render_tools_context(tool_names: Tuple[str, ...]) -> str:
+    """Render the tools context for a set of tool names.
+    
+    Args:
+        tool_names: Names of the tools available to the agent, in order
+        
+    Returns:
+        Formatted string describing available tools
+    """
+    if not tool_names:
+        return "No tools are available."
+    
+    parts = ["Available tools:\n"]
+    
+    for tool_name in tool_names:
+        if not has_tool(tool_name):
+            continue
+            
+        try:
+            tool = get_tool(tool_name)
+            parts.append(f"- {tool_name}: {tool.description}\n")
+            
+            # Add parameter information
+            schema = tool.parameters_schema
+            if schema.get("properties"):
+                params_info = []
+                for param, param_schema in schema["properties"].items():
+                    param_desc = param_schema.get("description", "")
+                    param_type = param_schema.get("type", "any")
+                    param_info = f"{param} ({param_type})"
+                    if param_desc:
+                        param_info += f": {param_desc}"
+                    params_info.append(param_info)
+                
+                parts.append(f"  Parameters: {', '.join(params_info)}\n")
+            
+        except Exception as e:
+            logger.error(f"Error getting info for tool '{tool_name}': {e}")
+            parts.append(f"- {tool_name}: Error loading tool\n")
+    
+    parts.append("\nTo use a tool, respond with JSON in this format:\n")
+    parts.append('{"tool_call": {"name": "tool_name", "parameters": {"param1": "value1"}}}\n')
+    parts.append("After using a tool, I will provide the result and you can continue your response.\n")
+    
+    return "".join(parts)
@@ -1,6 +1,24 @@
 """Model providers for AgentKit."""
 
-from .bedrock_provider import BedrockProvider
-from .goose_provider import GooseProvider
+import importlib
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["BedrockProvider", "GooseProvider"]
\ No newline at end of file
+if TYPE_CHECKING:
+    from .bedrock_provider import BedrockProvider
+    from .goose_provider import GooseProvider
+
+# Providers are imported on first access (PEP 562) so that using one
+# backend does not pull in the SDK of the other
+_PROVIDER_MODULES = {
+    "BedrockProvider": ".bedrock_provider",
+    "GooseProvider": ".goose_provider",
+}
+
+__all__ = ["BedrockProvider", "GooseProvider"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _PROVIDER_MODULES:
+        module = importlib.import_module(_PROVIDER_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
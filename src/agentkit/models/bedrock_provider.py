@@ -1,33 +1,160 @@
 """AWS Bedrock model provider for AgentKit."""
 
+import importlib
+import importlib.util
 import json
 import time
 import os
-from typing import Optional, Dict, Any
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Final, Optional, Dict, Any, Iterator, Set, Tuple
 
+# Only the exception classes are imported up front: boto3 and
+# botocore.config add well over 100 ms to every cold start, so they are
+# imported when the first client is created
 try:
-    import boto3
     from botocore.exceptions import ClientError, BotoCoreError, NoCredentialsError
-    BOTO3_AVAILABLE = True
+    BOTO3_AVAILABLE = importlib.util.find_spec("boto3") is not None
 except ImportError:
     BOTO3_AVAILABLE = False
 
-from ..core.model_interface import ModelProvider, ModelError
+if TYPE_CHECKING:
+    import boto3
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from ..core.model_interface import ModelProvider, ModelError, _retry_delays_from_config
 from ..core.logger import get_logger
 from ..core.config import Config
+from ..core.response_cache import ResponseCache, get_response_cache
 
 logger = get_logger(__name__)
 
+# Bedrock Runtime clients keyed by (region, AWS profile), shared across
+# provider instances so their connection pools stay warm
+_client_cache: Dict[Tuple[str, Optional[str]], Any] = {}
+_client_cache_lock = threading.Lock()
+
+# Exact request shapes (model ID, system and task prompt characters,
+# max_tokens) that Bedrock rejected as too long, so resending the same
+# request fails without a network call. Characters are a poor proxy for
+# tokens, so only identical shapes are rejected, never longer prompts
+_REJECTED_SHAPES_MAXSIZE = 128
+_rejected_shapes: "OrderedDict[Tuple[str, int, int, int], None]" = OrderedDict()
+_rejected_shapes_lock = threading.Lock()
+
+# Bedrock model IDs that rejected a streaming request; generate_stream
+# falls back to a single non-streaming response for them
+_no_stream_models: Set[str] = set()
+
+# boto3 sessions keyed by AWS profile. Creating a session loads botocore's
+# service models from disk, so one is shared by all clients of a profile
+_session_cache: Dict[Optional[str], Any] = {}
+
+# Attempts per request, including the first, before an error is raised
+MAX_ATTEMPTS = 3
+
+# botocore's adaptive retry mode retries throttling and network errors
+# with jittered backoff, and rate limits the client once Bedrock starts
+# throttling. It treats model timeouts as client faults and does not retry
+# them, so BedrockProvider.generate does. Request parameters are always
+# built by the provider, so botocore's per-call validation against the
+# service model is skipped
+_CLIENT_CONFIG_OPTIONS = {
+    "retries": {"mode": "adaptive", "total_max_attempts": MAX_ATTEMPTS},
+    "parameter_validation": False,
+    "max_pool_connections": 64,
+    "tcp_keepalive": True,
+    # Fail fast on an unreachable endpoint (botocore waits 60 s by default);
+    # reads keep the 60 s default since long generations stream slowly
+    "connect_timeout": 3.0,
+    "read_timeout": 60.0,
+}
+
+_NO_CREDENTIALS_MESSAGE = (
+    "AWS credentials not found. Please configure credentials using:\n"
+    "1. Environment variables: AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, AWS_REGION\n"
+    "2. AWS CLI: aws configure\n"
+    "3. IAM role (for Lambda/EC2)\n"
+    "4. AWS credentials file"
+)
+
+
+def clear_client_cache() -> None:
+    """Discard shared Bedrock Runtime clients and sessions, e.g. after credentials change."""
+    with _client_cache_lock:
+        _client_cache.clear()
+        _session_cache.clear()
+
+
+def clear_rejected_prompt_cache() -> None:
+    """Forget request shapes that Bedrock rejected as too long."""
+    with _rejected_shapes_lock:
+        _rejected_shapes.clear()
+
+
+def _get_session(profile: Optional[str]) -> Any:
+    """Return the shared boto3 session for an AWS profile.
+    
+    Must be called with _client_cache_lock held.
+    
+    Args:
+        profile: Value of AWS_PROFILE, or None for the default chain
+        
+    Returns:
+        boto3 Session
+    """
+    session = _session_cache.get(profile)
+    if session is None:
+        # Let boto3 handle credential discovery automatically
+        # It will check environment variables, AWS CLI config, IAM roles, etc.
+        session = importlib.import_module("boto3").Session()
+        _session_cache[profile] = session
+    return session
+
+
+def __getattr__(name: str) -> Any:
+    """Import boto3 on attribute access (PEP 562).
+    
+    Keeps ``bedrock_provider.boto3`` available without importing it when
+    this module loads.
+    """
+    if name == "boto3":
+        return importlib.import_module(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Mapping from our model names to Bedrock model IDs
+_MODEL_MAPPING: Final[Dict[str, str]] = {
+    "claude-3-opus": "anthropic.claude-3-opus-20240229-v1:0",
+    "claude-3-sonnet": "anthropic.claude-3-sonnet-20240229-v1:0",
+    "claude-3-haiku": "anthropic.claude-3-haiku-20240307-v1:0"
+}
+
+# Listed in the unsupported-model error
+_AVAILABLE_MODELS: Final[str] = ", ".join(_MODEL_MAPPING)
+
 
 class BedrockProvider(ModelProvider):
     """AWS Bedrock model provider for Claude models."""
     
-    # Mapping from our model names to Bedrock model IDs
-    MODEL_MAPPING = {
-        "claude-3-opus": "anthropic.claude-3-opus-20240229-v1:0",
-        "claude-3-sonnet": "anthropic.claude-3-sonnet-20240229-v1:0",
-        "claude-3-haiku": "anthropic.claude-3-haiku-20240307-v1:0"
-    }
+    MODEL_MAPPING = _MODEL_MAPPING
+    
+    # Fail-fast cap on system + task prompt characters: a 200k token
+    # context window at roughly four characters per token
+    MAX_PROMPT_CHARS = 800_000
+    
+    # Bedrock model IDs that accept cache_control blocks (prompt caching)
+    PROMPT_CACHE_MODELS = frozenset({
+        "anthropic.claude-3-5-haiku-20241022-v1:0",
+        "anthropic.claude-3-7-sonnet-20250219-v1:0",
+        "anthropic.claude-sonnet-4-20250514-v1:0",
+        "anthropic.claude-opus-4-20250514-v1:0",
+    })
     
     def __init__(self, model_name: str, region: Optional[str] = None, config: Optional[Config] = None):
         """Initialize Bedrock provider.
@@ -47,20 +174,43 @@ class BedrockProvider(ModelProvider):
                 "boto3 not available. Install with: pip install boto3"
             )
         
-        if model_name not in self.MODEL_MAPPING:
-            available = ", ".join(self.MODEL_MAPPING.keys())
+        bedrock_model_id = _MODEL_MAPPING.get(model_name)
+        if bedrock_model_id is None:
             raise ModelError(
                 f"Unsupported Bedrock model: {model_name}. "
-                f"Available models: {available}"
+                f"Available models: {_AVAILABLE_MODELS}"
             )
         
         self.config = config or Config()
+        self.retry_base_delay, self.retry_max_delay = _retry_delays_from_config(self.config)
         self.region = region or os.getenv("AWS_REGION", "us-east-1")
-        self.bedrock_model_id = self.MODEL_MAPPING[model_name]
+        self.bedrock_model_id = bedrock_model_id
+        
+        # Opt-in, since cache writes are billed above the normal input rate
+        prompt_cache_requested = self.config.get("AGENTKIT_PROMPT_CACHE") == "1"
+        self.prompt_cache_enabled = (
+            prompt_cache_requested and self.bedrock_model_id in self.PROMPT_CACHE_MODELS
+        )
+        if prompt_cache_requested and not self.prompt_cache_enabled:
+            self.logger.warning(
+                f"AGENTKIT_PROMPT_CACHE is set, but {self.model_name} "
+                f"({self.bedrock_model_id}) does not support prompt caching; ignoring it"
+            )
+        
+        try:
+            self.response_cache = get_response_cache(self.config)
+        except ValueError as e:
+            raise ModelError(str(e), e)
+        
         self.client = self._create_client()
     
     def _create_client(self) -> Any:
-        """Create Bedrock Runtime client with AWS credentials.
+        """Get a Bedrock Runtime client for this provider's region.
+        
+        Clients are created once per region and AWS profile and reused by
+        later instances; all clients of a profile share one boto3 session.
+        Credentials are not checked up front; problems
+        surface on the first generate call.
         
         Returns:
             Configured boto3 Bedrock Runtime client
@@ -68,68 +218,89 @@ class BedrockProvider(ModelProvider):
         Raises:
             ModelError: If client creation fails
         """
+        profile = os.getenv("AWS_PROFILE")
+        cache_key = (self.region, profile)
+        
         try:
-            # Let boto3 handle credential discovery automatically
-            # It will check environment variables, AWS CLI config, IAM roles, etc.
-            session = boto3.Session()
-            client = session.client(
-                service_name="bedrock-runtime",
-                region_name=self.region
-            )
-            
-            # Test credentials by listing foundation models (or attempting a basic call)
-            # This will fail fast if credentials are invalid
-            try:
-                # Make a test call to validate credentials and region
-                client.list_foundation_models()
-                self.logger.info(f"Successfully connected to Bedrock in region {self.region}")
-            except ClientError as e:
-                error_code = e.response.get('Error', {}).get('Code', 'Unknown')
-                if error_code == 'UnauthorizedOperation':
-                    raise ModelError(
-                        f"Insufficient permissions for Bedrock in region {self.region}. "
-                        "Ensure your AWS credentials have bedrock:InvokeModel permissions."
+            with _client_cache_lock:
+                client = _client_cache.get(cache_key)
+                if client is None:
+                    from botocore.config import Config as BotoConfig
+                    
+                    client = _get_session(profile).client(
+                        service_name="bedrock-runtime",
+                        region_name=self.region,
+                        config=BotoConfig(**_CLIENT_CONFIG_OPTIONS)
                     )
-                else:
-                    raise ModelError(f"Failed to connect to Bedrock: {str(e)}")
-            
-            return client
+                    _client_cache[cache_key] = client
+                return client
             
         except NoCredentialsError:
-            raise ModelError(
-                "AWS credentials not found. Please configure credentials using:\n"
-                "1. Environment variables: AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, AWS_REGION\n"
-                "2. AWS CLI: aws configure\n"
-                "3. IAM role (for Lambda/EC2)\n"
-                "4. AWS credentials file"
-            )
+            raise ModelError(_NO_CREDENTIALS_MESSAGE)
         except Exception as e:
             raise ModelError(f"Failed to create Bedrock client: {str(e)}", e)
     
-    def _prepare_request_body(self, system_prompt: str, task_prompt: str, max_tokens: int) -> str:
+    def _prepare_request_body(
+        self,
+        system_prompt: str,
+        task_prompt: str,
+        max_tokens: int,
+        cache_prefix_len: int = 0
+    ) -> bytes:
         """Prepare request body for Bedrock Claude model.
         
+        With prompt caching enabled, the system prompt (and optionally a
+        stable prefix of the task prompt) is marked with cache_control so
+        repeated requests reuse the prefilled prefix.
+        
         Args:
             system_prompt: System instruction for Claude
             task_prompt: User task/query for Claude  
             max_tokens: Maximum tokens to generate
+            cache_prefix_len: Length of a task prompt prefix shared between
+                requests, cached as its own block when prompt caching is on
             
         Returns:
-            JSON string for Bedrock request body
+            UTF-8 encoded JSON for the Bedrock request body
         """
+        system: Any = system_prompt
+        content: Any = task_prompt
+        
+        if self.prompt_cache_enabled:
+            system = [{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }]
+            
+            if 0 < cache_prefix_len < len(task_prompt):
+                content = [
+                    {
+                        "type": "text",
+                        "text": task_prompt[:cache_prefix_len],
+                        "cache_control": {"type": "ephemeral"}
+                    },
+                    {
+                        "type": "text",
+                        "text": task_prompt[cache_prefix_len:]
+                    }
+                ]
+        
         request_body = {
             "anthropic_version": "bedrock-2023-05-31",
             "max_tokens": max_tokens,
-            "system": system_prompt,
+            "system": system,
             "messages": [
                 {
                     "role": "user",
-                    "content": task_prompt
+                    "content": content
                 }
             ]
         }
         
-        return json.dumps(request_body)
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(request_body)
+        return json.dumps(request_body, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
     
     def _parse_response(self, response_body: bytes) -> str:
         """Parse Bedrock response body.
@@ -144,7 +315,14 @@ class BedrockProvider(ModelProvider):
             ModelError: If response parsing fails
         """
         try:
-            response_data = json.loads(response_body.decode('utf-8'))
+            response_data = orjson.loads(response_body) if ORJSON_AVAILABLE else json.loads(response_body)
+            
+            usage = response_data.get('usage') or {}
+            if 'cache_read_input_tokens' in usage or 'cache_creation_input_tokens' in usage:
+                self.logger.debug(
+                    f"Prompt cache: {usage.get('cache_read_input_tokens', 0)} tokens read, "
+                    f"{usage.get('cache_creation_input_tokens', 0)} tokens written"
+                )
             
             # Claude response format in Bedrock
             if 'content' in response_data:
@@ -169,7 +347,8 @@ class BedrockProvider(ModelProvider):
         self, 
         system_prompt: str, 
         task_prompt: str, 
-        max_tokens: int = 1024
+        max_tokens: int = 1024,
+        cache_prefix_len: int = 0
     ) -> str:
         """Generate response using Bedrock Claude model.
         
@@ -177,6 +356,8 @@ class BedrockProvider(ModelProvider):
             system_prompt: System instruction for Claude
             task_prompt: User task/query for Claude
             max_tokens: Maximum tokens to generate
+            cache_prefix_len: Length of a task prompt prefix shared between
+                requests, for prompt caching
             
         Returns:
             Generated text response
@@ -184,24 +365,28 @@ class BedrockProvider(ModelProvider):
         Raises:
             ModelError: If generation fails
         """
-        if not system_prompt or not task_prompt:
-            raise ModelError("Both system_prompt and task_prompt are required")
-        
-        if max_tokens <= 0 or max_tokens > 4096:
-            raise ModelError("max_tokens must be between 1 and 4096")
+        self._validate_request(system_prompt, task_prompt, max_tokens)
         
         self.logger.info(f"Generating response with Bedrock {self.model_name} in {self.region}")
         self.logger.debug(f"System prompt length: {len(system_prompt)}")
         self.logger.debug(f"Task prompt length: {len(task_prompt)}")
         
         # Prepare request
-        request_body = self._prepare_request_body(system_prompt, task_prompt, max_tokens)
+        request_body = self._prepare_request_body(system_prompt, task_prompt, max_tokens, cache_prefix_len)
         
-        # Retry logic for transient failures
-        max_retries = 3
-        base_delay = 1.0
+        # The request body holds every input that affects the response
+        cache_key = ResponseCache.make_key("bedrock", self.bedrock_model_id, request_body)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            self.logger.info("Returning cached response")
+            return cached
+        if self.response_cache.policy == "replay":
+            raise ModelError("No cached response for this request (response cache is in replay mode)")
         
-        for attempt in range(max_retries):
+        # Throttling and network errors are retried by botocore (adaptive
+        # mode). It does not retry model timeouts, which are client faults,
+        # so those are retried here; other errors reaching here are final
+        for attempt in range(MAX_ATTEMPTS):
             try:
                 start_time = time.time()
                 
@@ -217,57 +402,206 @@ class BedrockProvider(ModelProvider):
                 
                 # Parse response
                 response_body = response['body'].read()
-                return self._parse_response(response_body)
-                
+                text = self._parse_response(response_body)
+                self.response_cache.put(cache_key, text)
+                return text
+            
             except ClientError as e:
                 error_code = e.response.get('Error', {}).get('Code', 'Unknown')
                 error_message = e.response.get('Error', {}).get('Message', str(e))
                 
                 if error_code == 'ThrottlingException':
-                    if attempt < max_retries - 1:
-                        delay = base_delay * (2 ** attempt)  # Exponential backoff
-                        self.logger.warning(f"Throttled, retrying in {delay}s (attempt {attempt + 1}/{max_retries})")
-                        time.sleep(delay)
-                        continue
-                    else:
-                        raise ModelError(f"Rate limit exceeded after {max_retries} attempts", e)
+                    raise ModelError(f"Rate limit exceeded after {MAX_ATTEMPTS} attempts", e)
                 
                 elif error_code == 'ModelTimeoutException':
-                    if attempt < max_retries - 1:
-                        delay = base_delay * (2 ** attempt)
-                        self.logger.warning(f"Model timeout, retrying in {delay}s (attempt {attempt + 1}/{max_retries})")
+                    if attempt < MAX_ATTEMPTS - 1:
+                        delay = self._backoff(attempt)
+                        self.logger.warning(f"Model timeout, retrying in {delay:.2f}s (attempt {attempt + 1}/{MAX_ATTEMPTS})")
                         time.sleep(delay)
                         continue
-                    else:
-                        raise ModelError(f"Model timeout after {max_retries} attempts", e)
+                    raise ModelError(f"Model timeout after {MAX_ATTEMPTS} attempts", e)
+                
+                elif error_code == 'UnauthorizedOperation':
+                    raise ModelError(
+                        f"Insufficient permissions for Bedrock in region {self.region}. "
+                        "Ensure your AWS credentials have bedrock:InvokeModel permissions.",
+                        e
+                    )
                 
                 elif error_code == 'ValidationException':
-                    # Don't retry validation errors
+                    if 'too long' in error_message.lower():
+                        shape = self._request_shape(system_prompt, task_prompt, max_tokens)
+                        with _rejected_shapes_lock:
+                            _rejected_shapes[shape] = None
+                            _rejected_shapes.move_to_end(shape)
+                            if len(_rejected_shapes) > _REJECTED_SHAPES_MAXSIZE:
+                                _rejected_shapes.popitem(last=False)
+                    
                     raise ModelError(f"Invalid request: {error_message}", e)
                 
                 elif error_code == 'AccessDeniedException':
-                    # Don't retry permission errors
                     raise ModelError(f"Access denied: {error_message}", e)
                 
                 elif error_code == 'ResourceNotFoundException':
-                    # Don't retry model not found errors
                     raise ModelError(f"Model not found: {error_message}", e)
                 
                 else:
-                    # Don't retry for other client errors
                     raise ModelError(f"Bedrock API error: {error_message}", e)
             
+            except NoCredentialsError as e:
+                raise ModelError(_NO_CREDENTIALS_MESSAGE, e)
+            
             except BotoCoreError as e:
-                if attempt < max_retries - 1:
-                    delay = base_delay * (2 ** attempt)
-                    self.logger.warning(f"Network error, retrying in {delay}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(delay)
-                    continue
-                else:
-                    raise ModelError(f"Network error after {max_retries} attempts: {str(e)}", e)
+                raise ModelError(f"Network error after {MAX_ATTEMPTS} attempts: {str(e)}", e)
+            
+            except ModelError:
+                raise
             
             except Exception as e:
-                # Don't retry for unexpected errors
                 raise ModelError(f"Unexpected error during generation: {str(e)}", e)
+    
+    def generate_stream(
+        self,
+        system_prompt: str,
+        task_prompt: str,
+        max_tokens: int = 1024,
+        cache_prefix_len: int = 0
+    ) -> Iterator[str]:
+        """Stream a response from Bedrock as text chunks.
+        
+        Arguments are validated immediately; the request is sent when
+        iteration starts. Streaming requests are not retried. Models that
+        reject streaming, and requests going through the response cache,
+        yield the generate() result as a single chunk.
         
-        raise ModelError(f"Failed to generate response after {max_retries} attempts")
\ No newline at end of file
+        Args:
+            system_prompt: System instruction for Claude
+            task_prompt: User task/query for Claude
+            max_tokens: Maximum tokens to generate
+            cache_prefix_len: Length of a task prompt prefix shared between
+                requests, for prompt caching
+        
+        Returns:
+            Iterator over generated text chunks
+        
+        Raises:
+            ModelError: If the arguments are invalid or streaming fails
+        """
+        self._validate_request(system_prompt, task_prompt, max_tokens)
+        
+        self.logger.info(f"Streaming response with Bedrock {self.model_name} in {self.region}")
+        
+        return self._stream_chunks(system_prompt, task_prompt, max_tokens, cache_prefix_len)
+    
+    def _validate_request(self, system_prompt: str, task_prompt: str, max_tokens: int) -> None:
+        """Validate generation arguments.
+        
+        Raises:
+            ModelError: If the prompts are empty or max_tokens is out of range
+        """
+        if not system_prompt or not task_prompt:
+            raise ModelError("Both system_prompt and task_prompt are required")
+        
+        if max_tokens <= 0 or max_tokens > 4096:
+            raise ModelError("max_tokens must be between 1 and 4096")
+        
+        prompt_chars = len(system_prompt) + len(task_prompt)
+        if prompt_chars > self.MAX_PROMPT_CHARS:
+            raise ModelError(
+                f"Prompt exceeds the context window: {prompt_chars} characters "
+                f"(limit {self.MAX_PROMPT_CHARS})"
+            )
+        
+        shape = self._request_shape(system_prompt, task_prompt, max_tokens)
+        with _rejected_shapes_lock:
+            rejected = shape in _rejected_shapes
+            if rejected:
+                _rejected_shapes.move_to_end(shape)
+        
+        if rejected:
+            raise ModelError(
+                f"Prompt exceeds the context window: {prompt_chars} characters "
+                f"(Bedrock already rejected this request for {self.model_name})"
+            )
+    
+    def _request_shape(self, system_prompt: str, task_prompt: str, max_tokens: int) -> Tuple[str, int, int, int]:
+        """Key a request by model and sizes for the rejected-shape cache."""
+        return (self.bedrock_model_id, len(system_prompt), len(task_prompt), max_tokens)
+    
+    def _stream_chunks(
+        self,
+        system_prompt: str,
+        task_prompt: str,
+        max_tokens: int,
+        cache_prefix_len: int
+    ) -> Iterator[str]:
+        """Yield text chunks from a Bedrock streaming request."""
+        # The response cache only holds complete responses
+        if self.bedrock_model_id in _no_stream_models or self.response_cache.policy != "disabled":
+            yield self.generate(system_prompt, task_prompt, max_tokens, cache_prefix_len)
+            return
+        
+        request_body = self._prepare_request_body(system_prompt, task_prompt, max_tokens, cache_prefix_len)
+        
+        try:
+            start_time = time.time()
+            
+            response = self.client.invoke_model_with_response_stream(
+                modelId=self.bedrock_model_id,
+                body=request_body,
+                contentType="application/json",
+                accept="application/json"
+            )
+        
+        except ClientError as e:
+            error = e.response.get('Error', {})
+            error_message = error.get('Message', str(e))
+            
+            if error.get('Code') == 'ValidationException' and 'stream' in error_message.lower():
+                self.logger.info(f"{self.bedrock_model_id} does not support streaming, using generate")
+                _no_stream_models.add(self.bedrock_model_id)
+                yield self.generate(system_prompt, task_prompt, max_tokens, cache_prefix_len)
+                return
+            
+            raise ModelError(f"Bedrock API error while streaming: {error_message}", e)
+        
+        except NoCredentialsError as e:
+            raise ModelError(_NO_CREDENTIALS_MESSAGE, e)
+        
+        except BotoCoreError as e:
+            raise ModelError(f"Network error while streaming: {str(e)}", e)
+        
+        loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+        
+        try:
+            for event in response['body']:
+                chunk = event.get('chunk')
+                if chunk is None:
+                    # Errors arrive as events, e.g. {'throttlingException': {'message': ...}}
+                    for name, details in event.items():
+                        raise ModelError(f"Bedrock stream error ({name}): {details.get('message', '')}")
+                    continue
+                
+                # Each event is its own JSON document, already framed by
+                # botocore. Only text deltas matter, so the other events
+                # (message start/stop, block start/stop, pings) are skipped
+                # without decoding them
+                chunk_bytes = chunk['bytes']
+                if b'"text_delta"' not in chunk_bytes:
+                    continue
+                
+                data = loads(chunk_bytes)
+                if data.get('type') == 'content_block_delta':
+                    text = data.get('delta', {}).get('text')
+                    if text:
+                        yield text
+            
+            duration = time.time() - start_time
+            self.logger.info(f"Streamed response in {duration:.2f}s")
+        
+        except ModelError:
+            raise
+        except BotoCoreError as e:
+            raise ModelError(f"Network error while streaming: {str(e)}", e)
+        except Exception as e:
+            raise ModelError(f"Unexpected error during streaming: {str(e)}", e)
\ No newline at end of file
@@ -1,9 +1,11 @@
 """Goose multi-model orchestration provider for AgentKit."""
 
+import importlib.util
 import json
 import time
 import os
-from typing import Optional, Dict, Any
+import weakref
+from typing import Final, Optional, Dict, Any, Iterator
 
 try:
     import httpx
@@ -11,37 +13,101 @@ try:
 except ImportError:
     HTTPX_AVAILABLE = False
 
-from ..core.model_interface import ModelProvider, ModelError
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# httpx only speaks HTTP/2 when the h2 package is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Connection pool sized for concurrent generation (e.g. generate_batch)
+POOL_MAX_CONNECTIONS = 100
+POOL_KEEPALIVE_EXPIRY = 300.0
+
+from ..core.model_interface import ModelProvider, ModelError, _parse_retry_after, _retry_delays_from_config
 from ..core.logger import get_logger
 from ..core.config import Config
+from ..core.response_cache import ResponseCache, get_response_cache
 
 logger = get_logger(__name__)
 
+# Request fields that do not vary between calls; copied per request, which
+# is cheaper than building the whole body from a literal
+_BASE_REQUEST_BODY: Final[Dict[str, Any]] = {
+    "model": None,
+    "messages": None,
+    "max_tokens": None,
+    "temperature": 0.7,
+    "stream": False,
+}
+
+# Other places a Goose response may hold the generated text, tried in
+# order when it is not an OpenAI-compatible chat completion
+_FALLBACK_TEXT_PATHS = (
+    ("choices", 0, "text"),
+    ("content",),
+    ("text",),
+)
+
+
+def _dig(data: Any, path: tuple) -> Any:
+    """Follow a path of keys and indexes into parsed JSON.
+    
+    Returns:
+        The value at the path, or None if any step is missing
+    """
+    for key in path:
+        try:
+            data = data[key]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return data
+
+
+def _encode_json(data: Dict[str, Any]) -> bytes:
+    """Serialize a request body to compact JSON with sorted keys.
+    
+    The stdlib fallback produces the same bytes as orjson, so the payload
+    can double as a response cache key either way.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# Goose-supported models (model agnostic - users can specify any model)
+# This is not an exhaustive list, just common examples
+_COMMON_MODELS: Final[Dict[str, str]] = {
+    # OpenAI models
+    "gpt-4": "gpt-4",
+    "gpt-4-turbo": "gpt-4-turbo",
+    "gpt-4o": "gpt-4o",
+    "gpt-4o-mini": "gpt-4o-mini",
+    "gpt-3.5-turbo": "gpt-3.5-turbo",
+    
+    # Anthropic models
+    "claude-3-opus": "claude-3-opus-20240229",
+    "claude-3-sonnet": "claude-3-sonnet-20240229",
+    "claude-3-haiku": "claude-3-haiku-20240307",
+    "claude-3-5-sonnet": "claude-3-5-sonnet-20240620",
+    
+    # Other models (examples)
+    "gemini-pro": "gemini-pro",
+    "llama-2-70b": "llama-2-70b-chat",
+    "mixtral-8x7b": "mixtral-8x7b-instruct",
+}
+
 
 class GooseProvider(ModelProvider):
     """Goose multi-model orchestration provider."""
     
-    # Goose-supported models (model agnostic - users can specify any model)
-    # This is not an exhaustive list, just common examples
-    COMMON_MODELS = {
-        # OpenAI models
-        "gpt-4": "gpt-4",
-        "gpt-4-turbo": "gpt-4-turbo",
-        "gpt-4o": "gpt-4o",
-        "gpt-4o-mini": "gpt-4o-mini",
-        "gpt-3.5-turbo": "gpt-3.5-turbo",
-        
-        # Anthropic models
-        "claude-3-opus": "claude-3-opus-20240229",
-        "claude-3-sonnet": "claude-3-sonnet-20240229",
-        "claude-3-haiku": "claude-3-haiku-20240307",
-        "claude-3-5-sonnet": "claude-3-5-sonnet-20240620",
-        
-        # Other models (examples)
-        "gemini-pro": "gemini-pro",
-        "llama-2-70b": "llama-2-70b-chat",
-        "mixtral-8x7b": "mixtral-8x7b-instruct",
-    }
+    COMMON_MODELS = _COMMON_MODELS
+    
+    # Fail-fast cap on system + task prompt characters. Goose is model
+    # agnostic, so this allows the largest (~1M token) context windows
+    MAX_PROMPT_CHARS = 4_000_000
     
     def __init__(self, model_name: str, api_key: Optional[str] = None, 
                  base_url: Optional[str] = None, config: Optional[Config] = None):
@@ -64,6 +130,7 @@ class GooseProvider(ModelProvider):
             )
         
         self.config = config or Config()
+        self.retry_base_delay, self.retry_max_delay = _retry_delays_from_config(self.config)
         
         # API configuration
         self.api_key = api_key or os.getenv("GOOSE_API_KEY")
@@ -79,7 +146,15 @@ class GooseProvider(ModelProvider):
         # We don't restrict to a specific list to allow flexibility
         self.goose_model_name = self._resolve_model_name(model_name)
         
+        try:
+            self.response_cache = get_response_cache(self.config)
+        except ValueError as e:
+            raise ModelError(str(e), e)
+        
         self.client = self._create_client()
+        # Close the client when the provider is garbage collected or at
+        # interpreter exit, without relying on __del__ ordering
+        self._finalizer = weakref.finalize(self, self.client.close)
     
     def _resolve_model_name(self, model_name: str) -> str:
         """Resolve model name for Goose API.
@@ -91,8 +166,8 @@ class GooseProvider(ModelProvider):
             Resolved model name for Goose API
         """
         # Check if it's a known model with a specific mapping
-        if model_name in self.COMMON_MODELS:
-            resolved = self.COMMON_MODELS[model_name]
+        resolved = _COMMON_MODELS.get(model_name)
+        if resolved is not None:
             self.logger.info(f"Resolved model '{model_name}' to '{resolved}'")
             return resolved
         
@@ -116,10 +191,21 @@ class GooseProvider(ModelProvider):
                 "User-Agent": "AgentKit/1.0"
             }
             
+            # limits and http2 belong to the transport when one is passed
+            transport = httpx.HTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=POOL_MAX_CONNECTIONS,
+                    max_keepalive_connections=POOL_MAX_CONNECTIONS,
+                    keepalive_expiry=POOL_KEEPALIVE_EXPIRY
+                ),
+                retries=0
+            )
             client = httpx.Client(
                 base_url=self.base_url,
                 headers=headers,
-                timeout=30.0
+                transport=transport,
+                timeout=httpx.Timeout(60.0, connect=5.0)
             )
             
             # Test connection with a simple request
@@ -165,38 +251,39 @@ class GooseProvider(ModelProvider):
             self.logger.warning(f"Connection test failed: {str(e)}")
             # Don't fail completely - the API might still work for completions
     
-    def _prepare_request_body(self, system_prompt: str, task_prompt: str, max_tokens: int) -> Dict[str, Any]:
+    def _prepare_request_body(
+        self,
+        system_prompt: str,
+        task_prompt: str,
+        max_tokens: int,
+        stream: bool = False
+    ) -> Dict[str, Any]:
         """Prepare request body for Goose API.
         
         Args:
             system_prompt: System instruction for the model
             task_prompt: User task/query for the model
             max_tokens: Maximum tokens to generate
+            stream: Whether to request a server-sent events stream
             
         Returns:
             Request body dictionary
         """
         # OpenAI-compatible format (most common)
-        messages = []
+        request_body = _BASE_REQUEST_BODY.copy()
+        request_body["model"] = self.goose_model_name
+        request_body["max_tokens"] = max_tokens
         
         if system_prompt:
-            messages.append({
-                "role": "system",
-                "content": system_prompt
-            })
-        
-        messages.append({
-            "role": "user", 
-            "content": task_prompt
-        })
-        
-        request_body = {
-            "model": self.goose_model_name,
-            "messages": messages,
-            "max_tokens": max_tokens,
-            "temperature": 0.7,
-            "stream": False
-        }
+            request_body["messages"] = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": task_prompt}
+            ]
+        else:
+            request_body["messages"] = [{"role": "user", "content": task_prompt}]
+        
+        if stream:
+            request_body["stream"] = True
         
         return request_body
     
@@ -214,26 +301,21 @@ class GooseProvider(ModelProvider):
         """
         try:
             # OpenAI-compatible response format
-            if "choices" in response_data and len(response_data["choices"]) > 0:
-                choice = response_data["choices"][0]
-                
-                # Handle different response formats
-                if "message" in choice:
-                    return choice["message"]["content"].strip()
-                elif "text" in choice:
-                    return choice["text"].strip()
-            
-            # Alternative formats
-            if "content" in response_data:
-                return response_data["content"].strip()
-            
-            if "text" in response_data:
-                return response_data["text"].strip()
-            
-            raise ModelError("No text content found in Goose response")
-            
-        except Exception as e:
-            raise ModelError(f"Failed to parse Goose response: {str(e)}", e)
+            text = response_data["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError):
+            text = None
+        
+        # Alternative formats
+        if text is None:
+            for path in _FALLBACK_TEXT_PATHS:
+                text = _dig(response_data, path)
+                if text is not None:
+                    break
+        
+        if not isinstance(text, str):
+            raise ModelError("Failed to parse Goose response: No text content found in Goose response")
+        
+        return text.strip()
     
     def generate(
         self, 
@@ -254,11 +336,7 @@ class GooseProvider(ModelProvider):
         Raises:
             ModelError: If generation fails
         """
-        if not system_prompt or not task_prompt:
-            raise ModelError("Both system_prompt and task_prompt are required")
-        
-        if max_tokens <= 0 or max_tokens > 8192:
-            raise ModelError("max_tokens must be between 1 and 8192")
+        self._validate_request(system_prompt, task_prompt, max_tokens)
         
         self.logger.info(f"Generating response with Goose model {self.goose_model_name}")
         self.logger.debug(f"System prompt length: {len(system_prompt)}")
@@ -267,18 +345,29 @@ class GooseProvider(ModelProvider):
         # Prepare request
         request_body = self._prepare_request_body(system_prompt, task_prompt, max_tokens)
         
+        # Serialized once with sorted keys, so the payload doubles as the cache key
+        payload = _encode_json(request_body)
+        
+        # The request body holds every input that affects the response
+        cache_key = ResponseCache.make_key("goose", self.base_url, payload)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            self.logger.info("Returning cached response")
+            return cached
+        if self.response_cache.policy == "replay":
+            raise ModelError("No cached response for this request (response cache is in replay mode)")
+        
         # Retry logic for transient failures
         max_retries = 3
-        base_delay = 1.0
         
         for attempt in range(max_retries):
             try:
                 start_time = time.time()
                 
+                # The client sends Content-Type: application/json by default
                 response = self.client.post(
                     "/chat/completions",
-                    json=request_body,
-                    timeout=60.0
+                    content=payload
                 )
                 
                 duration = time.time() - start_time
@@ -286,14 +375,16 @@ class GooseProvider(ModelProvider):
                 
                 # Handle different response status codes
                 if response.status_code == 200:
-                    response_data = response.json()
-                    return self._parse_response(response_data)
+                    response_data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+                    text = self._parse_response(response_data)
+                    self.response_cache.put(cache_key, text)
+                    return text
                 
                 elif response.status_code == 429:
                     # Rate limiting
                     if attempt < max_retries - 1:
-                        delay = base_delay * (2 ** attempt)
-                        self.logger.warning(f"Rate limited, retrying in {delay}s (attempt {attempt + 1}/{max_retries})")
+                        delay = self._backoff(attempt, _parse_retry_after(getattr(response, "headers", None)))
+                        self.logger.warning(f"Rate limited, retrying in {delay:.2f}s (attempt {attempt + 1}/{max_retries})")
                         time.sleep(delay)
                         continue
                     else:
@@ -318,8 +409,8 @@ class GooseProvider(ModelProvider):
                 elif response.status_code >= 500:
                     # Server error - retry
                     if attempt < max_retries - 1:
-                        delay = base_delay * (2 ** attempt)
-                        self.logger.warning(f"Server error, retrying in {delay}s (attempt {attempt + 1}/{max_retries})")
+                        delay = self._backoff(attempt, _parse_retry_after(getattr(response, "headers", None)))
+                        self.logger.warning(f"Server error, retrying in {delay:.2f}s (attempt {attempt + 1}/{max_retries})")
                         time.sleep(delay)
                         continue
                     else:
@@ -330,8 +421,8 @@ class GooseProvider(ModelProvider):
                 
             except httpx.TimeoutException:
                 if attempt < max_retries - 1:
-                    delay = base_delay * (2 ** attempt)
-                    self.logger.warning(f"Request timeout, retrying in {delay}s (attempt {attempt + 1}/{max_retries})")
+                    delay = self._backoff(attempt)
+                    self.logger.warning(f"Request timeout, retrying in {delay:.2f}s (attempt {attempt + 1}/{max_retries})")
                     time.sleep(delay)
                     continue
                 else:
@@ -339,8 +430,8 @@ class GooseProvider(ModelProvider):
             
             except httpx.ConnectError as e:
                 if attempt < max_retries - 1:
-                    delay = base_delay * (2 ** attempt)
-                    self.logger.warning(f"Connection error, retrying in {delay}s (attempt {attempt + 1}/{max_retries})")
+                    delay = self._backoff(attempt)
+                    self.logger.warning(f"Connection error, retrying in {delay:.2f}s (attempt {attempt + 1}/{max_retries})")
                     time.sleep(delay)
                     continue
                 else:
@@ -352,10 +443,108 @@ class GooseProvider(ModelProvider):
         
         raise ModelError(f"Failed to generate response after {max_retries} attempts")
     
-    def __del__(self):
-        """Clean up HTTP client."""
-        if hasattr(self, 'client') and self.client:
-            try:
-                self.client.close()
-            except:
-                pass
\ No newline at end of file
+    def generate_stream(
+        self,
+        system_prompt: str,
+        task_prompt: str,
+        max_tokens: int = 1024
+    ) -> Iterator[str]:
+        """Stream a response from Goose as text chunks.
+        
+        Arguments are validated immediately; the request is sent when
+        iteration starts. Streaming requests are not retried, and requests
+        going through the response cache yield the generate() result as a
+        single chunk.
+        
+        Args:
+            system_prompt: System instruction for the model
+            task_prompt: User task/query for the model
+            max_tokens: Maximum tokens to generate
+        
+        Returns:
+            Iterator over generated text chunks
+        
+        Raises:
+            ModelError: If the arguments are invalid or streaming fails
+        """
+        self._validate_request(system_prompt, task_prompt, max_tokens)
+        
+        self.logger.info(f"Streaming response with Goose model {self.goose_model_name}")
+        
+        return self._stream_chunks(system_prompt, task_prompt, max_tokens)
+    
+    def _validate_request(self, system_prompt: str, task_prompt: str, max_tokens: int) -> None:
+        """Validate generation arguments.
+        
+        Raises:
+            ModelError: If the prompts are empty or max_tokens is out of range
+        """
+        if not system_prompt or not task_prompt:
+            raise ModelError("Both system_prompt and task_prompt are required")
+        
+        if max_tokens <= 0 or max_tokens > 8192:
+            raise ModelError("max_tokens must be between 1 and 8192")
+        
+        prompt_chars = len(system_prompt) + len(task_prompt)
+        if prompt_chars > self.MAX_PROMPT_CHARS:
+            raise ModelError(
+                f"Prompt exceeds the context window: {prompt_chars} characters "
+                f"(limit {self.MAX_PROMPT_CHARS})"
+            )
+    
+    def _stream_chunks(self, system_prompt: str, task_prompt: str, max_tokens: int) -> Iterator[str]:
+        """Yield text chunks from a Goose server-sent events stream."""
+        # The response cache only holds complete responses
+        if self.response_cache.policy != "disabled":
+            yield self.generate(system_prompt, task_prompt, max_tokens)
+            return
+        
+        payload = _encode_json(self._prepare_request_body(system_prompt, task_prompt, max_tokens, stream=True))
+        
+        try:
+            start_time = time.time()
+            
+            with self.client.stream("POST", "/chat/completions", content=payload) as response:
+                if response.status_code == 401:
+                    raise ModelError("Invalid Goose API key")
+                if response.status_code != 200:
+                    raise ModelError(f"Unexpected response status: {response.status_code}")
+                
+                for line in response.iter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    
+                    event = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+                    choices = event.get("choices") or []
+                    if choices:
+                        text = (choices[0].get("delta") or {}).get("content")
+                        if text:
+                            yield text
+            
+            duration = time.time() - start_time
+            self.logger.info(f"Streamed response in {duration:.2f}s")
+        
+        except ModelError:
+            raise
+        except httpx.TimeoutException as e:
+            raise ModelError("Request timeout while streaming", e)
+        except httpx.HTTPError as e:
+            raise ModelError(f"Connection error while streaming: {str(e)}", e)
+        except Exception as e:
+            raise ModelError(f"Unexpected error during streaming: {str(e)}", e)
+    
+    def close(self) -> None:
+        """Close the HTTP client and its connection pool."""
+        self._finalizer()
+    
+    def __enter__(self) -> "GooseProvider":
+        """Use the provider as a context manager that closes its client on exit."""
+        return self
+    
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        """Close the HTTP client and its connection pool."""
+        self.close()
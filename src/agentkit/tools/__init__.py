@@ -1,6 +1,6 @@
 """Tool registry and base classes for AgentKit."""
 
-from .base import BaseTool, ToolResult, ToolError
+from .base import BaseTool, ToolResult, ToolError, clear_tool_result_cache
 from .registry import (
     ToolRegistry,
     get_global_registry,
@@ -14,19 +14,15 @@ from .registry import (
 from .builtin import EchoTool, CalculatorTool, TextCountTool
 
 # Auto-register built-in tools
-_builtin_tools = [EchoTool, CalculatorTool, TextCountTool]
+_builtin_tools = (EchoTool, CalculatorTool, TextCountTool)
 
-for tool_cls in _builtin_tools:
-    try:
-        register_tool(tool_cls)
-    except Exception as e:
-        import logging
-        logging.getLogger(__name__).warning(f"Failed to auto-register tool {tool_cls.__name__}: {e}")
+get_global_registry().bulk_register(_builtin_tools)
 
 __all__ = [
     "BaseTool",
     "ToolResult", 
     "ToolError",
+    "clear_tool_result_cache",
     "ToolRegistry",
     "get_global_registry",
     "register_tool",
@@ -1,18 +1,123 @@
 """Base classes and interfaces for AgentKit tools."""
 
-from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+import abc
+import copy
+import hashlib
+import json
+import logging
+import threading
+from abc import abstractmethod
+from collections import OrderedDict
+from typing import Callable, Dict, Any, Hashable, Optional, Tuple
 import jsonschema
-from jsonschema import validate, ValidationError
+from jsonschema import SchemaError
+from jsonschema.exceptions import best_match
+
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
 
 from ..core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Validators keyed by a digest of the schema's canonical JSON, shared by
+# every instance of a tool and by tools with identical schemas
+_schema_validators: Dict[bytes, Any] = {}
+_compiled_validators: Dict[bytes, Optional[Callable[[Any], Any]]] = {}
+
+
+def _schema_key(schema: Dict[str, Any]) -> bytes:
+    """Digest of a schema's canonical JSON, used as its validator cache key."""
+    return hashlib.blake2b(json.dumps(schema, sort_keys=True).encode(), digest_size=16).digest()
+
+
+def _get_schema_validator(schema: Dict[str, Any], key: bytes) -> Any:
+    """Check a schema against its meta-schema and build a jsonschema validator.
+    
+    Raises:
+        SchemaError: If the schema is not valid JSON Schema
+    """
+    validator = _schema_validators.get(key)
+    if validator is None:
+        validator_cls = jsonschema.validators.validator_for(schema)
+        validator_cls.check_schema(schema)
+        validator = _schema_validators[key] = validator_cls(schema)
+    return validator
+
+
+def _compile_validator(schema: Dict[str, Any], key: bytes) -> Optional[Callable[[Any], Any]]:
+    """Compile a schema to a fastjsonschema validation function.
+    
+    Defaults and formats are not applied, matching jsonschema's behaviour.
+    
+    Returns:
+        The compiled function, or None if fastjsonschema is not installed or
+        cannot compile the schema (e.g. an unsupported draft)
+    """
+    if not FASTJSONSCHEMA_AVAILABLE:
+        return None
+    
+    if key not in _compiled_validators:
+        try:
+            validate_fn = fastjsonschema.compile(schema, use_default=False, use_formats=False)
+        except fastjsonschema.JsonSchemaDefinitionException:
+            validate_fn = None
+        _compiled_validators[key] = validate_fn
+    return _compiled_validators[key]
+
+
+# Results of successful runs of CACHEABLE tools: (tool class, parameters key) -> result
+_RESULT_CACHE_MAXSIZE = 256
+_result_cache: "OrderedDict[Tuple[type, Hashable], Any]" = OrderedDict()
+# Tools run in worker threads (see process_agent_response_async)
+_result_cache_lock = threading.Lock()
+# Marks a result cache miss, since None is a valid tool result
+_MISSING = object()
+
+# Parameter value types that are hashed directly in result cache keys
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _copy_result(result: Any) -> Any:
+    """Copy a tool result unless it is an immutable scalar."""
+    if isinstance(result, _SCALAR_TYPES):
+        return result
+    return copy.deepcopy(result)
+
+
+def _parameters_key(parameters: Dict[str, Any]) -> Optional[Hashable]:
+    """Build a result cache key for tool parameters.
+    
+    Scalar parameters are keyed by value and type, so 1, 1.0 and True stay
+    distinct; anything else is keyed by its canonical JSON.
+    
+    Returns:
+        The key, or None if the parameters cannot be keyed
+    """
+    if all(type(value) in _SCALAR_TYPES for value in parameters.values()):
+        return tuple(sorted((name, type(value), value) for name, value in parameters.items()))
+    
+    try:
+        return json.dumps(parameters, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+
+
+def clear_tool_result_cache() -> None:
+    """Clear the cache of results from CACHEABLE tools."""
+    with _result_cache_lock:
+        _result_cache.clear()
+
 
 class ToolError(Exception):
     """Exception raised for tool-related errors."""
     
+    # Attributes live in slots rather than the instance dict
+    __slots__ = ('message', 'tool_name', 'original_error')
+    
     def __init__(self, message: str, tool_name: Optional[str] = None, original_error: Optional[Exception] = None):
         super().__init__(message)
         self.message = message
@@ -23,6 +128,10 @@ class ToolError(Exception):
 class ToolResult:
     """Represents the result of a tool execution."""
     
+    # One is created per tool run, so attributes live in slots rather than
+    # an instance dict
+    __slots__ = ('success', 'result', 'error', '_metadata')
+    
     def __init__(
         self, 
         success: bool, 
@@ -41,7 +150,18 @@ class ToolResult:
         self.success = success
         self.result = result
         self.error = error
-        self.metadata = metadata or {}
+        self._metadata = metadata or None
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Additional metadata about the execution, created on first access."""
+        if self._metadata is None:
+            self._metadata = {}
+        return self._metadata
+    
+    @metadata.setter
+    def metadata(self, value: Optional[Dict[str, Any]]) -> None:
+        self._metadata = value
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert result to dictionary representation."""
@@ -49,7 +169,8 @@ class ToolResult:
             "success": self.success,
             "result": self.result,
             "error": self.error,
-            "metadata": self.metadata
+            # Without metadata, return an empty dict but leave the result's unset
+            "metadata": self._metadata if self._metadata is not None else {}
         }
     
     def __str__(self) -> str:
@@ -60,12 +181,60 @@ class ToolResult:
             return f"Error: {self.error}"
 
 
-class BaseTool(ABC):
-    """Abstract base class for all AgentKit tools."""
+class BaseTool:
+    """Abstract base class for all AgentKit tools.
+    
+    Tools with a fixed name, description and schema can define them as class
+    attributes instead of properties, so they are not rebuilt on each access.
+    A class attribute name also lets the registry register the tool without
+    instantiating it.
+    
+    Attributes:
+        logger: Logger named after the tool class, shared by its instances
+        CACHEABLE: Whether run() may return a cached result for parameters
+            it has already seen. Only set this for tools whose result
+            depends on nothing but their parameters. Container results are
+            copied in and out of the cache, so callers may mutate them.
+    """
+    
+    CACHEABLE = False
+    
+    def __init_subclass__(cls, **kwargs: Any):
+        """Set up a tool subclass's abstract members and logger.
+        
+        BaseTool is a plain class rather than an ABC, so isinstance and
+        issubclass checks skip ABCMeta's hooks. Setting __abstractmethods__
+        keeps instantiating an incomplete tool a TypeError, as with ABC.
+        The class logger is created here rather than per instance.
+        """
+        super().__init_subclass__(**kwargs)
+        cls.__abstractmethods__ = frozenset()
+        abc.update_abstractmethods(cls)
+        
+        # One logger per tool class, shared by its instances
+        if "logger" not in cls.__dict__:
+            cls.logger = get_logger(cls.__name__)
     
     def __init__(self):
-        """Initialize the tool."""
-        self.logger = get_logger(f"{self.__class__.__name__}")
+        """Initialize the tool.
+        
+        Raises:
+            ToolError: If the tool's parameters schema is not valid JSON Schema
+        """
+        # Check the schema and build its validators once per distinct schema,
+        # rather than on every validate_parameters call. fastjsonschema is
+        # used when installed, with jsonschema as the fallback
+        schema = self.parameters_schema
+        key = _schema_key(schema)
+        try:
+            self._validator = _get_schema_validator(schema, key)
+        except SchemaError as e:
+            raise ToolError(
+                f"Invalid parameters schema for tool '{self.name}': {e.message}",
+                tool_name=self.name,
+                original_error=e
+            )
+        self._validate_fn = _compile_validator(schema, key)
     
     @property
     @abstractmethod
@@ -109,13 +278,23 @@ class BaseTool(ABC):
         Raises:
             ToolError: If parameters are invalid
         """
-        try:
-            validate(instance=parameters, schema=self.parameters_schema)
-        except ValidationError as e:
+        if self._validate_fn is not None:
+            try:
+                self._validate_fn(parameters)
+                return
+            except fastjsonschema.JsonSchemaValueException as e:
+                raise ToolError(
+                    f"Invalid parameters for tool '{self.name}': {e.message}",
+                    tool_name=self.name,
+                    original_error=e
+                )
+        
+        error = best_match(self._validator.iter_errors(parameters))
+        if error is not None:
             raise ToolError(
-                f"Invalid parameters for tool '{self.name}': {e.message}",
+                f"Invalid parameters for tool '{self.name}': {error.message}",
                 tool_name=self.name,
-                original_error=e
+                original_error=error
             )
     
     def run(self, **kwargs: Any) -> ToolResult:
@@ -127,8 +306,27 @@ class BaseTool(ABC):
         Returns:
             ToolResult containing success status and result/error
         """
+        # Read once; name may be a property on custom tools
+        name = self.name
+        logger = self.logger
+        
         try:
-            self.logger.info(f"Executing tool '{self.name}' with parameters: {kwargs}")
+            logger.info("Executing tool '%s' with parameters: %s", name, kwargs)
+            
+            # Parameters already seen by a cacheable tool were valid, and
+            # give the same result, so both steps are skipped
+            cache_key = None
+            if self.CACHEABLE:
+                params_key = _parameters_key(kwargs)
+                if params_key is not None:
+                    cache_key = (type(self), params_key)
+                    with _result_cache_lock:
+                        cached = _result_cache.get(cache_key, _MISSING)
+                        if cached is not _MISSING:
+                            _result_cache.move_to_end(cache_key)
+                    if cached is not _MISSING:
+                        logger.info("Tool '%s' returned a cached result", name)
+                        return ToolResult(True, _copy_result(cached))
             
             # Validate parameters
             self.validate_parameters(kwargs)
@@ -136,17 +334,30 @@ class BaseTool(ABC):
             # Execute tool logic
             result = self._execute(**kwargs)
             
-            self.logger.info(f"Tool '{self.name}' executed successfully")
-            return ToolResult(success=True, result=result)
+            if cache_key is not None:
+                with _result_cache_lock:
+                    _result_cache[cache_key] = _copy_result(result)
+                    _result_cache.move_to_end(cache_key)
+                    if len(_result_cache) > _RESULT_CACHE_MAXSIZE:
+                        _result_cache.popitem(last=False)
+            
+            logger.info("Tool '%s' executed successfully", name)
+            # Positional arguments skip keyword matching on this hot path
+            return ToolResult(True, result)
             
         except ToolError as e:
-            self.logger.error(f"Tool '{self.name}' failed: {e.message}")
-            return ToolResult(success=False, error=e.message)
+            logger.error("Tool '%s' failed: %s", name, e.message)
+            return ToolResult(False, None, e.message)
             
         except Exception as e:
-            error_msg = f"Unexpected error in tool '{self.name}': {str(e)}"
-            self.logger.error(error_msg, exc_info=True)
-            return ToolResult(success=False, error=error_msg)
+            error_msg = f"Unexpected error in tool '{name}': {str(e)}"
+            # Formatting the traceback is costly under bursts of failing
+            # calls, so it is only logged when debugging
+            logger.error(
+                "%s (%s)", error_msg, type(e).__name__,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
+            return ToolResult(False, None, error_msg)
     
     def get_tool_info(self) -> Dict[str, Any]:
         """Get comprehensive information about the tool.
@@ -157,7 +368,8 @@ class BaseTool(ABC):
         return {
             "name": self.name,
             "description": self.description,
-            "parameters_schema": self.parameters_schema
+            # Schemas may be shared class attributes; callers get their own
+            "parameters_schema": copy.deepcopy(self.parameters_schema)
         }
     
     def __str__(self) -> str:
@@ -166,4 +378,9 @@ class BaseTool(ABC):
     
     def __repr__(self) -> str:
         """Developer representation of the tool."""
-        return f"{self.__class__.__name__}(name='{self.name}')"
\ No newline at end of file
+        return f"{self.__class__.__name__}(name='{self.name}')"
+
+
+# Compute BaseTool's own abstract members; subclasses do this in __init_subclass__
+BaseTool.__abstractmethods__ = frozenset()
+abc.update_abstractmethods(BaseTool)
\ No newline at end of file
@@ -1,8 +1,10 @@
 """Built-in tools for AgentKit."""
 
 import ast
+import functools
 import operator
 import re
+from types import CodeType
 from typing import Dict, Any, Union
 from .base import BaseTool, ToolError
 
@@ -10,40 +12,46 @@ from .base import BaseTool, ToolError
 class EchoTool(BaseTool):
     """Simple tool that echoes back the input text - useful for testing."""
     
-    @property
-    def name(self) -> str:
-        return "echo"
-    
-    @property
-    def description(self) -> str:
-        return "Echoes back the provided text - useful for testing tool functionality"
-    
-    @property
-    def parameters_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "text": {
-                    "type": "string",
-                    "description": "Text to echo back",
-                    "minLength": 1
-                }
-            },
-            "required": ["text"],
-            "additionalProperties": False
-        }
+    CACHEABLE = True
+    
+    name = "echo"
+    description = "Echoes back the provided text - useful for testing tool functionality"
+    
+    parameters_schema: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "text": {
+                "type": "string",
+                "description": "Text to echo back",
+                "minLength": 1
+            }
+        },
+        "required": ["text"],
+        "additionalProperties": False
+    }
     
     def _execute(self, **kwargs: Any) -> str:
         """Echo the input text back."""
         text = kwargs["text"]
-        self.logger.debug(f"Echoing text: {text}")
+        self.logger.debug("Echoing text: %s", text)
         return text
 
 
 class CalculatorTool(BaseTool):
     """Safe arithmetic calculator that evaluates mathematical expressions."""
     
-    # Allowed operators for safe evaluation
+    # Checks for the AST node types allowed in expressions, by node type
+    _NODE_CHECKS = {
+        ast.Constant: "_check_constant",
+        ast.BinOp: "_check_binop",
+        ast.UnaryOp: "_check_unaryop",
+    }
+    
+    # A plain number, written as Python would accept it as a literal (no
+    # leading zeros on integers); these are converted without parsing
+    _NUMBER_RE = re.compile(r"-?(?:0|[1-9][0-9]*)|-?[0-9]+\.[0-9]+")
+    
+    # Operators allowed in expressions
     ALLOWED_OPERATORS = {
         ast.Add: operator.add,
         ast.Sub: operator.sub,
@@ -56,57 +64,53 @@ class CalculatorTool(BaseTool):
         ast.UAdd: operator.pos,
     }
     
-    @property
-    def name(self) -> str:
-        return "calculator"
-    
-    @property
-    def description(self) -> str:
-        return "Performs safe arithmetic calculations from mathematical expressions"
-    
-    @property
-    def parameters_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "expression": {
-                    "type": "string",
-                    "description": "Mathematical expression to evaluate (e.g., '2 + 2', '10 * 3.5')",
-                    "minLength": 1,
-                    "pattern": r"^[\d\s\+\-\*\/\(\)\.\%\^]+$"
-                }
-            },
-            "required": ["expression"],
-            "additionalProperties": False
-        }
+    CACHEABLE = True
+    
+    name = "calculator"
+    description = "Performs safe arithmetic calculations from mathematical expressions"
+    
+    parameters_schema: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "expression": {
+                "type": "string",
+                "description": "Mathematical expression to evaluate (e.g., '2 + 2', '10 * 3.5')",
+                "minLength": 1,
+                "pattern": r"^[\d\s\+\-\*\/\(\)\.\%\^]+$"
+            }
+        },
+        "required": ["expression"],
+        "additionalProperties": False
+    }
     
     def _execute(self, **kwargs: Any) -> Union[int, float]:
         """Safely evaluate a mathematical expression."""
         expression = kwargs["expression"].strip()
-        self.logger.debug(f"Evaluating expression: {expression}")
+        self.logger.debug("Evaluating expression: %s", expression)
         
         # Basic input validation
         if not expression:
             raise ToolError("Empty expression provided", tool_name=self.name)
         
-        # Additional safety check - only allow basic math characters
-        if not re.match(r'^[\d\s\+\-\*\/\(\)\.\%\^]+$', expression):
-            raise ToolError(
-                "Expression contains invalid characters. Only numbers, +, -, *, /, %, ^, (, ), and spaces are allowed.",
-                tool_name=self.name
-            )
+        # Allowed characters are enforced by the schema's pattern in
+        # validate_parameters, and _check_node only accepts numeric literals
+        # and ALLOWED_OPERATORS, so no further character check is needed
         
         # Replace ^ with ** for Python power operator
         expression = expression.replace('^', '**')
         
         try:
-            # Parse the expression into an AST
-            parsed = ast.parse(expression, mode='eval')
+            # Plain numbers need no parsing
+            if self._NUMBER_RE.fullmatch(expression):
+                return float(expression) if "." in expression else int(expression)
             
-            # Evaluate safely using our restricted operator set
-            result = self._safe_eval(parsed.body)
+            # Parse, check and compile the expression (cached per expression)
+            code = self._compile(expression)
             
-            self.logger.debug(f"Expression result: {result}")
+            # Only whitelisted nodes remain, so no names or builtins are reachable
+            result = eval(code, {"__builtins__": {}})
+            
+            self.logger.debug("Expression result: %s", result)
             return result
             
         except SyntaxError as e:
@@ -118,106 +122,128 @@ class CalculatorTool(BaseTool):
         except Exception as e:
             raise ToolError(f"Calculation error: {str(e)}", tool_name=self.name)
     
-    def _safe_eval(self, node: ast.AST) -> Union[int, float]:
-        """Safely evaluate an AST node using only allowed operations.
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _compile(cls, expression: str) -> CodeType:
+        """Parse an expression, check it is safe and compile it to bytecode.
+        
+        Results are cached, so agents repeating a calculation skip parsing.
         
         Args:
-            node: AST node to evaluate
+            expression: Expression text with ^ already replaced by **
             
         Returns:
-            Numeric result
+            Code object that evaluates the expression
             
         Raises:
+            SyntaxError: If the expression cannot be parsed
             ToolError: If unsupported operations are used
         """
-        if isinstance(node, ast.Constant):
-            # Python 3.8+ uses ast.Constant for literals
-            if isinstance(node.value, (int, float)):
-                return node.value
-            else:
-                raise ToolError(f"Unsupported literal type: {type(node.value)}", tool_name=self.name)
-        
-        elif isinstance(node, ast.Num):
-            # Fallback for older Python versions
-            return node.n
+        parsed = ast.parse(expression, mode='eval')
+        cls._check_node(parsed.body)
+        return compile(parsed, '<calculator>', 'eval')
+    
+    @classmethod
+    def _check_node(cls, node: ast.AST) -> None:
+        """Check that an AST node only uses numeric literals and allowed operations.
         
-        elif isinstance(node, ast.BinOp):
-            # Binary operations (+, -, *, /, etc.)
-            left = self._safe_eval(node.left)
-            right = self._safe_eval(node.right)
-            op_type = type(node.op)
-            
-            if op_type not in self.ALLOWED_OPERATORS:
-                raise ToolError(f"Unsupported operation: {op_type.__name__}", tool_name=self.name)
+        Args:
+            node: AST node to check
             
-            return self.ALLOWED_OPERATORS[op_type](left, right)
+        Raises:
+            ToolError: If unsupported operations are used
+        """
+        # Dispatch on the exact node type rather than an isinstance chain
+        check = cls._NODE_CHECKS.get(type(node))
+        if check is None:
+            raise ToolError(f"Unsupported expression type: {type(node).__name__}", tool_name=cls.name)
+        getattr(cls, check)(node)
+    
+    @classmethod
+    def _check_constant(cls, node: ast.Constant) -> None:
+        """Check that a literal is a number."""
+        if not isinstance(node.value, (int, float)):
+            raise ToolError(f"Unsupported literal type: {type(node.value)}", tool_name=cls.name)
+    
+    @classmethod
+    def _check_binop(cls, node: ast.BinOp) -> None:
+        """Check a binary operation (+, -, *, /, etc.) and its operands."""
+        cls._check_node(node.left)
+        cls._check_node(node.right)
+        op_type = type(node.op)
         
-        elif isinstance(node, ast.UnaryOp):
-            # Unary operations (+, -)
-            operand = self._safe_eval(node.operand)
-            op_type = type(node.op)
-            
-            if op_type not in self.ALLOWED_OPERATORS:
-                raise ToolError(f"Unsupported unary operation: {op_type.__name__}", tool_name=self.name)
-            
-            return self.ALLOWED_OPERATORS[op_type](operand)
+        if op_type not in cls.ALLOWED_OPERATORS:
+            raise ToolError(f"Unsupported operation: {op_type.__name__}", tool_name=cls.name)
+    
+    @classmethod
+    def _check_unaryop(cls, node: ast.UnaryOp) -> None:
+        """Check a unary operation (+, -) and its operand."""
+        cls._check_node(node.operand)
+        op_type = type(node.op)
         
-        else:
-            raise ToolError(f"Unsupported expression type: {type(node).__name__}", tool_name=self.name)
+        if op_type not in cls.ALLOWED_OPERATORS:
+            raise ToolError(f"Unsupported unary operation: {op_type.__name__}", tool_name=cls.name)
+
+
+# ASCII line boundaries recognised by str.splitlines() besides \n
+_OTHER_ASCII_LINE_BREAKS = ("\r", "\x0b", "\x0c", "\x1c", "\x1d", "\x1e")
 
 
 class TextCountTool(BaseTool):
     """Tool for counting characters, words, and lines in text."""
     
-    @property
-    def name(self) -> str:
-        return "text_count"
-    
-    @property
-    def description(self) -> str:
-        return "Counts characters, words, and lines in provided text"
-    
-    @property
-    def parameters_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "text": {
-                    "type": "string",
-                    "description": "Text to analyze"
-                },
-                "count_type": {
-                    "type": "string",
-                    "enum": ["characters", "words", "lines", "all"],
-                    "description": "Type of count to perform",
-                    "default": "all"
-                }
+    CACHEABLE = True
+    
+    name = "text_count"
+    description = "Counts characters, words, and lines in provided text"
+    
+    parameters_schema: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "text": {
+                "type": "string",
+                "description": "Text to analyze"
             },
-            "required": ["text"],
-            "additionalProperties": False
-        }
+            "count_type": {
+                "type": "string",
+                "enum": ["characters", "words", "lines", "all"],
+                "description": "Type of count to perform",
+                "default": "all"
+            }
+        },
+        "required": ["text"],
+        "additionalProperties": False
+    }
     
     def _execute(self, **kwargs: Any) -> Union[int, Dict[str, int]]:
         """Count text statistics."""
         text = kwargs["text"]
         count_type = kwargs.get("count_type", "all")
         
-        self.logger.debug(f"Counting {count_type} in text of length {len(text)}")
-        
-        # Calculate all counts
-        char_count = len(text)
-        word_count = len(text.split()) if text.strip() else 0
-        line_count = len(text.splitlines()) if text else 0
+        self.logger.debug("Counting %s in text of length %d", count_type, len(text))
         
+        # Only compute the requested counts
         if count_type == "characters":
-            return char_count
+            return len(text)
         elif count_type == "words":
-            return word_count
+            return len(text.split())
         elif count_type == "lines":
-            return line_count
+            return self._count_lines(text)
         else:  # "all"
             return {
-                "characters": char_count,
-                "words": word_count,
-                "lines": line_count
-            }
\ No newline at end of file
+                "characters": len(text),
+                "words": len(text.split()),
+                "lines": self._count_lines(text)
+            }
+    
+    @staticmethod
+    def _count_lines(text: str) -> int:
+        """Count lines the way str.splitlines() does, without building the list."""
+        if not text:
+            return 0
+        
+        # Newline-only ASCII text can be counted directly; anything with other
+        # line boundaries (\r, \v, \f, \x1c-\x1e, non-ASCII) uses splitlines
+        if text.isascii() and not any(sep in text for sep in _OTHER_ASCII_LINE_BREAKS):
+            return text.count("\n") + (not text.endswith("\n"))
+        return len(text.splitlines())
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Tool registry for managing and discovering AgentKit tools."""
 
-from typing import Dict, List, Type, Optional, Any
+from typing import Dict, Iterable, Iterator, List, Type, Optional, Any
+import copy
 import inspect
 from .base import BaseTool, ToolError
 from ..core.logger import get_logger
@@ -15,6 +16,8 @@ class ToolRegistry:
         """Initialize the tool registry."""
         self._tools: Dict[str, Type[BaseTool]] = {}
         self._instances: Dict[str, BaseTool] = {}
+        # get_all_tool_info result, reset whenever the set of tools changes
+        self._all_tool_info: Optional[Dict[str, Dict[str, Any]]] = None
         self.logger = get_logger(self.__class__.__name__)
     
     def register_tool(self, tool_cls: Type[BaseTool]) -> None:
@@ -26,6 +29,68 @@ class ToolRegistry:
         Raises:
             ToolError: If tool is invalid or name conflicts exist
         """
+        tool_name = self._check_tool_class(tool_cls)
+        
+        if self._tools.get(tool_name) is tool_cls:
+            # Same class, already registered
+            self.logger.debug(f"Tool '{tool_name}' already registered")
+            return
+        
+        # Register the tool
+        self._tools[tool_name] = tool_cls
+        self._all_tool_info = None
+        self.logger.info(f"Registered tool: {tool_name} ({tool_cls.__name__})")
+    
+    def bulk_register(self, tool_classes: Iterable[Type[BaseTool]]) -> int:
+        """Register several tool classes with a single registry update.
+        
+        Invalid or conflicting classes are logged and skipped.
+        
+        Args:
+            tool_classes: Tool classes to register
+        
+        Returns:
+            Number of tools newly registered
+        """
+        new_tools: Dict[str, Type[BaseTool]] = {}
+        
+        for tool_cls in tool_classes:
+            try:
+                tool_name = self._check_tool_class(tool_cls)
+            except ToolError as e:
+                self.logger.warning(f"Failed to register tool {getattr(tool_cls, '__name__', tool_cls)}: {e.message}")
+                continue
+            
+            existing_cls = new_tools.get(tool_name)
+            if existing_cls is not None and existing_cls is not tool_cls:
+                self.logger.warning(
+                    f"Failed to register tool {tool_cls.__name__}: '{tool_name}' "
+                    f"is already registered by {existing_cls.__name__}"
+                )
+                continue
+            
+            if self._tools.get(tool_name) is not tool_cls:
+                new_tools[tool_name] = tool_cls
+        
+        self._tools.update(new_tools)
+        if new_tools:
+            self._all_tool_info = None
+            self.logger.info(f"Registered tools: {', '.join(new_tools)}")
+        
+        return len(new_tools)
+    
+    def _check_tool_class(self, tool_cls: Type[BaseTool]) -> str:
+        """Validate a tool class before registration.
+        
+        Args:
+            tool_cls: Tool class to validate
+        
+        Returns:
+            Name of the tool
+        
+        Raises:
+            ToolError: If tool is invalid or its name is taken by another class
+        """
         # Validate that it's a proper tool class
         if not inspect.isclass(tool_cls):
             raise ToolError(f"Expected tool class, got {type(tool_cls)}")
@@ -33,32 +98,29 @@ class ToolRegistry:
         if not issubclass(tool_cls, BaseTool):
             raise ToolError(f"Tool class {tool_cls.__name__} must inherit from BaseTool")
         
-        # Create temporary instance to get name (tools must be instantiable)
-        try:
-            temp_instance = tool_cls()
-            tool_name = temp_instance.name
-        except Exception as e:
-            raise ToolError(
-                f"Failed to instantiate tool class {tool_cls.__name__}: {str(e)}",
-                original_error=e
-            )
-        
-        # Check for name conflicts
-        if tool_name in self._tools:
-            existing_cls = self._tools[tool_name]
-            if existing_cls != tool_cls:
+        # A name defined as a class attribute is read without instantiating
+        # the tool; otherwise create a temporary instance to get it (tools
+        # must be instantiable)
+        tool_name = getattr(tool_cls, "name", None)
+        if not isinstance(tool_name, str) or inspect.isabstract(tool_cls):
+            try:
+                temp_instance = tool_cls()
+                tool_name = temp_instance.name
+            except Exception as e:
                 raise ToolError(
-                    f"Tool name conflict: '{tool_name}' is already registered "
-                    f"by {existing_cls.__name__}"
+                    f"Failed to instantiate tool class {tool_cls.__name__}: {str(e)}",
+                    original_error=e
                 )
-            else:
-                # Same class, already registered
-                self.logger.debug(f"Tool '{tool_name}' already registered")
-                return
         
-        # Register the tool
-        self._tools[tool_name] = tool_cls
-        self.logger.info(f"Registered tool: {tool_name} ({tool_cls.__name__})")
+        # Check for name conflicts
+        existing_cls = self._tools.get(tool_name)
+        if existing_cls is not None and existing_cls != tool_cls:
+            raise ToolError(
+                f"Tool name conflict: '{tool_name}' is already registered "
+                f"by {existing_cls.__name__}"
+            )
+        
+        return tool_name
     
     def get_tool(self, name: str) -> BaseTool:
         """Get a tool instance by name.
@@ -137,10 +199,15 @@ class ToolRegistry:
         Returns:
             Dictionary mapping tool names to tool information
         """
+        # Tool info only changes when tools are registered or unregistered
+        # Copied so callers editing the info cannot change later results
+        if self._all_tool_info is not None:
+            return copy.deepcopy(self._all_tool_info)
+        
         result = {}
-        for name in self._tools.keys():
+        for name in self._tools:
             try:
-                result[name] = self.get_tool_info(name)
+                result[name] = self.get_tool(name).get_tool_info()
             except Exception as e:
                 self.logger.error(f"Failed to get info for tool '{name}': {str(e)}")
                 result[name] = {
@@ -148,7 +215,9 @@ class ToolRegistry:
                     "description": f"Error loading tool: {str(e)}",
                     "parameters_schema": {}
                 }
-        return result
+        
+        self._all_tool_info = result
+        return copy.deepcopy(result)
     
     def unregister_tool(self, name: str) -> None:
         """Unregister a tool by name.
@@ -160,16 +229,22 @@ class ToolRegistry:
             del self._tools[name]
             if name in self._instances:
                 del self._instances[name]
+            self._all_tool_info = None
             self.logger.info(f"Unregistered tool: {name}")
     
     def clear(self) -> None:
         """Clear all registered tools."""
         self._tools.clear()
         self._instances.clear()
+        self._all_tool_info = None
         self.logger.info("Cleared all registered tools")
     
     def register_from_module(self, module: Any) -> int:
-        """Register all BaseTool subclasses found in a module.
+        """Register all BaseTool subclasses defined at the top level of a module.
+        
+        Tools are found by walking BaseTool's subclasses rather than every
+        module attribute. Tool classes imported into the module from
+        elsewhere are not included.
         
         Args:
             module: Python module to scan for tools
@@ -178,20 +253,18 @@ class ToolRegistry:
             Number of tools registered
         """
         registered_count = 0
+        module_name = module.__name__
         
-        for name in dir(module):
-            obj = getattr(module, name)
+        for tool_cls in _iter_subclasses(BaseTool):
+            name = tool_cls.__name__
+            if tool_cls.__module__ != module_name or getattr(module, name, None) is not tool_cls:
+                continue
             
-            # Check if it's a class that inherits from BaseTool
-            if (inspect.isclass(obj) and 
-                issubclass(obj, BaseTool) and 
-                obj != BaseTool):
-                
-                try:
-                    self.register_tool(obj)
-                    registered_count += 1
-                except ToolError as e:
-                    self.logger.warning(f"Failed to register tool {name}: {e.message}")
+            try:
+                self.register_tool(tool_cls)
+                registered_count += 1
+            except ToolError as e:
+                self.logger.warning(f"Failed to register tool {name}: {e.message}")
         
         if registered_count > 0:
             self.logger.info(f"Registered {registered_count} tools from module {module.__name__}")
@@ -211,6 +284,19 @@ class ToolRegistry:
         return iter(self._tools.keys())
 
 
+def _iter_subclasses(cls: type) -> Iterator[type]:
+    """Yield every subclass of a class, depth first, each once."""
+    seen = set()
+    stack = list(reversed(cls.__subclasses__()))
+    while stack:
+        subclass = stack.pop()
+        if subclass in seen:
+            continue
+        seen.add(subclass)
+        yield subclass
+        stack.extend(reversed(subclass.__subclasses__()))
+
+
 # Global tool registry instance
 _global_registry = ToolRegistry()
 
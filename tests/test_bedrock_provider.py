@@ -2,433 +2,489 @@
 
 import pytest
 import json
-from unittest.mock import Mock, patch, MagicMock
+import re
+from unittest.mock import Mock, patch
 from botocore.exceptions import ClientError, NoCredentialsError
 
 from agentkit.core.model_interface import ModelError
-from agentkit.models.bedrock_provider import BedrockProvider
+from agentkit.core.response_cache import ResponseCache
+from agentkit.models.bedrock_provider import BedrockProvider, clear_client_cache, clear_rejected_prompt_cache
+
+
+class _Body:
+    """Stand-in for the streaming body of an invoke_model response."""
+    
+    __slots__ = ("_data",)
+    
+    def __init__(self, data: bytes):
+        self._data = data
+    
+    def read(self) -> bytes:
+        return self._data
+
+
+def _response(text: str) -> dict:
+    """Build an invoke_model response whose body holds the given text."""
+    return {'body': _Body(json.dumps({"content": [{"text": text}]}).encode('utf-8'))}
+
+
+def _client_error(code: str, message: str = "Request failed",
+                  operation: str = "InvokeModel") -> ClientError:
+    """Build a botocore ClientError with the given error code and message."""
+    return ClientError({'Error': {'Code': code, 'Message': message}}, operation)
+
+
+# Response payloads are encoded once here rather than in every test
+_GENERATED_RESPONSE = _response("Generated response text")
+_CACHED_RESPONSE = _response("Cached text")
+_FULL_RESPONSE = _response("Full response")
+_EXPECTED_REQUEST_BODY = {
+    "anthropic_version": "bedrock-2023-05-31",
+    "max_tokens": 100,
+    "system": "You are helpful",
+    "messages": [{"role": "user", "content": "Say hello"}]
+}
+_STREAM_EVENTS = [
+    {'chunk': {'bytes': json.dumps(event).encode('utf-8')}}
+    for event in (
+        {"type": "message_start", "message": {}},
+        {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "Hello"}},
+        {"type": "content_block_delta", "delta": {"type": "text_delta", "text": " world"}},
+        {"type": "message_stop"},
+    )
+]
+_PROMPT_TOO_LONG_ERROR = _client_error("ValidationException", "Input is too long for requested model.")
+_MODEL_TIMEOUT_ERROR = _client_error("ModelTimeoutException", "Model has timed out in processing the request.")
+_STREAMING_UNSUPPORTED_ERROR = _client_error(
+    "ValidationException", "The model is unsupported for streaming", "InvokeModelWithResponseStream"
+)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_session():
+    """Patch boto3.Session once for the whole module; bedrock_env rewires it per test.
+    
+    Module scope is per process, so each pytest-xdist worker gets its own patch.
+    """
+    with patch('boto3.Session') as mock_session_cls:
+        yield mock_session_cls
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _no_sleep():
+    """Skip retry backoff sleeps for the whole module."""
+    with patch('agentkit.models.bedrock_provider.time.sleep') as mock_sleep:
+        yield mock_sleep
+
+
+@pytest.fixture(scope="module")
+def shared_provider(_patch_session):
+    """A claude-3-sonnet provider shared by tests that never use its client."""
+    _patch_session.side_effect = None
+    return BedrockProvider("claude-3-sonnet")
 
 
 class TestBedrockProvider:
     """Test BedrockProvider functionality."""
     
-    def test_init_success(self):
+    @pytest.fixture(autouse=True)
+    def _clear_client_cache(self):
+        """Ensure each test creates its client through the patched boto3.Session."""
+        clear_client_cache()
+        clear_rejected_prompt_cache()
+        yield
+        clear_client_cache()
+        clear_rejected_prompt_cache()
+    
+    @pytest.fixture(autouse=True)
+    def bedrock_env(self, _patch_session):
+        """Give the patched boto3.Session a fresh mock session and client.
+        
+        Returns:
+            Tuple of (mock Session class, mock session, mock client)
+        """
+        mock_session_cls = _patch_session
+        mock_session_cls.reset_mock()
+        # spec_set limits the mocks to the calls the provider makes, so a
+        # mistyped attribute fails instead of silently creating a child
+        mock_session = Mock(spec_set=["client"])
+        mock_client = Mock(spec_set=[
+            "invoke_model",
+            "invoke_model_with_response_stream",
+            "list_foundation_models",
+        ])
+        mock_session.client.return_value = mock_client
+        mock_session_cls.side_effect = None
+        mock_session_cls.return_value = mock_session
+        return mock_session_cls, mock_session, mock_client
+    
+    @pytest.fixture
+    def provider(self, bedrock_env):
+        """A claude-3-sonnet provider and its mock client."""
+        _, _, mock_client = bedrock_env
+        return BedrockProvider("claude-3-sonnet"), mock_client
+    
+    def test_init_success(self, shared_provider):
         """Test successful BedrockProvider initialization."""
-        with patch('agentkit.models.bedrock_provider.boto3') as mock_boto3:
-            # Mock successful boto3 session creation
-            mock_session = Mock()
-            mock_client = Mock()
-            mock_session.client.return_value = mock_client
-            mock_boto3.Session.return_value = mock_session
-            
-            # Mock successful credentials test
-            mock_client.list_foundation_models.return_value = {}
-            
-            provider = BedrockProvider("claude-3-sonnet")
-            
-            assert provider.model_name == "claude-3-sonnet"
-            assert provider.bedrock_model_id == "anthropic.claude-3-sonnet-20240229-v1:0"
-            assert provider.region == "us-east-1"
+        provider = shared_provider
+        
+        assert provider.model_name == "claude-3-sonnet"
+        assert provider.bedrock_model_id == "anthropic.claude-3-sonnet-20240229-v1:0"
+        assert provider.region == "us-east-1"
     
-    def test_init_custom_region(self):
+    def test_init_custom_region(self, bedrock_env):
         """Test BedrockProvider with custom region."""
-        with patch('agentkit.models.bedrock_provider.boto3') as mock_boto3:
-            mock_session = Mock()
-            mock_client = Mock()
-            mock_session.client.return_value = mock_client
-            mock_boto3.Session.return_value = mock_session
-            mock_client.list_foundation_models.return_value = {}
-            
-            provider = BedrockProvider("claude-3-haiku", region="us-west-2")
-            
-            assert provider.region == "us-west-2"
-            mock_session.client.assert_called_with(
-                service_name="bedrock-runtime",
-                region_name="us-west-2"
-            )
+        _, mock_session, _ = bedrock_env
+        
+        provider = BedrockProvider("claude-3-haiku", region="us-west-2")
+        
+        assert provider.region == "us-west-2"
+        call_kwargs = mock_session.client.call_args[1]
+        assert call_kwargs["service_name"] == "bedrock-runtime"
+        assert call_kwargs["region_name"] == "us-west-2"
+        assert call_kwargs["config"].parameter_validation is False
+        assert call_kwargs["config"].connect_timeout == 3.0
+        assert call_kwargs["config"].max_pool_connections == 64
+    
+    def test_client_reused_across_instances(self, bedrock_env):
+        """Test that providers in the same region share one client and all share one session."""
+        mock_session_cls, mock_session, mock_client = bedrock_env
+        
+        first = BedrockProvider("claude-3-sonnet")
+        second = BedrockProvider("claude-3-haiku")
+        other_region = BedrockProvider("claude-3-haiku", region="eu-west-1")
+        
+        assert first.client is second.client
+        mock_session_cls.assert_called_once_with()
+        regions = [c[1]["region_name"] for c in mock_session.client.call_args_list]
+        assert regions == ["us-east-1", "eu-west-1"]
+        mock_client.list_foundation_models.assert_not_called()
     
     def test_init_boto3_not_available(self):
         """Test initialization when boto3 is not available."""
         with patch('agentkit.models.bedrock_provider.BOTO3_AVAILABLE', False):
-            with pytest.raises(ModelError) as exc_info:
+            with pytest.raises(ModelError, match="boto3 not available"):
                 BedrockProvider("claude-3-sonnet")
-            
-            assert "boto3 not available" in str(exc_info.value)
     
     def test_init_unsupported_model(self):
         """Test initialization with unsupported model."""
-        with patch('agentkit.models.bedrock_provider.boto3'):
-            with pytest.raises(ModelError) as exc_info:
-                BedrockProvider("gpt-4")
-            
-            assert "Unsupported Bedrock model" in str(exc_info.value)
+        with pytest.raises(ModelError, match="Unsupported Bedrock model"):
+            BedrockProvider("gpt-4")
     
-    def test_init_no_credentials(self):
+    def test_init_no_credentials(self, bedrock_env):
         """Test initialization with no AWS credentials."""
-        with patch('agentkit.models.bedrock_provider.boto3') as mock_boto3:
-            mock_boto3.Session.side_effect = NoCredentialsError()
-            
-            with pytest.raises(ModelError) as exc_info:
-                BedrockProvider("claude-3-sonnet")
-            
-            assert "AWS credentials not found" in str(exc_info.value)
-    
-    def test_init_insufficient_permissions(self):
-        """Test initialization with insufficient permissions."""
-        with patch('agentkit.models.bedrock_provider.boto3') as mock_boto3:
-            mock_session = Mock()
-            mock_client = Mock()
-            mock_session.client.return_value = mock_client
-            mock_boto3.Session.return_value = mock_session
-            
-            # Mock permission error
-            error_response = {
-                'Error': {
-                    'Code': 'UnauthorizedOperation',
-                    'Message': 'Access denied'
-                }
-            }
-            mock_client.list_foundation_models.side_effect = ClientError(
-                error_response, 'ListFoundationModels'
-            )
-            
-            with pytest.raises(ModelError) as exc_info:
-                BedrockProvider("claude-3-sonnet")
-            
-            assert "Insufficient permissions" in str(exc_info.value)
+        mock_session_cls, _, _ = bedrock_env
+        mock_session_cls.side_effect = NoCredentialsError()
+        
+        with pytest.raises(ModelError, match="AWS credentials not found"):
+            BedrockProvider("claude-3-sonnet")
     
-    def test_prepare_request_body(self):
+    def test_prepare_request_body(self, shared_provider):
         """Test request body preparation."""
-        with patch('agentkit.models.bedrock_provider.boto3') as mock_boto3:
-            mock_session = Mock()
-            mock_client = Mock()
-            mock_session.client.return_value = mock_client
-            mock_boto3.Session.return_value = mock_session
-            mock_client.list_foundation_models.return_value = {}
-            
-            provider = BedrockProvider("claude-3-sonnet")
-            
-            body = provider._prepare_request_body(
-                system_prompt="You are helpful",
-                task_prompt="Hello world",
-                max_tokens=100
-            )
-            
-            parsed_body = json.loads(body)
-            
-            assert parsed_body["anthropic_version"] == "bedrock-2023-05-31"
-            assert parsed_body["max_tokens"] == 100
-            assert parsed_body["system"] == "You are helpful"
-            assert parsed_body["messages"][0]["role"] == "user"
-            assert parsed_body["messages"][0]["content"] == "Hello world"
-    
-    def test_parse_response_success(self):
-        """Test successful response parsing."""
-        with patch('agentkit.models.bedrock_provider.boto3') as mock_boto3:
-            mock_session = Mock()
-            mock_client = Mock()
-            mock_session.client.return_value = mock_client
-            mock_boto3.Session.return_value = mock_session
-            mock_client.list_foundation_models.return_value = {}
-            
-            provider = BedrockProvider("claude-3-sonnet")
-            
-            response_data = {
-                "content": [
-                    {"text": "Hello! How can I help you?"}
-                ]
-            }
-            response_bytes = json.dumps(response_data).encode('utf-8')
-            
-            result = provider._parse_response(response_bytes)
-            assert result == "Hello! How can I help you?"
-    
-    def test_parse_response_legacy_format(self):
-        """Test parsing response with legacy completion format."""
-        with patch('agentkit.models.bedrock_provider.boto3') as mock_boto3:
-            mock_session = Mock()
-            mock_client = Mock()
-            mock_session.client.return_value = mock_client
-            mock_boto3.Session.return_value = mock_session
-            mock_client.list_foundation_models.return_value = {}
-            
-            provider = BedrockProvider("claude-3-sonnet")
-            
-            response_data = {
-                "completion": "This is a legacy response format"
-            }
-            response_bytes = json.dumps(response_data).encode('utf-8')
-            
-            result = provider._parse_response(response_bytes)
-            assert result == "This is a legacy response format"
-    
-    def test_parse_response_invalid_json(self):
-        """Test response parsing with invalid JSON."""
-        with patch('agentkit.models.bedrock_provider.boto3') as mock_boto3:
-            mock_session = Mock()
-            mock_client = Mock()
-            mock_session.client.return_value = mock_client
-            mock_boto3.Session.return_value = mock_session
-            mock_client.list_foundation_models.return_value = {}
-            
+        provider = shared_provider
+        
+        body = provider._prepare_request_body(
+            system_prompt="You are helpful",
+            task_prompt="Hello world",
+            max_tokens=100
+        )
+        
+        parsed_body = json.loads(body)
+        
+        assert parsed_body["anthropic_version"] == "bedrock-2023-05-31"
+        assert parsed_body["max_tokens"] == 100
+        assert parsed_body["system"] == "You are helpful"
+        assert parsed_body["messages"][0]["role"] == "user"
+        assert parsed_body["messages"][0]["content"] == "Hello world"
+    
+    def test_prepare_request_body_without_orjson(self, shared_provider):
+        """Test that the stdlib fallback produces the same request bytes."""
+        provider = shared_provider
+        
+        body = provider._prepare_request_body("Sé helpful", "Hello wörld", 100)
+        with patch('agentkit.models.bedrock_provider.ORJSON_AVAILABLE', False):
+            fallback_body = provider._prepare_request_body("Sé helpful", "Hello wörld", 100)
+        
+        assert isinstance(body, bytes)
+        assert body == fallback_body
+        assert provider._parse_response(b'{"content": [{"text": " ok "}]}') == "ok"
+    
+    def test_prepare_request_body_with_prompt_cache(self):
+        """Test cache_control blocks when prompt caching is enabled."""
+        with patch.dict('os.environ', {'AGENTKIT_PROMPT_CACHE': '1'}), \
+             patch.object(BedrockProvider, 'PROMPT_CACHE_MODELS',
+                          frozenset({"anthropic.claude-3-sonnet-20240229-v1:0"})):
             provider = BedrockProvider("claude-3-sonnet")
-            
-            with pytest.raises(ModelError) as exc_info:
-                provider._parse_response(b"invalid json")
-            
-            assert "Failed to parse Bedrock response JSON" in str(exc_info.value)
-    
-    def test_parse_response_no_content(self):
-        """Test response parsing with no content."""
-        with patch('agentkit.models.bedrock_provider.boto3') as mock_boto3:
-            mock_session = Mock()
-            mock_client = Mock()
-            mock_session.client.return_value = mock_client
-            mock_boto3.Session.return_value = mock_session
-            mock_client.list_foundation_models.return_value = {}
-            
+        
+        assert provider.prompt_cache_enabled
+        
+        body = json.loads(provider._prepare_request_body(
+            system_prompt="You are helpful",
+            task_prompt="Shared context. Question?",
+            max_tokens=100,
+            cache_prefix_len=len("Shared context.")
+        ))
+        
+        assert body["system"] == [{
+            "type": "text",
+            "text": "You are helpful",
+            "cache_control": {"type": "ephemeral"}
+        }]
+        content = body["messages"][0]["content"]
+        assert content[0] == {
+            "type": "text",
+            "text": "Shared context.",
+            "cache_control": {"type": "ephemeral"}
+        }
+        assert content[1] == {"type": "text", "text": " Question?"}
+    
+    def test_prompt_cache_disabled_for_unsupported_models(self):
+        """Test that prompt caching stays off for models without support."""
+        with patch.dict('os.environ', {'AGENTKIT_PROMPT_CACHE': '1'}), \
+             patch('agentkit.core.model_interface.get_logger') as mock_get_logger:
             provider = BedrockProvider("claude-3-sonnet")
-            
-            response_data = {}
-            response_bytes = json.dumps(response_data).encode('utf-8')
-            
-            with pytest.raises(ModelError) as exc_info:
-                provider._parse_response(response_bytes)
-            
-            assert "No text content found in Bedrock response" in str(exc_info.value)
-    
-    def test_generate_success(self):
+        
+        assert not provider.prompt_cache_enabled
+        assert "does not support prompt caching" in mock_get_logger.return_value.warning.call_args[0][0]
+        body = json.loads(provider._prepare_request_body("System", "Task", 100))
+        assert body["system"] == "System"
+    
+    @pytest.mark.parametrize("response_data,expected", [
+        ({"content": [{"text": "Hello! How can I help you?"}]}, "Hello! How can I help you?"),
+        # Legacy completion format
+        ({"completion": "This is a legacy response format"}, "This is a legacy response format"),
+    ], ids=["content", "legacy_completion"])
+    def test_parse_response(self, shared_provider, response_data, expected):
+        """Test response parsing for current and legacy formats."""
+        provider = shared_provider
+        
+        assert provider._parse_response(json.dumps(response_data).encode('utf-8')) == expected
+    
+    @pytest.mark.parametrize("response_bytes,expected_message", [
+        (b"invalid json", "Failed to parse Bedrock response JSON"),
+        (b"{}", "No text content found in Bedrock response"),
+    ], ids=["invalid_json", "no_content"])
+    def test_parse_response_errors(self, shared_provider, response_bytes, expected_message):
+        """Test response parsing with invalid JSON or no content."""
+        provider = shared_provider
+        
+        with pytest.raises(ModelError, match=re.escape(expected_message)):
+            provider._parse_response(response_bytes)
+    
+    def test_generate_success(self, provider):
         """Test successful text generation."""
-        with patch('agentkit.models.bedrock_provider.boto3') as mock_boto3:
-            mock_session = Mock()
-            mock_client = Mock()
-            mock_session.client.return_value = mock_client
-            mock_boto3.Session.return_value = mock_session
-            mock_client.list_foundation_models.return_value = {}
-            
-            # Mock successful invoke_model response
-            response_data = {
-                "content": [
-                    {"text": "Generated response text"}
-                ]
-            }
-            mock_response = {
-                'body': Mock()
-            }
-            mock_response['body'].read.return_value = json.dumps(response_data).encode('utf-8')
-            mock_client.invoke_model.return_value = mock_response
-            
-            provider = BedrockProvider("claude-3-sonnet")
-            
-            result = provider.generate(
-                system_prompt="You are helpful",
-                task_prompt="Say hello",
-                max_tokens=100
-            )
-            
-            assert result == "Generated response text"
-            
-            # Verify the invoke_model call
-            mock_client.invoke_model.assert_called_once()
-            call_args = mock_client.invoke_model.call_args
-            
-            assert call_args[1]["modelId"] == "anthropic.claude-3-sonnet-20240229-v1:0"
-            assert call_args[1]["contentType"] == "application/json"
-            assert call_args[1]["accept"] == "application/json"
-            
-            # Check request body
-            body = json.loads(call_args[1]["body"])
-            assert body["system"] == "You are helpful"
-            assert body["messages"][0]["content"] == "Say hello"
-            assert body["max_tokens"] == 100
-    
-    def test_generate_invalid_parameters(self):
-        """Test generation with invalid parameters."""
-        with patch('agentkit.models.bedrock_provider.boto3') as mock_boto3:
-            mock_session = Mock()
-            mock_client = Mock()
-            mock_session.client.return_value = mock_client
-            mock_boto3.Session.return_value = mock_session
-            mock_client.list_foundation_models.return_value = {}
-            
-            provider = BedrockProvider("claude-3-sonnet")
-            
-            # Test empty prompts
-            with pytest.raises(ModelError) as exc_info:
-                provider.generate("", "task", 100)
-            assert "Both system_prompt and task_prompt are required" in str(exc_info.value)
-            
-            # Test invalid max_tokens
-            with pytest.raises(ModelError) as exc_info:
-                provider.generate("system", "task", 0)
-            assert "max_tokens must be between 1 and 4096" in str(exc_info.value)
-    
-    def test_generate_throttling_retry(self):
-        """Test generation with throttling and retry logic."""
-        with patch('agentkit.models.bedrock_provider.boto3') as mock_boto3:
-            with patch('agentkit.models.bedrock_provider.time.sleep'):  # Speed up tests
-                mock_session = Mock()
-                mock_client = Mock()
-                mock_session.client.return_value = mock_client
-                mock_boto3.Session.return_value = mock_session
-                mock_client.list_foundation_models.return_value = {}
-                
-                provider = BedrockProvider("claude-3-sonnet")
-                
-                # Mock throttling error then success
-                error_response = {
-                    'Error': {
-                        'Code': 'ThrottlingException',
-                        'Message': 'Rate exceeded'
-                    }
-                }
-                throttling_error = ClientError(error_response, 'InvokeModel')
-                
-                success_response = {
-                    'body': Mock()
-                }
-                response_data = {
-                    "content": [{"text": "Success after retry"}]
-                }
-                success_response['body'].read.return_value = json.dumps(response_data).encode('utf-8')
-                
-                mock_client.invoke_model.side_effect = [throttling_error, success_response]
-                
-                result = provider.generate("system", "task", 100)
-                assert result == "Success after retry"
-                assert mock_client.invoke_model.call_count == 2
-    
-    def test_generate_validation_error(self):
-        """Test generation with validation error (no retry)."""
-        with patch('agentkit.models.bedrock_provider.boto3') as mock_boto3:
-            mock_session = Mock()
-            mock_client = Mock()
-            mock_session.client.return_value = mock_client
-            mock_boto3.Session.return_value = mock_session
-            mock_client.list_foundation_models.return_value = {}
-            
-            provider = BedrockProvider("claude-3-sonnet")
-            
-            error_response = {
-                'Error': {
-                    'Code': 'ValidationException',
-                    'Message': 'Invalid request parameters'
-                }
-            }
-            validation_error = ClientError(error_response, 'InvokeModel')
-            mock_client.invoke_model.side_effect = validation_error
-            
-            with pytest.raises(ModelError) as exc_info:
-                provider.generate("system", "task", 100)
-            
-            assert "Invalid request" in str(exc_info.value)
-            # Should not retry validation errors
-            assert mock_client.invoke_model.call_count == 1
-    
-    def test_generate_access_denied_error(self):
-        """Test generation with access denied error."""
-        with patch('agentkit.models.bedrock_provider.boto3') as mock_boto3:
-            mock_session = Mock()
-            mock_client = Mock()
-            mock_session.client.return_value = mock_client
-            mock_boto3.Session.return_value = mock_session
-            mock_client.list_foundation_models.return_value = {}
-            
+        provider, mock_client = provider
+        
+        # Mock successful invoke_model response
+        mock_client.invoke_model.return_value = _GENERATED_RESPONSE
+        
+        result = provider.generate(
+            system_prompt="You are helpful",
+            task_prompt="Say hello",
+            max_tokens=100
+        )
+        
+        assert result == "Generated response text"
+        
+        # Verify the invoke_model call
+        mock_client.invoke_model.assert_called_once()
+        call_kwargs = dict(mock_client.invoke_model.call_args.kwargs)
+        body = json.loads(call_kwargs.pop("body"))
+        
+        assert call_kwargs == {
+            "modelId": "anthropic.claude-3-sonnet-20240229-v1:0",
+            "contentType": "application/json",
+            "accept": "application/json"
+        }
+        assert body == _EXPECTED_REQUEST_BODY
+    
+    def test_generate_batch_preserves_order(self, provider):
+        """Test that batch generation returns one response per prompt, in order."""
+        provider, mock_client = provider
+        
+        def invoke_model(**kwargs):
+            task = json.loads(kwargs["body"])["messages"][0]["content"]
+            return _response(f"Answer to {task}")
+        
+        mock_client.invoke_model.side_effect = invoke_model
+        
+        results = provider.generate_batch(
+            [("System", "one"), ("System", "two"), ("System", "three")],
+            max_tokens=100,
+            max_workers=2
+        )
+        
+        assert results == ["Answer to one", "Answer to two", "Answer to three"]
+        assert mock_client.invoke_model.call_count == 3
+    
+    def test_generate_uses_response_cache(self, bedrock_env):
+        """Test that identical requests are served from the response cache."""
+        _, _, mock_client = bedrock_env
+        mock_client.invoke_model.return_value = _CACHED_RESPONSE
+        
+        with patch('agentkit.models.bedrock_provider.get_response_cache',
+                   return_value=ResponseCache("enabled")):
             provider = BedrockProvider("claude-3-sonnet")
-            
-            error_response = {
-                'Error': {
-                    'Code': 'AccessDeniedException',
-                    'Message': 'You do not have permission'
-                }
-            }
-            access_error = ClientError(error_response, 'InvokeModel')
-            mock_client.invoke_model.side_effect = access_error
-            
-            with pytest.raises(ModelError) as exc_info:
-                provider.generate("system", "task", 100)
-            
-            assert "Access denied" in str(exc_info.value)
-    
-    def test_generate_model_not_found_error(self):
-        """Test generation with model not found error."""
-        with patch('agentkit.models.bedrock_provider.boto3') as mock_boto3:
-            mock_session = Mock()
-            mock_client = Mock()
-            mock_session.client.return_value = mock_client
-            mock_boto3.Session.return_value = mock_session
-            mock_client.list_foundation_models.return_value = {}
-            
+        
+        assert provider.generate("System", "Task", 100) == "Cached text"
+        assert provider.generate("System", "Task", 100) == "Cached text"
+        mock_client.invoke_model.assert_called_once()
+    
+    def test_generate_replay_miss_raises_error(self, bedrock_env):
+        """Test that replay mode never calls the model."""
+        _, _, mock_client = bedrock_env
+        
+        with patch('agentkit.models.bedrock_provider.get_response_cache',
+                   return_value=ResponseCache("replay")):
             provider = BedrockProvider("claude-3-sonnet")
-            
-            error_response = {
-                'Error': {
-                    'Code': 'ResourceNotFoundException',
-                    'Message': 'Model not found'
-                }
-            }
-            not_found_error = ClientError(error_response, 'InvokeModel')
-            mock_client.invoke_model.side_effect = not_found_error
-            
-            with pytest.raises(ModelError) as exc_info:
-                provider.generate("system", "task", 100)
-            
-            assert "Model not found" in str(exc_info.value)
-    
-    def test_generate_max_retries_exceeded(self):
-        """Test generation when max retries are exceeded."""
-        with patch('agentkit.models.bedrock_provider.boto3') as mock_boto3:
-            with patch('agentkit.models.bedrock_provider.time.sleep'):  # Speed up tests
-                mock_session = Mock()
-                mock_client = Mock()
-                mock_session.client.return_value = mock_client
-                mock_boto3.Session.return_value = mock_session
-                mock_client.list_foundation_models.return_value = {}
-                
-                provider = BedrockProvider("claude-3-sonnet")
-                
-                # Mock persistent throttling
-                error_response = {
-                    'Error': {
-                        'Code': 'ThrottlingException',
-                        'Message': 'Rate exceeded'
-                    }
-                }
-                throttling_error = ClientError(error_response, 'InvokeModel')
-                mock_client.invoke_model.side_effect = throttling_error
-                
-                with pytest.raises(ModelError) as exc_info:
-                    provider.generate("system", "task", 100)
-                
-                assert "Rate limit exceeded after 3 attempts" in str(exc_info.value)
-                assert mock_client.invoke_model.call_count == 3
+        
+        with pytest.raises(ModelError, match="replay mode"):
+            provider.generate("System", "Task", 100)
+        
+        mock_client.invoke_model.assert_not_called()
+    
+    def test_generate_invalid_parameters(self, shared_provider):
+        """Test generation with invalid parameters."""
+        provider = shared_provider
+        
+        # Test empty prompts
+        with pytest.raises(ModelError, match="Both system_prompt and task_prompt are required"):
+            provider.generate("", "task", 100)
+        
+        # Test invalid max_tokens
+        with pytest.raises(ModelError, match="max_tokens must be between 1 and 4096"):
+            provider.generate("system", "task", 0)
+    
+    def test_client_uses_adaptive_retries(self, bedrock_env):
+        """Test that retries are delegated to botocore's adaptive retry mode."""
+        _, mock_session, _ = bedrock_env
+        
+        BedrockProvider("claude-3-sonnet")
+        
+        config = mock_session.client.call_args[1]["config"]
+        assert config.retries == {"mode": "adaptive", "total_max_attempts": 3}
+    
+    @pytest.mark.parametrize("error,expected_message", [
+        (_client_error("ValidationException"), "Invalid request"),
+        (_client_error("AccessDeniedException"), "Access denied"),
+        (_client_error("ResourceNotFoundException"), "Model not found"),
+        (_client_error("UnauthorizedOperation"), "Insufficient permissions"),
+        # Throttling that outlasted botocore's retries
+        (_client_error("ThrottlingException"), "Rate limit exceeded after 3 attempts"),
+    ], ids=["validation", "access_denied", "not_found", "unauthorized", "throttle_exhausted"])
+    def test_generate_client_errors(self, provider, error, expected_message):
+        """Test that Bedrock client errors map to ModelError without retrying in Python."""
+        provider, mock_client = provider
+        mock_client.invoke_model.side_effect = error
+        
+        with pytest.raises(ModelError, match=re.escape(expected_message)):
+            provider.generate("system", "task", 100)
+        
+        # botocore makes any retry attempts inside a single client call
+        assert mock_client.invoke_model.call_count == 1
+    
+    def test_generate_retries_model_timeout(self, provider, _no_sleep):
+        """Test that model timeouts, which botocore does not retry, are retried."""
+        provider, mock_client = provider
+        mock_client.invoke_model.side_effect = [_MODEL_TIMEOUT_ERROR, _GENERATED_RESPONSE]
+        _no_sleep.reset_mock()
+        
+        assert provider.generate("system", "task", 100) == "Generated response text"
+        
+        assert mock_client.invoke_model.call_count == 2
+        _no_sleep.assert_called_once()
+    
+    def test_generate_model_timeout_exhausted(self, provider):
+        """Test that persistent model timeouts fail after MAX_ATTEMPTS attempts."""
+        provider, mock_client = provider
+        mock_client.invoke_model.side_effect = _MODEL_TIMEOUT_ERROR
+        
+        with pytest.raises(ModelError, match="Model timeout after 3 attempts"):
+            provider.generate("system", "task", 100)
+        
+        assert mock_client.invoke_model.call_count == 3
+    
+    def test_generate_prompt_too_long(self, provider):
+        """Test that oversized prompts fail before a request is sent."""
+        provider, mock_client = provider
+        mock_client.invoke_model.side_effect = _PROMPT_TOO_LONG_ERROR
+        
+        with pytest.raises(ModelError, match="exceeds the context window"):
+            provider.generate("system", "x" * provider.MAX_PROMPT_CHARS, 100)
+        mock_client.invoke_model.assert_not_called()
+        
+        # Only the exact request shape Bedrock rejected fails locally
+        with pytest.raises(ModelError, match="Invalid request"):
+            provider.generate("system", "x" * 1000, 100)
+        with pytest.raises(ModelError, match="already rejected"):
+            provider.generate("system", "y" * 1000, 100)
+        assert mock_client.invoke_model.call_count == 1
+        
+        with pytest.raises(ModelError, match="Invalid request"):
+            provider.generate("system", "x" * 2000, 100)
+        assert mock_client.invoke_model.call_count == 2
+        
+        clear_rejected_prompt_cache()
+        with pytest.raises(ModelError, match="Invalid request"):
+            provider.generate("system", "x" * 1000, 100)
+        assert mock_client.invoke_model.call_count == 3
+    
+    def test_generate_stream(self, provider):
+        """Test that streaming yields text deltas from the event stream."""
+        provider, mock_client = provider
+        mock_client.invoke_model_with_response_stream.return_value = {'body': _STREAM_EVENTS}
+        
+        chunks = provider.generate_stream("system", "task", 100)
+        
+        # The request is only sent once iteration starts
+        mock_client.invoke_model_with_response_stream.assert_not_called()
+        assert list(chunks) == ["Hello", " world"]
+        mock_client.invoke_model.assert_not_called()
+    
+    def test_generate_stream_error_event(self, provider):
+        """Test that error events in the stream raise ModelError."""
+        provider, mock_client = provider
+        mock_client.invoke_model_with_response_stream.return_value = {
+            'body': [{'throttlingException': {'message': 'Too many tokens'}}]
+        }
+        
+        with pytest.raises(ModelError, match="Too many tokens"):
+            list(provider.generate_stream("system", "task", 100))
+    
+    def test_generate_stream_falls_back_when_unsupported(self, provider):
+        """Test the non-streaming fallback for models that reject streaming."""
+        provider, mock_client = provider
+        mock_client.invoke_model_with_response_stream.side_effect = _STREAMING_UNSUPPORTED_ERROR
+        mock_client.invoke_model.return_value = _FULL_RESPONSE
+        
+        with patch('agentkit.models.bedrock_provider._no_stream_models', set()) as no_stream_models:
+            assert list(provider.generate_stream("system", "task", 100)) == ["Full response"]
+            assert list(provider.generate_stream("system", "task", 100)) == ["Full response"]
+            assert no_stream_models == {"anthropic.claude-3-sonnet-20240229-v1:0"}
+        mock_client.invoke_model_with_response_stream.assert_called_once()
+
+
+# These should match AWS Bedrock's actual model IDs
+EXPECTED_MODEL_MAPPING = {
+    "claude-3-opus": "anthropic.claude-3-opus-20240229-v1:0",
+    "claude-3-sonnet": "anthropic.claude-3-sonnet-20240229-v1:0",
+    "claude-3-haiku": "anthropic.claude-3-haiku-20240307-v1:0"
+}
 
 
 class TestBedrockProviderModelMapping:
     """Test model name mapping functionality."""
     
     def test_all_models_mapped(self):
-        """Test that all supported models have correct Bedrock mappings."""
-        expected_mappings = {
-            "claude-3-opus": "anthropic.claude-3-opus-20240229-v1:0",
-            "claude-3-sonnet": "anthropic.claude-3-sonnet-20240229-v1:0", 
-            "claude-3-haiku": "anthropic.claude-3-haiku-20240307-v1:0"
-        }
-        
-        assert BedrockProvider.MODEL_MAPPING == expected_mappings
+        """Test that exactly the supported models have Bedrock mappings."""
+        assert BedrockProvider.MODEL_MAPPING == EXPECTED_MODEL_MAPPING
     
-    def test_model_mapping_accuracy(self):
-        """Test that model mappings match expected Bedrock model IDs."""
-        # These should match AWS Bedrock's actual model IDs
-        opus_id = BedrockProvider.MODEL_MAPPING["claude-3-opus"]
-        sonnet_id = BedrockProvider.MODEL_MAPPING["claude-3-sonnet"]
-        haiku_id = BedrockProvider.MODEL_MAPPING["claude-3-haiku"]
-        
-        assert opus_id.startswith("anthropic.claude-3-opus")
-        assert sonnet_id.startswith("anthropic.claude-3-sonnet")
-        assert haiku_id.startswith("anthropic.claude-3-haiku")
-        
-        assert all(model_id.endswith(":0") for model_id in BedrockProvider.MODEL_MAPPING.values())
+    @pytest.mark.parametrize("alias,model_id", EXPECTED_MODEL_MAPPING.items(), ids=list(EXPECTED_MODEL_MAPPING))
+    def test_model_mapping_accuracy(self, alias, model_id):
+        """Test that each alias maps to its Bedrock model ID."""
+        assert BedrockProvider.MODEL_MAPPING[alias] == model_id
+        assert model_id.startswith(f"anthropic.{alias}")
+        assert model_id.endswith(":0")
 
 
 if __name__ == "__main__":
@@ -2,7 +2,7 @@
 
 import pytest
 import os
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 import json
 
 from agentkit.core.model_interface import (
@@ -10,11 +10,24 @@ from agentkit.core.model_interface import (
     ClaudeProvider,
     ModelError,
     get_model_provider,
+    clear_secret_cache,
+    clear_anthropic_client_cache,
     get_supported_models,
+    _TokenBucket,
 )
 from agentkit.core.config import Config
 
 
+@pytest.fixture(autouse=True)
+def _clear_shared_clients():
+    """Ensure each test builds clients and fetches secrets through its patches."""
+    clear_secret_cache()
+    clear_anthropic_client_cache()
+    yield
+    clear_secret_cache()
+    clear_anthropic_client_cache()
+
+
 class MockAnthropicClient:
     """Mock Anthropic client for testing."""
     
@@ -45,6 +58,17 @@ class TestModelProvider:
         """Test that ModelProvider cannot be instantiated directly."""
         with pytest.raises(TypeError):
             ModelProvider("test-model")
+    
+    def test_default_agenerate_wraps_generate(self):
+        """Test that agenerate falls back to the synchronous generate."""
+        import asyncio
+        
+        class EchoProvider(ModelProvider):
+            def generate(self, system_prompt, task_prompt, max_tokens=1024):
+                return f"{system_prompt}:{task_prompt}:{max_tokens}"
+        
+        provider = EchoProvider("echo-model")
+        assert asyncio.run(provider.agenerate("system", "task", 10)) == "system:task:10"
 
 
 class TestClaudeProvider:
@@ -122,6 +146,75 @@ class TestClaudeProvider:
             provider = ClaudeProvider("claude-3-sonnet")
             mock_anthropic.assert_called_once_with(api_key='aws-secret-key')
     
+    @patch('agentkit.core.model_interface.ANTHROPIC_AVAILABLE', True)
+    @patch('agentkit.core.model_interface.BOTO3_AVAILABLE', True)
+    @patch('agentkit.core.model_interface.anthropic.Anthropic')
+    @patch('agentkit.core.model_interface.boto3.Session')
+    def test_aws_secret_is_cached(self, mock_boto3_session, mock_anthropic):
+        """Test that the secret and Secrets Manager client are reused."""
+        mock_secrets_client = Mock()
+        mock_boto3_session.return_value.client.return_value = mock_secrets_client
+        mock_secrets_client.get_secret_value.return_value = {
+            'SecretString': json.dumps({'anthropic_api_key': 'aws-secret-key'})
+        }
+        mock_anthropic.return_value = MockAnthropicClient()
+        
+        with patch.dict(os.environ, {
+            'ANTHROPIC_API_KEY': 'test-api-key',
+            'ANTHROPIC_SECRET_ARN': 'arn:aws:secretsmanager:us-east-1:123456789012:secret:test'
+        }):
+            provider = ClaudeProvider("claude-3-sonnet")
+            assert provider._get_secret_from_aws() == 'aws-secret-key'
+            assert provider._get_secret_from_aws() == 'aws-secret-key'
+        
+        mock_boto3_session.assert_called_once()
+        mock_secrets_client.get_secret_value.assert_called_once()
+    
+    @patch('agentkit.core.model_interface.ANTHROPIC_AVAILABLE', True)
+    @patch('agentkit.core.model_interface.BOTO3_AVAILABLE', True)
+    @patch('agentkit.core.model_interface.anthropic.Anthropic')
+    @patch('agentkit.core.model_interface.boto3.Session')
+    @patch('urllib3.PoolManager')
+    def test_aws_secret_signed_request_in_lambda(self, mock_pool_manager, mock_boto3_session, mock_anthropic):
+        """Test that Lambda fetches the secret with a signed request instead of boto3."""
+        mock_http = mock_pool_manager.return_value
+        mock_http.request.return_value = Mock(
+            status=200,
+            data=json.dumps({'SecretString': json.dumps({'api_key': 'lambda-secret-key'})}).encode()
+        )
+        mock_anthropic.return_value = MockAnthropicClient()
+        
+        with patch.dict(os.environ, {
+            'ANTHROPIC_API_KEY': 'test-api-key',
+            'ANTHROPIC_SECRET_ARN': 'arn:aws:secretsmanager:eu-west-1:123456789012:secret:test',
+            'AWS_LAMBDA_FUNCTION_NAME': 'agent',
+            'AWS_ACCESS_KEY_ID': 'AKIDEXAMPLE',
+            'AWS_SECRET_ACCESS_KEY': 'secret',
+            'AWS_SESSION_TOKEN': 'token'
+        }):
+            provider = ClaudeProvider("claude-3-sonnet")
+            assert provider._get_secret_from_aws() == 'lambda-secret-key'
+        
+        mock_boto3_session.assert_not_called()
+        method, url = mock_http.request.call_args[0]
+        headers = mock_http.request.call_args[1]['headers']
+        assert (method, url) == ("POST", "https://secretsmanager.eu-west-1.amazonaws.com/")
+        assert headers['X-Amz-Target'] == "secretsmanager.GetSecretValue"
+        assert headers['Authorization'].startswith("AWS4-HMAC-SHA256")
+    
+    @patch('agentkit.core.model_interface.ANTHROPIC_AVAILABLE', True)
+    @patch('agentkit.core.model_interface.anthropic.Anthropic')
+    def test_client_shared_between_providers(self, mock_anthropic):
+        """Test that providers with the same API key share one client."""
+        mock_anthropic.return_value = MockAnthropicClient()
+        
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-api-key'}):
+            first = ClaudeProvider("claude-3-sonnet")
+            second = ClaudeProvider("claude-3-haiku")
+        
+        assert first.client is second.client
+        mock_anthropic.assert_called_once_with(api_key='test-api-key')
+    
     @patch('agentkit.core.model_interface.ANTHROPIC_AVAILABLE', True)
     @patch('agentkit.core.model_interface.anthropic.Anthropic')
     def test_generate_with_valid_inputs(self, mock_anthropic):
@@ -222,6 +315,169 @@ class TestClaudeProvider:
                 
             assert response == "Success after retry"
             assert mock_client.messages.create.call_count == 2
+    
+    @patch('agentkit.core.model_interface.ANTHROPIC_AVAILABLE', True)
+    @patch('agentkit.core.model_interface.anthropic.Anthropic')
+    def test_rate_limit_retry_honors_retry_after(self, mock_anthropic):
+        """Test that backoff is jittered but never shorter than Retry-After."""
+        import anthropic
+        
+        mock_client = Mock()
+        mock_response = Mock()
+        mock_content = Mock()
+        mock_content.text = "Success after retry"
+        mock_response.content = [mock_content]
+        
+        mock_error_response = Mock()
+        mock_error_response.status_code = 429
+        mock_error_response.headers = {"retry-after": "2"}
+        
+        mock_client.messages.create.side_effect = [
+            anthropic.RateLimitError("Rate limited", response=mock_error_response, body={}),
+            mock_response
+        ]
+        mock_anthropic.return_value = mock_client
+        
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}):
+            provider = ClaudeProvider("claude-3-sonnet")
+            
+            with patch('agentkit.core.model_interface.random.uniform', return_value=0.5) as mock_uniform, \
+                 patch('time.sleep') as mock_sleep:
+                response = provider.generate("system", "task", 100)
+            
+            assert response == "Success after retry"
+            mock_uniform.assert_called_once_with(0, 1.0)
+            mock_sleep.assert_called_once_with(2.0)
+    
+    @patch('agentkit.core.model_interface.ANTHROPIC_AVAILABLE', True)
+    @patch('agentkit.core.model_interface.anthropic.Anthropic')
+    def test_generate_stream_yields_chunks(self, mock_anthropic):
+        """Test that generate_stream yields text chunks from messages.stream."""
+        mock_client = Mock()
+        mock_stream = MagicMock()
+        mock_stream.__enter__.return_value.text_stream = iter(["Hello", ", ", "world"])
+        mock_client.messages.stream.return_value = mock_stream
+        mock_anthropic.return_value = mock_client
+        
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}):
+            provider = ClaudeProvider("claude-3-haiku")
+            
+            chunks = list(provider.generate_stream("system", "task", 100))
+            
+            assert chunks == ["Hello", ", ", "world"]
+            call_kwargs = mock_client.messages.stream.call_args[1]
+            assert call_kwargs['model'] == "claude-3-haiku-20240307"
+            assert call_kwargs['max_tokens'] == 100
+            
+            with pytest.raises(ModelError) as exc_info:
+                provider.generate_stream("", "task", 100)
+            assert "required" in str(exc_info.value)
+    
+    @patch('agentkit.core.model_interface.ANTHROPIC_AVAILABLE', True)
+    @patch('agentkit.core.model_interface.anthropic.AsyncAnthropic')
+    @patch('agentkit.core.model_interface.anthropic.Anthropic')
+    def test_agenerate_batch_preserves_order(self, mock_anthropic, mock_async_anthropic):
+        """Test that batch generation returns one response per prompt, in order."""
+        import asyncio
+        
+        async def create_message(**kwargs):
+            mock_response = Mock()
+            mock_content = Mock()
+            mock_content.text = f"Answer to {kwargs['messages'][0]['content']}"
+            mock_response.content = [mock_content]
+            return mock_response
+        
+        mock_async_client = Mock()
+        mock_async_client.messages.create = AsyncMock(side_effect=create_message)
+        mock_async_anthropic.return_value = mock_async_client
+        mock_anthropic.return_value = MockAnthropicClient()
+        
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}):
+            provider = ClaudeProvider("claude-3-haiku")
+            
+            responses = asyncio.run(
+                provider.agenerate_batch("system", ["one", "two", "three"], 100, concurrency=2)
+            )
+            
+            assert responses == ["Answer to one", "Answer to two", "Answer to three"]
+            assert mock_async_client.messages.create.call_count == 3
+            mock_async_anthropic.assert_called_once()
+    
+    @patch('agentkit.core.model_interface.ANTHROPIC_AVAILABLE', True)
+    @patch('agentkit.core.model_interface.anthropic.AsyncAnthropic')
+    @patch('agentkit.core.model_interface.anthropic.Anthropic')
+    def test_agenerate_retries_like_generate(self, mock_anthropic, mock_async_anthropic):
+        """Test that the async path shares generate's retry classification and backoff."""
+        import anthropic
+        import asyncio
+        
+        mock_error_response = Mock()
+        mock_error_response.status_code = 429
+        mock_error_response.headers = {"retry-after": "2"}
+        mock_response = Mock()
+        mock_response.content = [Mock(text="Success after retry")]
+        
+        mock_async_client = Mock()
+        mock_async_client.messages.create = AsyncMock(side_effect=[
+            anthropic.RateLimitError("Rate limited", response=mock_error_response, body={}),
+            mock_response,
+            Mock(content=[])
+        ])
+        mock_async_anthropic.return_value = mock_async_client
+        mock_anthropic.return_value = MockAnthropicClient()
+        
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}):
+            provider = ClaudeProvider("claude-3-haiku")
+            
+            with patch('agentkit.core.model_interface.random.uniform', return_value=0.5), \
+                 patch('agentkit.core.model_interface.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+                assert asyncio.run(provider.agenerate("system", "task", 100)) == "Success after retry"
+                mock_sleep.assert_awaited_once_with(2.0)
+                
+                # A response without text is a final error, not a retry
+                with pytest.raises(ModelError, match="^No text content in response$"):
+                    asyncio.run(provider.agenerate("system", "task", 100))
+                mock_sleep.assert_awaited_once()
+
+
+class TestRateLimiting:
+    """Test client-side rate limiting."""
+    
+    def test_token_bucket_reports_wait_for_deficit(self):
+        """Test that reservations beyond capacity report the refill wait."""
+        with patch('agentkit.core.model_interface.time.monotonic', return_value=100.0):
+            bucket = _TokenBucket(capacity=2, refill_rate=1.0)
+            assert bucket.reserve(1) == 0.0
+            assert bucket.reserve(1) == 0.0
+            assert bucket.reserve(1) == pytest.approx(1.0)
+            assert bucket.reserve(1) == pytest.approx(2.0)
+    
+    @patch('agentkit.core.model_interface.ANTHROPIC_AVAILABLE', True)
+    @patch('agentkit.core.model_interface.anthropic.Anthropic')
+    @patch('agentkit.core.model_interface.time.sleep')
+    def test_generate_waits_when_rpm_exhausted(self, mock_sleep, mock_anthropic):
+        """Test that generate sleeps instead of exceeding the configured RPM."""
+        mock_anthropic.return_value = MockAnthropicClient()
+        
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key', 'ANTHROPIC_RPM_LIMIT': '1'}):
+            provider = ClaudeProvider("claude-3-haiku")
+            provider.generate("system", "first", 100)
+            mock_sleep.assert_not_called()
+            
+            provider.generate("system", "second", 100)
+            mock_sleep.assert_called_once()
+            assert mock_sleep.call_args[0][0] > 0
+    
+    @patch('agentkit.core.model_interface.ANTHROPIC_AVAILABLE', True)
+    @patch('agentkit.core.model_interface.anthropic.Anthropic')
+    def test_invalid_rate_limit_raises_error(self, mock_anthropic):
+        """Test that a non-numeric limit is rejected."""
+        mock_anthropic.return_value = MockAnthropicClient()
+        
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key', 'ANTHROPIC_TPM_LIMIT': 'lots'}):
+            with pytest.raises(ModelError) as exc_info:
+                ClaudeProvider("claude-3-haiku")
+            assert "ANTHROPIC_TPM_LIMIT" in str(exc_info.value)
 
 
 class TestModelFactory:
@@ -274,6 +530,20 @@ class TestModelFactory:
             get_model_provider("claude-3-sonnet", provider="ANTHROPIC")
             mock_provider.assert_called_once_with("claude-3-sonnet", None)
     
+    @patch('agentkit.core.model_interface.ANTHROPIC_AVAILABLE', True)
+    @patch('agentkit.core.model_interface.anthropic.Anthropic')
+    def test_get_model_provider_shares_clients_not_instances(self, mock_anthropic):
+        """Test that each call builds a new provider around the shared SDK client."""
+        mock_anthropic.return_value = MockAnthropicClient()
+        
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}):
+            first = get_model_provider("claude-3-haiku", provider="anthropic")
+            second = get_model_provider("claude-3-haiku", provider="anthropic")
+        
+        assert first is not second
+        assert first.client is second.client
+        mock_anthropic.assert_called_once_with(api_key='test-key')
+    
     def test_get_model_provider_with_unsupported_model(self):
         """Test factory raises error for unsupported models."""
         with pytest.raises(ModelError) as exc_info:
@@ -0,0 +1,91 @@
+"""Tests for the model response cache."""
+
+import os
+import pytest
+from unittest.mock import patch
+
+from agentkit.core.response_cache import (
+    ResponseCache,
+    get_response_cache,
+    clear_response_caches,
+)
+
+
+class TestResponseCache:
+    """Test ResponseCache policies and eviction."""
+    
+    def test_make_key_is_deterministic(self):
+        """Test that identical requests map to the same key."""
+        key = ResponseCache.make_key("bedrock", "model", '{"max_tokens": 10}')
+        
+        assert key == ResponseCache.make_key("bedrock", "model", '{"max_tokens": 10}')
+        assert key != ResponseCache.make_key("bedrock", "model", '{"max_tokens": 11}')
+        assert len(key) == 64
+    
+    def test_enabled_policy_round_trip(self):
+        """Test that enabled caches store and return responses."""
+        cache = ResponseCache("enabled")
+        cache.put("key", "response")
+        
+        assert cache.get("key") == "response"
+        assert cache.get("missing") is None
+    
+    @pytest.mark.parametrize("policy,readable,writable", [
+        ("read_only", True, False),
+        ("write_only", False, True),
+        ("replay", True, False),
+        ("disabled", False, False),
+    ])
+    def test_policy_permissions(self, policy, readable, writable):
+        """Test which operations each policy allows."""
+        cache = ResponseCache(policy)
+        
+        assert cache.readable is readable
+        assert cache.writable is writable
+        
+        cache.put("key", "response")
+        assert len(cache._memory) == (1 if writable else 0)
+    
+    def test_unknown_policy_raises_error(self):
+        """Test that unknown policies are rejected."""
+        with pytest.raises(ValueError) as exc_info:
+            ResponseCache("sometimes")
+        assert "Unknown response cache policy" in str(exc_info.value)
+    
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = ResponseCache("enabled", maxsize=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")
+        cache.put("c", "3")
+        
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+        assert cache.get("c") == "3"
+
+
+class TestGetResponseCache:
+    """Test the shared response cache factory."""
+    
+    @pytest.fixture(autouse=True)
+    def _clear_caches(self):
+        """Ensure each test starts without shared caches."""
+        clear_response_caches()
+        yield
+        clear_response_caches()
+    
+    def test_disabled_by_default(self):
+        """Test that caching is off unless configured."""
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("AGENTKIT_RESPONSE_CACHE", None)
+            assert get_response_cache().policy == "disabled"
+    
+    def test_shared_per_policy(self):
+        """Test that providers with the same settings share a cache."""
+        with patch.dict(os.environ, {"AGENTKIT_RESPONSE_CACHE": "enabled"}):
+            first = get_response_cache()
+            second = get_response_cache()
+        
+        assert first is second
+        assert first.policy == "enabled"
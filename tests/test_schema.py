@@ -4,12 +4,14 @@ import pytest
 import tempfile
 import os
 from pathlib import Path
+from unittest.mock import patch
 import yaml
 
 from agentkit.core.schema import (
     load_and_validate_config,
     validate_config_dict,
     ConfigValidationError,
+    clear_config_cache,
     get_available_models,
     create_example_config,
     AGENT_CONFIG_SCHEMA
@@ -201,6 +203,23 @@ class TestSchemaValidation:
         result = validate_config_dict(valid_config)
         assert result["agent"]["tools"] == ["web_search", "file_read", "api_call"]
 
+    def test_empty_tools_list(self):
+        """Test that an empty tools list is accepted."""
+        config = {
+            "agent": {
+                "name": "test-agent",
+                "model": "claude-3-sonnet",
+                "tools": [],
+                "prompts": {
+                    "system": "System prompt",
+                    "task": "Task prompt"
+                }
+            }
+        }
+        
+        result = validate_config_dict(config)
+        assert result["agent"]["tools"] == []
+
     def test_empty_string_fields(self):
         """Test that empty string fields fail validation."""
         invalid_configs = [
@@ -329,6 +348,91 @@ class TestFileLoading:
         finally:
             os.unlink(yaml_file)
 
+    def test_load_uses_cache_for_unchanged_file(self):
+        """Test that repeated loads of an unchanged file share one read-only config."""
+        valid_config = {
+            "agent": {
+                "name": "cached-agent",
+                "model": "claude-3-haiku",
+                "prompts": {"system": "System", "task": "Task"}
+            }
+        }
+        
+        yaml_file = self.create_temp_yaml_file(valid_config)
+        clear_config_cache()
+        
+        try:
+            first = load_and_validate_config(yaml_file)
+            with pytest.raises(TypeError):
+                first["agent"]["name"] = "mutated"
+            
+            with patch('agentkit.core.schema.yaml.load') as mock_load:
+                second = load_and_validate_config(yaml_file)
+                mock_load.assert_not_called()
+            
+            assert second is first
+            assert second["agent"]["name"] == "cached-agent"
+        finally:
+            os.unlink(yaml_file)
+            clear_config_cache()
+
+    def test_load_reparses_modified_file(self):
+        """Test that modifying a file invalidates its cache entry."""
+        config = {
+            "agent": {
+                "name": "before",
+                "model": "claude-3-haiku",
+                "prompts": {"system": "System", "task": "Task"}
+            }
+        }
+        
+        yaml_file = self.create_temp_yaml_file(config)
+        clear_config_cache()
+        
+        try:
+            assert load_and_validate_config(yaml_file)["agent"]["name"] == "before"
+            
+            config["agent"]["name"] = "after-change"
+            with open(yaml_file, 'w') as f:
+                yaml.safe_dump(config, f)
+            
+            assert load_and_validate_config(yaml_file)["agent"]["name"] == "after-change"
+        finally:
+            os.unlink(yaml_file)
+            clear_config_cache()
+
+    def test_sidecar_cache_written_and_reused(self):
+        """Test that AGENTKIT_YAML_CACHE=1 writes a JSON sidecar and loads from it."""
+        valid_config = {
+            "agent": {
+                "name": "sidecar-agent",
+                "model": "claude-3-haiku",
+                "prompts": {"system": "System", "task": "Task"}
+            }
+        }
+        
+        yaml_file = self.create_temp_yaml_file(valid_config)
+        sidecar_file = yaml_file + ".cache.json"
+        clear_config_cache()
+        
+        try:
+            with patch.dict(os.environ, {"AGENTKIT_YAML_CACHE": "1"}):
+                load_and_validate_config(yaml_file)
+                assert os.path.exists(sidecar_file)
+                
+                clear_config_cache()
+                with patch('agentkit.core.schema.yaml.load') as mock_load:
+                    result = load_and_validate_config(yaml_file)
+                    mock_load.assert_not_called()
+            
+            assert result["agent"]["name"] == "sidecar-agent"
+            assert result["agent"]["tools"] == ()
+        finally:
+            os.unlink(yaml_file)
+            if os.path.exists(sidecar_file):
+                os.unlink(sidecar_file)
+            clear_config_cache()
+
 
 class TestUtilityFunctions:
     """Test utility functions."""
@@ -2,10 +2,13 @@
 
 import pytest
 import json
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 from typing import Dict, Any
 
-from agentkit.tools.base import BaseTool, ToolResult, ToolError
+from agentkit.tools.base import BaseTool, ToolResult, ToolError, clear_tool_result_cache
 from agentkit.tools.registry import ToolRegistry, get_global_registry
 from agentkit.tools.builtin import EchoTool, CalculatorTool, TextCountTool
 from agentkit.core.tool_executor import ToolExecutor
@@ -41,6 +44,28 @@ class MockTool(BaseTool):
         return f"Mock result: {kwargs['param1']}"
 
 
+class FailingTool(MockTool):
+    """Mock tool whose execution raises an unexpected error."""
+    
+    def _execute(self, **kwargs: Any) -> str:
+        raise RuntimeError("boom")
+
+
+class TestToolResult:
+    """Test ToolResult behaviour."""
+    
+    def test_metadata_created_on_access(self):
+        """Test that metadata defaults to an empty dict that can be updated."""
+        result = ToolResult(success=True, result=1)
+        
+        assert not hasattr(result, "__dict__")
+        assert result.to_dict()["metadata"] == {}
+        
+        result.metadata["source"] = "test"
+        assert result.to_dict()["metadata"] == {"source": "test"}
+        assert ToolResult(success=True, metadata={"a": 1}).metadata == {"a": 1}
+
+
 class TestBaseTool:
     """Test BaseTool abstract base class."""
     
@@ -49,6 +74,16 @@ class TestBaseTool:
         with pytest.raises(TypeError):
             BaseTool()
     
+    def test_incomplete_subclass_instantiation(self):
+        """Test that subclasses missing abstract members cannot be instantiated."""
+        class PartialTool(BaseTool):
+            name = "partial"
+        
+        with pytest.raises(TypeError) as exc_info:
+            PartialTool()
+        assert "_execute" in str(exc_info.value)
+        assert "name" not in PartialTool.__abstractmethods__
+    
     def test_tool_implementation(self):
         """Test that tools can be properly implemented."""
         tool = MockTool()
@@ -74,6 +109,51 @@ class TestBaseTool:
         assert "Invalid parameters" in str(exc_info.value)
         assert tool.name in str(exc_info.value)
     
+    def test_parameter_validation_without_fastjsonschema(self):
+        """Test that validation falls back to jsonschema when fastjsonschema is missing."""
+        with patch('agentkit.tools.base.FASTJSONSCHEMA_AVAILABLE', False):
+            tool = MockTool()
+        
+        assert tool._validate_fn is None
+        tool.validate_parameters({"param1": "test_value"})
+        with pytest.raises(ToolError) as exc_info:
+            tool.validate_parameters({"param1": 1})
+        assert "Invalid parameters" in str(exc_info.value)
+    
+    def test_unexpected_error_traceback_only_when_debugging(self):
+        """Test that unexpected errors log a traceback only at DEBUG level."""
+        tool = FailingTool()
+        
+        with patch.object(tool.logger, 'error') as mock_error:
+            result = tool.run(param1="value")
+            assert result.success is False
+            assert "Unexpected error in tool 'mock_tool': boom" in result.error
+            assert mock_error.call_args.kwargs["exc_info"] is False
+            
+            with patch.object(tool.logger, 'isEnabledFor', return_value=True):
+                tool.run(param1="value")
+            assert mock_error.call_args.kwargs["exc_info"] is True
+    
+    def test_identical_schemas_share_validators(self):
+        """Test that tools with identical schemas reuse one set of validators."""
+        class OtherMockTool(MockTool):
+            name = "other_mock_tool"
+        
+        tool, other = MockTool(), OtherMockTool()
+        assert tool._validator is other._validator
+        assert tool._validate_fn is other._validate_fn
+    
+    def test_invalid_schema_rejected_at_init(self):
+        """Test that an invalid parameters schema fails when the tool is created."""
+        class BadSchemaTool(MockTool):
+            @property
+            def parameters_schema(self) -> Dict[str, Any]:
+                return {"type": "not-a-type"}
+        
+        with pytest.raises(ToolError) as exc_info:
+            BadSchemaTool()
+        assert "Invalid parameters schema" in str(exc_info.value)
+    
     def test_run_success(self):
         """Test successful tool execution."""
         tool = MockTool()
@@ -150,6 +230,16 @@ class TestToolRegistry:
         registry.register_tool(MockTool)
         assert len(registry) == 1
     
+    def test_bulk_register(self):
+        """Test registering several tools at once, skipping invalid classes."""
+        registry = ToolRegistry()
+        registry.register_tool(EchoTool)
+        
+        count = registry.bulk_register([EchoTool, MockTool, CalculatorTool, dict])
+        
+        assert count == 2
+        assert registry.list_tools() == ["echo", "mock_tool", "calculator"]
+    
     def test_tool_list(self):
         """Test listing registered tools."""
         registry = ToolRegistry()
@@ -169,6 +259,61 @@ class TestToolRegistry:
         all_info = registry.get_all_tool_info()
         assert "mock_tool" in all_info
     
+    def test_register_class_attribute_name_without_instantiating(self):
+        """Test that tools with a class attribute name are not instantiated on registration."""
+        registry = ToolRegistry()
+        
+        with patch.object(EchoTool, '__init__', side_effect=AssertionError("instantiated")):
+            registry.register_tool(EchoTool)
+        assert "echo" in registry
+        
+        # Abstract classes are still rejected
+        class AbstractEchoTool(BaseTool):
+            name = "abstract_echo"
+        
+        with pytest.raises(ToolError):
+            registry.register_tool(AbstractEchoTool)
+    
+    def test_register_from_module(self):
+        """Test that tools defined in a module are registered, but not imported ones."""
+        registry = ToolRegistry()
+        
+        class LocalTool(MockTool):
+            name = "local_tool"
+        
+        count = registry.register_from_module(sys.modules[__name__])
+        
+        # MockTool is defined here; EchoTool and friends are only imported,
+        # and LocalTool is not a module attribute
+        assert count == 1
+        assert registry.list_tools() == ["mock_tool"]
+    
+    def test_tool_info_schema_is_a_copy(self):
+        """Test that editing a tool's info does not change the tool class's schema."""
+        info = EchoTool().get_tool_info()
+        info["parameters_schema"]["required"].append("bogus")
+        
+        assert EchoTool.parameters_schema["required"] == ["text"]
+    
+    def test_all_tool_info_cached_until_registry_changes(self):
+        """Test that tool info is reused until tools are registered or unregistered."""
+        registry = ToolRegistry()
+        registry.register_tool(MockTool)
+        
+        with patch.object(MockTool, 'get_tool_info', autospec=True, side_effect=MockTool.get_tool_info) as mock_info:
+            assert list(registry.get_all_tool_info()) == ["mock_tool"]
+            assert list(registry.get_all_tool_info()) == ["mock_tool"]
+            assert mock_info.call_count == 1
+            
+            registry.register_tool(EchoTool)
+            assert list(registry.get_all_tool_info()) == ["mock_tool", "echo"]
+            
+            registry.unregister_tool("echo")
+            assert list(registry.get_all_tool_info()) == ["mock_tool"]
+        
+        registry.get_all_tool_info()["mock_tool"]["parameters_schema"]["required"].append("bogus")
+        assert "bogus" not in registry.get_all_tool_info()["mock_tool"]["parameters_schema"]["required"]
+    
     def test_tool_unregistration(self):
         """Test tool unregistration."""
         registry = ToolRegistry()
@@ -251,6 +396,31 @@ class TestBuiltinTools:
         assert result.success is False
         assert "Invalid parameters" in result.error
     
+    def test_calculator_plain_numbers(self):
+        """Test that plain numbers evaluate like the equivalent Python literals."""
+        tool = CalculatorTool()
+        
+        for expression, expected in [("42", 42), ("-5", -5), ("3.14", 3.14), (" 0 ", 0)]:
+            result = tool._execute(expression=expression)
+            assert result == expected
+            assert type(result) is type(expected)
+        
+        # Integer literals with leading zeros are still rejected
+        result = tool.run(expression="007")
+        assert result.success is False
+    
+    def test_calculator_reuses_compiled_expressions(self):
+        """Test that repeated expressions are parsed only once."""
+        tool = CalculatorTool()
+        CalculatorTool._compile.cache_clear()
+        
+        assert tool._execute(expression="(2 + 3) * 4") == 20
+        assert tool._execute(expression="(2 + 3) * 4") == 20
+        
+        cache_info = CalculatorTool._compile.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 1
+    
     def test_text_count_tool(self):
         """Test TextCountTool functionality."""
         tool = TextCountTool()
@@ -275,6 +445,73 @@ class TestBuiltinTools:
         result = tool.run(text=test_text, count_type="lines")
         assert result.success is True
         assert result.result == 3
+    
+    def test_cacheable_tool_reuses_results(self):
+        """Test that cacheable tools skip validation and execution for repeated parameters."""
+        clear_tool_result_cache()
+        tool = TextCountTool()
+        
+        with patch.object(TextCountTool, '_execute', return_value=3) as mock_execute:
+            assert tool.run(text="a b c", count_type="words").result == 3
+            assert tool.run(text="a b c", count_type="words").result == 3
+            assert tool.run(text="a b", count_type="words").result == 3
+        
+        assert mock_execute.call_count == 2
+        clear_tool_result_cache()
+    
+    def test_cached_results_are_not_shared(self):
+        """Test that mutating a returned result does not change later cached results."""
+        clear_tool_result_cache()
+        tool = TextCountTool()
+        
+        first = tool.run(text="abc", count_type="all").result
+        first["words"] = 999
+        second = tool.run(text="abc", count_type="all").result
+        second["lines"] = 999
+        
+        assert tool.run(text="abc", count_type="all").result == {"characters": 3, "words": 1, "lines": 1}
+        clear_tool_result_cache()
+    
+    def test_result_cache_is_thread_safe(self):
+        """Test that cacheable tools run concurrently without cache errors."""
+        clear_tool_result_cache()
+        tool = EchoTool()
+        # A mix of hits and misses on a small cache, so entries are evicted
+        texts = [f"text {i}" for i in range(16)] * 500
+        random.Random(0).shuffle(texts)
+        
+        # Switch threads as often as possible so cache accesses interleave
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with patch('agentkit.tools.base._RESULT_CACHE_MAXSIZE', 8), \
+                 ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(lambda text: tool.run(text=text), texts))
+        finally:
+            sys.setswitchinterval(switch_interval)
+        
+        assert all(result.success for result in results), [r.error for r in results if not r.success][:3]
+        assert [result.result for result in results] == texts
+        clear_tool_result_cache()
+    
+    def test_non_cacheable_tool_always_executes(self):
+        """Test that tools are not cached unless they opt in."""
+        tool = MockTool()
+        assert MockTool.CACHEABLE is False
+        
+        with patch.object(MockTool, '_execute', return_value="ok") as mock_execute:
+            tool.run(param1="value")
+            tool.run(param1="value")
+        
+        assert mock_execute.call_count == 2
+    
+    def test_text_count_lines_matches_splitlines(self):
+        """Test that line counts match str.splitlines() for all line endings."""
+        tool = TextCountTool()
+        
+        for text in ["", "one", "one\n", "one\ntwo", "\n\n", "one\r\ntwo", "one\rtwo", "caf\u00e9\u2028bar", "   "]:
+            result = tool.run(text=text, count_type="lines")
+            assert result.result == len(text.splitlines()), repr(text)
 
 
 class TestToolExecutor:
@@ -302,6 +539,21 @@ class TestToolExecutor:
         assert "JSON" in context
         assert "tool_call" in context
     
+    def test_tools_context_reflects_registry_changes(self):
+        """Test that new executors see tools registered or removed since the last render."""
+        registry = get_global_registry()
+        tools_config = [{"name": "mock_tool", "parameters": {}}]
+        
+        assert "- mock_tool:" not in ToolExecutor(tools_config).get_tools_context()
+        
+        registry.register_tool(MockTool)
+        try:
+            assert "- mock_tool: A mock tool for testing" in ToolExecutor(tools_config).get_tools_context()
+        finally:
+            registry.unregister_tool("mock_tool")
+        
+        assert "- mock_tool:" not in ToolExecutor(tools_config).get_tools_context()
+    
     def test_tool_call_extraction(self):
         """Test tool call extraction from text."""
         executor = ToolExecutor([{"name": "echo", "parameters": {}}])
@@ -319,6 +571,17 @@ class TestToolExecutor:
         tool_call = executor.extract_tool_call(text)
         assert tool_call is None
     
+    def test_tool_call_extraction_with_braces_in_strings(self):
+        """Test that braces inside JSON strings do not end the tool call early."""
+        tools_config = [{"name": "echo", "parameters": {}}]
+        executor = ToolExecutor(tools_config)
+        
+        text = 'Before {"tool_call": {"name": "echo", "parameters": {"text": "a } b {"}}} after'
+        response, tool_results = executor.process_agent_response(text)
+        
+        assert tool_results[0]["tool_call"]["parameters"]["text"] == "a } b {"
+        assert response.startswith("Before  after")
+    
     def test_tool_execution(self):
         """Test tool execution via executor."""
         tools_config = [{"name": "echo", "parameters": {}}]
@@ -360,6 +623,73 @@ class TestToolExecutor:
         assert tool_results[0]["tool_call"]["name"] == "echo"
         assert tool_results[0]["result"]["success"] is True
         assert "[Tool Result: Hello!]" in final_response
+    
+    def test_agent_response_processing_async(self):
+        """Test that async processing runs every tool call and keeps result order."""
+        import asyncio
+        
+        tools_config = [
+            {"name": "echo", "parameters": {}},
+            {"name": "calculator", "parameters": {}}
+        ]
+        executor = ToolExecutor(tools_config)
+        
+        response = (
+            'First {"tool_call": {"name": "echo", "parameters": {"text": "one"}}} '
+            'then {"tool_call": {"name": "calculator", "parameters": {"expression": "2 + 3"}}}'
+        )
+        
+        final_response, tool_results = asyncio.run(
+            executor.process_agent_response_async(response)
+        )
+        sync_response, _ = executor.process_agent_response(response)
+        
+        assert [r["tool_call"]["name"] for r in tool_results] == ["echo", "calculator"]
+        assert tool_results[1]["result"]["result"] == 5
+        assert final_response == sync_response
+        assert final_response.endswith("[Tool Result: one]\n[Tool Result: 5]")
+    
+    def test_stream_processing_stops_at_tool_call(self):
+        """Test that streamed responses are closed once a tool call completes."""
+        tools_config = [{"name": "echo", "parameters": {}}]
+        executor = ToolExecutor(tools_config)
+        consumed = []
+        
+        def chunks():
+            for chunk in ['Let me check. {"tool_call": {"name": "echo", ',
+                          '"parameters": {"text": "hi"}}}', ' Trailing text', ' never read']:
+                consumed.append(chunk)
+                yield chunk
+        
+        response, tool_results = executor.process_stream(chunks())
+        
+        assert len(consumed) == 2
+        assert len(tool_results) == 1
+        assert tool_results[0]["result"]["result"] == "hi"
+        assert response.startswith("Let me check.")
+        assert "[Tool Result: hi]" in response
+    
+    def test_stream_processing_partial_tool_call_is_quiet(self):
+        """Test that a tool call split across chunks is not parsed as malformed."""
+        executor = ToolExecutor([{"name": "echo", "parameters": {}}])
+        chunks = ['Sure {"tool', '_call": {"name": "echo", "parameters": {}', ',',
+                  ' "extra": {}}, "x": {"text": "hi"}', '} done']
+        
+        with patch.object(executor.logger, "warning") as mock_warning:
+            response, tool_results = executor.process_stream(iter(chunks))
+        
+        mock_warning.assert_not_called()
+        assert [r["tool_call"]["name"] for r in tool_results] == ["echo"]
+        assert response.startswith("Sure ")
+    
+    def test_stream_processing_without_tool_call(self):
+        """Test that streamed responses without tool calls are returned whole."""
+        executor = ToolExecutor([{"name": "echo", "parameters": {}}])
+        
+        response, tool_results = executor.process_stream(iter(["Plain ", "answer {not json}"]))
+        
+        assert response == "Plain answer {not json}"
+        assert tool_results == []
 
 
 class TestSchemaExtensions: